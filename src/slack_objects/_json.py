@@ -0,0 +1,27 @@
+"""
+JSON encode/decode used on slack-objects' own hot paths.
+
+Uses orjson when installed (``pip install slack-objects[fast]``), otherwise the stdlib.
+Both ``dumps`` variants return compact UTF-8 bytes and raise TypeError for values that
+are not JSON-serializable.
+"""
+
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised when the optional extra is absent
+    orjson = None
+
+
+if orjson is not None:
+    def dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj)
+
+    loads = orjson.loads
+else:
+    def dumps(obj: Any) -> bytes:
+        return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+    loads = json.loads
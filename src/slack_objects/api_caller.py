@@ -1,45 +1,355 @@
-import time
-from typing import Optional
+import copy
+import inspect
+import random
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from functools import partial
+from typing import Any, Callable, Dict, FrozenSet, Hashable, Iterator, Mapping, Optional, Tuple
 
+from slack_sdk import WebClient
 from slack_sdk.errors import SlackApiError
 
-from .config import SlackObjectsConfig, RateTier
-from .rate_limits import DEFAULT_RATE_POLICY, RateLimitPolicy
+from . import _json
+from .cache import TTLCache
+from .config import SlackObjectsConfig, RateTier, tier_seconds
+from .rate_limits import DEFAULT_RATE_POLICY, RateLimitPolicy, RateLimiter, reset_in
 
+# Number of times a 429 is retried before giving up.
+MAX_RETRIES = 5
 
-class SlackApiCaller:
+# Ceiling for a single backoff sleep, so exponential growth on slow tiers stays bounded.
+MAX_BACKOFF_SECONDS = 120.0
+
+# Seconds to keep successful responses of read-only methods whose data changes rarely.
+# Methods not listed here (including every write) are never cached. These cover direct
+# call() users; the Users helper bypasses this for users.info and keeps its own longer
+# lease (Users.info_ttl) in the shared helper cache instead.
+DEFAULT_CACHE_TTLS: Mapping[str, float] = {
+    "users.info": 300.0,
+    "users.lookupByEmail": 60.0,
+    "team.info": 600.0,
+}
+
+# Extra seconds an expired entry may still be served while it is refreshed in the background
+# (stale-while-revalidate). Only for data where briefly stale reads are harmless.
+DEFAULT_STALE_TTLS: Mapping[str, float] = {
+    "team.info": 3000.0,
+}
+
+# API method names whose typed WebClient method isn't simply method.replace(".", "_").
+TYPED_METHOD_ALIASES: Mapping[str, str] = {
+    "files.uploadV2": "files_upload_v2",
+}
+
+
+def parse_retry_after(value) -> Optional[float]:
+    """
+    Parse a Retry-After header value into seconds.
+
+    Accepts both forms allowed by RFC 7231: delta-seconds ("30") and an HTTP-date.
+    Returns None when the header is missing or unparseable.
+    """
+    if value is None:
+        return None
+    try:
+        return max(0.0, float(value))
+    except (TypeError, ValueError):
+        pass
+    try:
+        when = parsedate_to_datetime(str(value))
+    except (TypeError, ValueError, IndexError):
+        return None
+    if when is None:
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
+
+
+def retry_after_seconds(headers: Optional[Mapping[str, Any]]) -> Optional[float]:
+    """The wait a 429 asked for: Retry-After, else the X-RateLimit-Reset window; None when neither is sent."""
+    headers = headers or {}
+    seconds = parse_retry_after(headers.get("Retry-After"))
+    return reset_in(headers) if seconds is None else seconds
+
+
+def backoff_delay(tier: RateTier, attempt: int, retry_after: Optional[float] = None) -> float:
+    """
+    Seconds to wait before retry number *attempt* (0-based) after a 429.
+
+    Exponential backoff on the tier interval with jitter in [backoff/2, backoff], so callers
+    that were throttled together do not retry together. The server's Retry-After is a floor:
+    we never retry earlier than Slack asked.
+    """
+    backoff = min(MAX_BACKOFF_SECONDS, tier_seconds(tier) * 2 ** attempt)
+    return max(retry_after or 0.0, random.uniform(backoff / 2, backoff))
+
+
+def next_cursor(data: Mapping[str, Any]) -> str:
+    """
+    Return the cursor for the next page, or "" on the last page.
+
+    Most methods nest it under response_metadata; a few admin methods
+    (e.g. admin.conversations.search) return it at the top level.
+    """
+    meta = data.get("response_metadata") or {}
+    return (meta.get("next_cursor") or data.get("next_cursor") or "").strip()
+
+
+class _Flight:
+    """One in-progress cacheable request that concurrent identical callers wait on."""
+    __slots__ = ("done", "encoded", "data", "error")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.encoded: Optional[bytes] = None
+        self.data: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class _TierResolver:
+    """Per-method tier memo shared by SlackApiCaller and AsyncSlackApiCaller (hosts set policy, cfg and _tier_lut)."""
+    __slots__ = ()
+
+    def _resolve_tier(self, method: str) -> RateTier:
+        """Resolve *method*'s tier from the policy once and memoize it."""
+        tier = self.policy.tier_for(method) or self.cfg.default_rate_tier
+        self._tier_lut[method] = tier
+        return tier
+
+
+class SlackApiCaller(_TierResolver):
     """
     Wrapper around Slack SDK client to handle rate limiting and API calls.
 
+    Each method is paced by its own token bucket (see ``RateLimiter``): a call only
+    waits when that method's budget for the resolved tier is spent.
+
+    Successful responses of the read-only methods in ``cache_ttls`` are kept for their TTL;
+    a cache hit skips both the network round trip and the rate limiter. Methods in ``stale_ttls``
+    keep serving an expired entry for that many extra seconds while one background call
+    refreshes it. Concurrent identical cacheable reads share a single request. Pass
+    ``cache=False`` to force a fresh read.
+
     Example: self.api.call(self.client, "users.lookupByEmail", email=email)
     """
-    def __init__(self, cfg: SlackObjectsConfig, policy: RateLimitPolicy = DEFAULT_RATE_POLICY):
+    # One caller is shared by every helper a client creates; slots keep it compact and fixed-shape.
+    __slots__ = (
+        "cfg", "policy", "limiter", "cache_ttls", "stale_ttls",
+        "_cache", "_refreshing", "_refresh_lock", "_in_flight", "_flight_lock", "_tier_lut", "_method_cache",
+    )
+
+    def __init__(
+        self,
+        cfg: SlackObjectsConfig,
+        policy: RateLimitPolicy = DEFAULT_RATE_POLICY,
+        limiter: Optional[RateLimiter] = None,
+        cache_ttls: Mapping[str, float] = DEFAULT_CACHE_TTLS,
+        cache_maxsize: int = 1024,
+        stale_ttls: Mapping[str, float] = DEFAULT_STALE_TTLS,
+    ):
         self.cfg = cfg
         # Respect cfg.default_rate_tier as the policy's fallback tier
         self.policy = policy.with_default(cfg.default_rate_tier)
+        # method -> resolved tier; the method set is small and closed, so this never needs eviction
+        self._tier_lut: Dict[str, RateTier] = {}
+        self.limiter = limiter or RateLimiter()
+        self.cache_ttls = cache_ttls
+        self.stale_ttls = stale_ttls
+        self._cache = TTLCache(maxsize=cache_maxsize)
+        # cache keys with a background refresh in progress, so a stale entry is refreshed once
+        self._refreshing: set = set()
+        self._refresh_lock = threading.Lock()
+        # cache key -> the request currently fetching it (see call())
+        self._in_flight: Dict[Hashable, _Flight] = {}
+        self._flight_lock = threading.Lock()
+        # method -> (typed WebClient function, its required keyword args), or None when there is none
+        self._method_cache: Dict[str, Optional[Tuple[Callable[..., Any], FrozenSet[str]]]] = {}
 
-    def call(self, client, method: str, *, rate_tier: Optional[RateTier] = None, use_json: bool = False, _retry_count: int = 0, **kwargs) -> dict:
-        MAX_RETRIES = 5
-        tier = rate_tier or self.policy.tier_for(method)
+    def _typed_method(self, method: str) -> Optional[Tuple[Callable[..., Any], FrozenSet[str]]]:
+        """Resolve (once per method) the typed WebClient method for an API method name."""
+        try:
+            return self._method_cache[method]
+        except KeyError:
+            pass
+        fn = getattr(WebClient, TYPED_METHOD_ALIASES.get(method) or method.replace(".", "_"), None)
+        typed = None
+        if callable(fn):
+            params = list(inspect.signature(fn).parameters.values())[1:]  # skip self
+            required = frozenset(
+                p.name for p in params
+                if p.default is p.empty and p.kind in (p.KEYWORD_ONLY, p.POSITIONAL_OR_KEYWORD)
+            )
+            typed = (fn, required)
+        self._method_cache[method] = typed
+        return typed
 
+    @staticmethod
+    def _cache_key(method: str, kwargs: dict):
+        """Return a hashable key for (method, kwargs), or None when an argument is unhashable."""
         try:
-            if use_json:
-                resp = client.api_call(method, json=kwargs)
-            else:
-                resp = client.api_call(method, params=kwargs)
+            return (method, frozenset(kwargs.items()))
+        except TypeError:
+            return None
+
+    def invalidate(self, method: str, **kwargs) -> None:
+        """Drop the cached response for exactly this (method, kwargs) call, e.g. after a write."""
+        key = self._cache_key(method, kwargs)
+        if key is not None:
+            self._cache.pop(key)
+
+    def clear_cache(self) -> None:
+        """Drop every cached response."""
+        self._cache.clear()
+
+    def _refresh_in_background(self, key, client, method: str, rate_tier, use_json: bool, kwargs: dict) -> None:
+        """Re-fetch a stale cache entry on a daemon thread; at most one refresh per key at a time."""
+        with self._refresh_lock:
+            if key in self._refreshing:
+                return
+            self._refreshing.add(key)
 
-            data = resp.data if hasattr(resp, "data") else resp
-            time.sleep(float(tier))
+        def refresh() -> None:
+            try:
+                self.call(client, method, rate_tier=rate_tier, use_json=use_json, cache=False, **kwargs)
+            except Exception:
+                pass  # keep serving the stale copy; the entry falls out once its stale window ends
+            finally:
+                with self._refresh_lock:
+                    self._refreshing.discard(key)
+
+        threading.Thread(target=refresh, name=f"slack-objects-refresh-{method}", daemon=True).start()
+
+    def paginate(
+        self,
+        client,
+        method: str,
+        items_key: str,
+        *,
+        rate_tier: Optional[RateTier] = None,
+        use_json: bool = False,
+        **kwargs,
+    ) -> Iterator[Any]:
+        """
+        Yield every item under ``items_key`` across all pages of a cursor-paginated method.
+
+        As soon as page N's cursor is known, page N+1 is requested on a background thread
+        while page N's items are yielded, so the rate-limit wait and network latency of the
+        next page overlap with the caller's processing of the current one. Requests are still
+        strictly sequential (at most one in flight), so pacing is unchanged.
+
+        Example: for member in api.paginate(client, "conversations.members", "members", channel=cid): ...
+        """
+        def fetch(params: dict) -> dict:
+            data = self.call(client, method, rate_tier=rate_tier, use_json=use_json, cache=False, **params)
+            if not data.get("ok", True):
+                raise RuntimeError(f"{method} failed: {data}")
             return data
 
-        except SlackApiError as e:
-            if e.response is not None and e.response.status_code == 429:
-                if _retry_count >= MAX_RETRIES:
-                    raise RuntimeError(f"Rate-limited {MAX_RETRIES} times on {method}; giving up.") from e
+        pool = ThreadPoolExecutor(max_workers=1)
+        try:
+            future = pool.submit(fetch, dict(kwargs))
+            while future is not None:
+                data = future.result()
+                cursor = next_cursor(data)
+                future = pool.submit(fetch, {**kwargs, "cursor": cursor}) if cursor else None
+                yield from data.get(items_key) or []
+        finally:
+            # If the caller stops early, don't wait on (or keep) a prefetch nobody will read.
+            pool.shutdown(wait=False, cancel_futures=True)
+
+    def call(self, client, method: str, *, rate_tier: Optional[RateTier] = None, use_json: bool = False, cache: bool = True, **kwargs) -> dict:
+        # Interned once so the cache, tier and limiter dict probes hit the identity fast path.
+        method = sys.intern(method)
+        ttl = self.cache_ttls.get(method, 0.0)
+        key = self._cache_key(method, kwargs) if ttl > 0 else None
+        if key is not None and cache:
+            cached, fresh = self._cache.get_stale(key)
+            if cached is not None:
+                if not fresh:
+                    self._refresh_in_background(key, client, method, rate_tier, use_json, kwargs)
+                # Entries are stored encoded, so every hit decodes a fresh copy the caller may mutate.
+                return _json.loads(cached)
+
+        if key is None:
+            return self._send(client, method, rate_tier, use_json, kwargs)
+
+        # Single-flight: concurrent identical reads share one request instead of each paying
+        # a round trip and a rate-limit token.
+        with self._flight_lock:
+            flight = self._in_flight.get(key)
+            leader = flight is None
+            if leader:
+                flight = self._in_flight[key] = _Flight()
+
+        if not leader:
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return _json.loads(flight.encoded) if flight.encoded is not None else copy.deepcopy(flight.data)
+
+        try:
+            data = self._send(client, method, rate_tier, use_json, kwargs)
+            if isinstance(data, dict) and data.get("ok"):
                 try:
-                    retry_after = int(e.response.headers.get("Retry-After", tier))
-                except (ValueError, TypeError):
-                    retry_after = int(float(tier))
-                time.sleep(retry_after)
-                return self.call(client, method, rate_tier=tier, use_json=use_json, _retry_count=_retry_count + 1, **kwargs)
+                    flight.encoded = _json.dumps(data)
+                except TypeError:
+                    pass  # not JSON-serializable (e.g. a test double); just don't cache it
+                else:
+                    self._cache.set(key, flight.encoded, ttl, self.stale_ttls.get(method, 0.0))
+            if flight.encoded is None:
+                flight.data = copy.deepcopy(data)
+            return data
+        except BaseException as e:
+            flight.error = e
             raise
+        finally:
+            with self._flight_lock:
+                self._in_flight.pop(key, None)
+            flight.done.set()
+
+    def _send(self, client, method: str, rate_tier: Optional[RateTier], use_json: bool, kwargs: dict) -> dict:
+        """Issue one API call: pace it, dispatch it, and retry 429s with backoff."""
+        tier = rate_tier or self._tier_lut.get(method) or self._resolve_tier(method)
+
+        # Prefer the SDK's typed method on real WebClients: it applies the right HTTP verb,
+        # body encoding and argument normalization (e.g. joining ID lists) for that method.
+        # use_json, fakes, and calls missing a required argument keep the generic api_call path.
+        # Everything a retry needs is resolved once here; the loop only re-sends.
+        typed = None
+        if not use_json and isinstance(client, WebClient):
+            typed = self._typed_method(method)
+            if typed is not None and not typed[1].issubset(kwargs):
+                typed = None
+        if typed is not None:
+            send = partial(typed[0], client, **kwargs)
+        elif use_json:
+            send = partial(client.api_call, method, json=kwargs)
+        else:
+            send = partial(client.api_call, method, params=kwargs)
+        acquire = self.limiter.acquire
+
+        for attempt in range(MAX_RETRIES + 1):
+            # Wait for budget *before* the request; idle callers go straight through.
+            acquire(method, tier)
+
+            try:
+                resp = send()
+
+                # SlackResponse is never a dict, so one type check replaces a getattr probe.
+                if isinstance(resp, dict):
+                    return resp
+                self.limiter.observe(method, tier, getattr(resp, "headers", None))
+                return resp.data
+
+            except SlackApiError as e:
+                if e.response is None or e.response.status_code != 429:
+                    raise
+                if attempt >= MAX_RETRIES:
+                    raise RuntimeError(f"Rate-limited {MAX_RETRIES} times on {method}; giving up.") from e
+                # Charged to the shared bucket: every caller of this method backs off, and
+                # the next acquire() does the waiting.
+                self.limiter.drain(method, tier, backoff_delay(tier, attempt, retry_after_seconds(e.response.headers)))
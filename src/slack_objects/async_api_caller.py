@@ -0,0 +1,65 @@
+"""
+asyncio counterpart of SlackApiCaller.
+
+Use with slack_sdk's AsyncWebClient (requires the optional ``aiohttp`` dependency:
+``pip install slack-objects[async]``). Waiting for rate-limit budget and 429 backoff
+both use ``asyncio.sleep``, so many calls can be in flight from one event loop while
+each method still stays within its tier.
+"""
+
+import sys
+from typing import Dict, Optional
+
+from slack_sdk.errors import SlackApiError
+
+from .api_caller import MAX_RETRIES, _TierResolver, backoff_delay, retry_after_seconds
+from .config import SlackObjectsConfig, RateTier
+from .rate_limits import DEFAULT_RATE_POLICY, RateLimitPolicy, RateLimiter
+
+
+class AsyncSlackApiCaller(_TierResolver):
+    """
+    Async wrapper around AsyncWebClient.api_call with per-method pacing and 429 retries.
+
+    Pass the sync caller's ``limiter`` to share one budget between sync and async code.
+
+    Example: data = await async_api.call(async_client, "users.info", user=user_id)
+    """
+    __slots__ = ("cfg", "policy", "limiter", "_tier_lut")
+
+    def __init__(
+        self,
+        cfg: SlackObjectsConfig,
+        policy: RateLimitPolicy = DEFAULT_RATE_POLICY,
+        limiter: Optional[RateLimiter] = None,
+    ):
+        self.cfg = cfg
+        # Respect cfg.default_rate_tier as the policy's fallback tier
+        self.policy = policy.with_default(cfg.default_rate_tier)
+        self.limiter = limiter or RateLimiter()
+        self._tier_lut: Dict[str, RateTier] = {}
+
+    async def call(self, client, method: str, *, rate_tier: Optional[RateTier] = None, use_json: bool = False, **kwargs) -> dict:
+        # Interned once so the tier and limiter dict probes hit the identity fast path.
+        method = sys.intern(method)
+        tier = rate_tier or self._tier_lut.get(method) or self._resolve_tier(method)
+
+        for attempt in range(MAX_RETRIES + 1):
+            await self.limiter.acquire_async(method, tier)
+
+            try:
+                if use_json:
+                    resp = await client.api_call(method, json=kwargs)
+                else:
+                    resp = await client.api_call(method, params=kwargs)
+                if isinstance(resp, dict):
+                    return resp
+                self.limiter.observe(method, tier, getattr(resp, "headers", None))
+                return resp.data
+
+            except SlackApiError as e:
+                if e.response is None or e.response.status_code != 429:
+                    raise
+                if attempt >= MAX_RETRIES:
+                    raise RuntimeError(f"Rate-limited {MAX_RETRIES} times on {method}; giving up.") from e
+                await self.limiter.drain_async(method, tier, backoff_delay(tier, attempt, retry_after_seconds(e.response.headers)))
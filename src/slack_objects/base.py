@@ -1,15 +1,33 @@
+import asyncio
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
-from typing import Any
+from typing import TYPE_CHECKING, Any, AsyncIterator, Awaitable, Callable, Dict, Iterator, Optional, Tuple, Union
+
 from slack_sdk import WebClient
 
-from .api_caller import SlackApiCaller
+from .api_caller import SlackApiCaller, next_cursor
+from .async_api_caller import AsyncSlackApiCaller
+from .cache import RedisCache, TTLCache
 from .config import SlackObjectsConfig
 from .rate_limits import DEFAULT_RATE_POLICY, RateLimitPolicy
 
+if TYPE_CHECKING:  # requests is imported on first use; most helpers never make a raw HTTP call
+    import requests
+
+
+# Package logger, looked up once rather than on every helper instantiation.
+_DEFAULT_LOGGER = logging.getLogger("slack-objects")
+
+# Connection pool size per host for the HTTP sessions built here; sized for the threaded
+# helpers (prefetch, move_many_to_workspace, get_groups) rather than requests' default of 10.
+HTTP_POOL_MAXSIZE = 32
+
+# Session used by helpers constructed without one (see default_http_session()).
+_default_http_session: Optional["requests.Session"] = None
 
 # Keys that are safe to include in error messages (never contain tokens)
-_SAFE_ERROR_KEYS = frozenset({"ok", "error", "needed", "provided", "response_metadata"})
+_SAFE_ERROR_KEYS = ("ok", "error", "needed", "provided", "response_metadata")
 
 
 def safe_error_context(resp: Any, *, max_len: int = 300) -> str:
@@ -20,13 +38,132 @@ def safe_error_context(resp: Any, *, max_len: int = 300) -> str:
     to prevent massive payloads from flooding logs or error-tracking systems.
     """
     if isinstance(resp, dict):
-        summary = {k: v for k, v in resp.items() if k in _SAFE_ERROR_KEYS}
+        # Probe the few known keys rather than scanning the (possibly huge) response.
+        summary = {k: resp[k] for k in _SAFE_ERROR_KEYS if k in resp}
     else:
         summary = repr(resp)
     text = str(summary)
     return text[:max_len] + ("..." if len(text) > max_len else "")
 
 
+def new_http_session() -> "requests.Session":
+    """
+    Return a requests.Session with a keep-alive pool sized for concurrent helpers.
+
+    No urllib3 status retries are mounted: SCIM 429s are retried by ScimMixin, which
+    also drains the shared rate limiter, and a second retry layer would double the waits.
+    """
+    import requests
+    from requests.adapters import HTTPAdapter
+
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=8, pool_maxsize=HTTP_POOL_MAXSIZE)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def http_timeout(cfg: Any) -> Union[float, Tuple[float, float]]:
+    """
+    Return the requests ``timeout`` for *cfg*: ``(connect, read)`` when a connect timeout is set.
+
+    Pooled connections skip the connect phase entirely, so the short connect cap only bites
+    when a fresh connection cannot be opened.
+    """
+    read = getattr(cfg, "http_timeout_seconds", 30)
+    connect = getattr(cfg, "http_connect_timeout_seconds", None)
+    return read if connect is None else (min(connect, read), read)
+
+
+def default_http_session() -> "requests.Session":
+    """Process-wide session for helpers built without SlackObjectsClient, so they still share one pool."""
+    global _default_http_session
+    if _default_http_session is None:
+        _default_http_session = new_http_session()
+    return _default_http_session
+
+
+class LazyHttpSession:
+    """
+    Stand-in for a requests.Session that is built by *resolve* on the first HTTP call.
+
+    SlackObjectsClient hands one to the helpers it builds, so creating a helper never creates
+    (or imports) a session; re-bound helpers pass it through unrealized.
+    """
+
+    __slots__ = ("_resolve",)
+
+    def __init__(self, resolve: Callable[[], "requests.Session"]):
+        self._resolve = resolve
+
+    def resolve(self) -> "requests.Session":
+        return self._resolve()
+
+
+def resolve_http_session(session: Any) -> "requests.Session":
+    """Return the session to send on: *session* itself, its lazy target, or the process-wide default."""
+    if session is None:
+        return default_http_session()
+    if isinstance(session, LazyHttpSession):
+        return session.resolve()
+    return session
+
+
+def prefetch_pages(
+    fetch: Callable[[Dict[str, Any]], Dict[str, Any]],
+    payload: Dict[str, Any],
+    next_params: Callable[[Dict[str, Any]], Optional[Dict[str, Any]]],
+) -> Iterator[Dict[str, Any]]:
+    """
+    Yield successive response pages, fetching page N+1 in the background while page N is processed.
+
+    *fetch* is an endpoint wrapper taking a payload; *next_params* returns the payload updates for
+    the next page (e.g. ``{"cursor": ...}``), or None on the last page. Each page depends on the
+    previous one's cursor/offset, so at most one request is ever in flight.
+    """
+    pool = ThreadPoolExecutor(max_workers=1)
+    try:
+        future = pool.submit(fetch, dict(payload))
+        while future is not None:
+            resp = future.result()
+            updates = next_params(resp) if resp.get("ok") else None
+            if updates:
+                payload = {**payload, **updates}
+                future = pool.submit(fetch, dict(payload))
+            else:
+                future = None
+            yield resp
+    finally:
+        # If the consumer stops early (or raises), don't wait on a prefetch nobody will read.
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
+async def aprefetch_pages(
+    fetch: Callable[[Dict[str, Any]], Awaitable[Dict[str, Any]]],
+    payload: Dict[str, Any],
+    next_params: Callable[[Dict[str, Any]], Optional[Dict[str, Any]]],
+) -> AsyncIterator[Dict[str, Any]]:
+    """
+    asyncio counterpart of ``prefetch_pages()``: page N+1's request is a task running while
+    the consumer processes page N. *fetch* is an async endpoint wrapper taking a payload.
+    """
+    task: Optional[asyncio.Task] = asyncio.ensure_future(fetch(dict(payload)))
+    try:
+        while task is not None:
+            resp = await task
+            updates = next_params(resp) if resp.get("ok") else None
+            if updates:
+                payload = {**payload, **updates}
+                task = asyncio.ensure_future(fetch(dict(payload)))
+            else:
+                task = None
+            yield resp
+    finally:
+        # If the consumer stops early (or raises), drop the prefetch nobody will read.
+        if task is not None:
+            task.cancel()
+
+
 @dataclass
 class SlackObjectBase:
     """
@@ -38,17 +175,70 @@ class SlackObjectBase:
     cfg: SlackObjectsConfig
     client: WebClient
     api: SlackApiCaller
-    logger: logging.Logger = field(default_factory=lambda: logging.getLogger("slack-objects"))  # logger is guaranteed to exist via default_factory
+    logger: logging.Logger = _DEFAULT_LOGGER  # shared package logger; loggers are process-wide singletons
     rate_policy: RateLimitPolicy = field(default=None)
+    # In-process cache for helper-level lookups; SlackObjectsClient and the with_* factories share one instance.
+    cache: Union[TTLCache, RedisCache] = field(default_factory=TTLCache, repr=False)
+    # asyncio counterparts of api/client, used only by the a*-prefixed methods of helpers that have them.
+    async_api: Optional[AsyncSlackApiCaller] = field(default=None, repr=False)
+    async_client: Any = field(default=None, repr=False)
 
     def __post_init__(self) -> None:
-        # Required dependencies check
-        if self.cfg is None:
-            raise ValueError("cfg is required")
-        if self.client is None:
-            raise ValueError("client is required")
-        if self.api is None:
-            raise ValueError("api is required")
+        # cfg/client/api are validated once by SlackObjectsClient rather than on every helper built.
         # Default rate_policy respects cfg.default_rate_tier as the fallback
         if self.rate_policy is None:
             self.rate_policy = DEFAULT_RATE_POLICY.with_default(self.cfg.default_rate_tier)
+
+    # Largest page Slack's cursor-paginated list methods return; bigger limits span pages.
+    MAX_PAGE_SIZE = 1000
+
+    def _async_api(self) -> AsyncSlackApiCaller:
+        """Return async_api, failing clearly when this helper was built without async support."""
+        if self.async_api is None or self.async_client is None:
+            raise ValueError(
+                "async methods require async_api and async_client "
+                "(use SlackObjectsClient with aiohttp installed: pip install slack-objects[async])"
+            )
+        return self.async_api
+
+    def _paginate(
+        self,
+        fetch: Callable[[Dict[str, Any]], Dict[str, Any]],
+        payload: Dict[str, Any],
+        *,
+        items_key: str,
+        method: str,
+        limit: Optional[int] = None,
+        stop: Optional[Callable[[Any], bool]] = None,
+    ) -> Iterator[Any]:
+        """
+        Yield ``resp[items_key]`` items across cursor pages; each page is requested only once
+        the previous one is consumed. Raises RuntimeError naming *method* on a non-ok page.
+
+        *fetch* is an endpoint wrapper taking the payload, which is copied once and then only
+        gains a ``cursor``. With *limit*, later pages ask for just the items still needed and
+        no page is requested once *limit* items were seen (callers still slice). Iteration
+        ends at the first item for which *stop* returns True; that item is not yielded.
+        """
+        payload = dict(payload)
+        seen = 0
+        while True:
+            resp = fetch(payload)
+            if not resp.get("ok"):
+                raise RuntimeError(f"{method} failed: {resp}")
+
+            items = resp.get(items_key) or []
+            for item in items:
+                if stop is not None and stop(item):
+                    return
+                yield item
+            seen += len(items)
+
+            cursor = next_cursor(resp)
+            if not cursor:
+                return
+            payload["cursor"] = cursor
+            if limit is not None:
+                if seen >= limit:
+                    return
+                payload["limit"] = min(limit - seen, self.MAX_PAGE_SIZE)
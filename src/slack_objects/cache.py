@@ -0,0 +1,155 @@
+"""
+In-process caching primitives shared by the API layer and the object helpers.
+
+Centralizes:
+- TTL expiry (monotonic clock, so wall-clock changes don't matter)
+- An optional stale window for stale-while-revalidate readers
+- LRU eviction once ``maxsize`` entries are held
+- Thread safety (a single lock per cache)
+
+``RedisCache`` offers the same interface backed by Redis, so separate processes (cron runs,
+parallel workers) can share helper-level lookups. It needs the optional ``redis`` dependency
+(``pip install slack-objects[redis]``).
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Hashable, Optional, Tuple, Union
+
+
+class TTLCache:
+    """
+    Thread-safe LRU cache whose entries expire after a time-to-live.
+
+    ``ttl`` is the default lifetime in seconds; ``set()`` can override it per entry, so one
+    cache can hold values with different freshness needs. Expired entries are dropped lazily
+    on access, and the least recently used entry is evicted once ``maxsize`` is exceeded.
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl: float = 300.0):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        # key -> (expires_at, stale_until, value), on the monotonic clock
+        self._data: "OrderedDict[Hashable, Tuple[float, float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return the cached value for *key*, or *default* when missing or expired."""
+        value, fresh = self.get_stale(key, default)
+        return value if fresh else default
+
+    def get_stale(self, key: Hashable, default: Any = None) -> Tuple[Any, bool]:
+        """
+        Return ``(value, fresh)`` for *key*.
+
+        An entry past its ttl but still inside its ``stale_ttl`` window is returned with
+        ``fresh=False`` (stale-while-revalidate); once that window passes it is dropped and
+        ``(default, False)`` is returned.
+        """
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return default, False
+            expires_at, stale_until, value = entry
+            now = time.monotonic()
+            if stale_until <= now:
+                del self._data[key]
+                return default, False
+            self._data.move_to_end(key)
+            return value, expires_at > now
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None, stale_ttl: float = 0.0) -> None:
+        """
+        Store *value* under *key* for *ttl* seconds (defaults to the cache's ttl).
+
+        *stale_ttl* keeps the entry available to ``get_stale()`` for that many extra seconds.
+        """
+        lifetime = self.ttl if ttl is None else ttl
+        with self._lock:
+            expires_at = time.monotonic() + lifetime
+            self._data[key] = (expires_at, expires_at + stale_ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def pop(self, key: Hashable, default: Any = None) -> Any:
+        """Remove *key* and return its value (expired or not), or *default* when missing."""
+        with self._lock:
+            entry = self._data.pop(key, None)
+        return default if entry is None else entry[2]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+class RedisCache:
+    """
+    Redis-backed drop-in for ``TTLCache`` as the helpers' shared ``cache``.
+
+    Values must already be ``bytes`` or ``str`` (the helpers store JSON-encoded payloads), so
+    nothing is ever unpickled from the shared server. Tuple keys become ``prefix`` plus their
+    parts joined with ``:``. Expiry is Redis' own (``PX``); there is no stale window, so
+    ``get_stale()`` only ever reports fresh hits, and eviction follows the server's policy.
+    """
+
+    def __init__(self, client: Any, ttl: float = 300.0, prefix: str = "slack-objects:"):
+        self.client = client
+        self.ttl = ttl
+        self.prefix = prefix
+
+    @classmethod
+    def from_url(cls, url: str, **kwargs: Any) -> "RedisCache":
+        """Connect with ``redis.Redis.from_url(url)``; *kwargs* go to ``RedisCache()``."""
+        try:
+            import redis
+        except ImportError as e:
+            raise ImportError("a redis_url requires the redis package: pip install slack-objects[redis]") from e
+        return cls(redis.Redis.from_url(url), **kwargs)
+
+    def _key(self, key: Hashable) -> str:
+        if isinstance(key, tuple):
+            return self.prefix + ":".join("" if part is None else str(part) for part in key)
+        return self.prefix + str(key)
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return the cached value for *key*, or *default* when missing or expired."""
+        value = self.client.get(self._key(key))
+        return default if value is None else value
+
+    def get_stale(self, key: Hashable, default: Any = None) -> Tuple[Any, bool]:
+        """Return ``(value, fresh)`` like ``TTLCache.get_stale()``; Redis keeps no stale entries."""
+        value = self.client.get(self._key(key))
+        return (default, False) if value is None else (value, True)
+
+    def set(self, key: Hashable, value: Union[bytes, str], ttl: Optional[float] = None, stale_ttl: float = 0.0) -> None:
+        """Store *value* under *key* for *ttl* seconds (defaults to the cache's ttl); *stale_ttl* is ignored."""
+        if not isinstance(value, (bytes, str)):
+            raise TypeError(f"RedisCache stores bytes or str, not {type(value).__name__}; JSON-encode the value first")
+        lifetime = self.ttl if ttl is None else ttl
+        self.client.set(self._key(key), value, px=max(1, int(lifetime * 1000)))
+
+    def pop(self, key: Hashable, default: Any = None) -> Any:
+        """Remove *key* and return its value, or *default* when missing."""
+        name = self._key(key)
+        value = self.client.get(name)
+        if value is None:
+            return default
+        self.client.delete(name)
+        return value
+
+    def clear(self) -> None:
+        """Delete every key under this cache's prefix (other data on the server is untouched)."""
+        names = list(self.client.scan_iter(match=self.prefix + "*"))
+        if names:
+            self.client.delete(*names)
+
+    def __len__(self) -> int:
+        # A SCAN over the prefix: fine for diagnostics and tests, not for hot paths.
+        return sum(1 for _ in self.client.scan_iter(match=self.prefix + "*"))
@@ -1,49 +1,120 @@
 from slack_sdk import WebClient
 import logging
+import ssl
 from typing import Optional
 
 from .config import SlackObjectsConfig
 from .api_caller import SlackApiCaller
+from .base import _DEFAULT_LOGGER, LazyHttpSession, new_http_session
+from .cache import RedisCache, TTLCache
+from .async_api_caller import AsyncSlackApiCaller
+
+try:
+    from slack_sdk.web.async_client import AsyncWebClient
+except ImportError:  # optional: pip install slack-objects[async]
+    AsyncWebClient = None
 from .users import Users
 from .messages import Messages
 from .conversations import Conversations
 from .files import Files
 from .workspaces import Workspaces
 from .idp_groups import IDP_groups
+from .usergroups import Usergroups
 
 
 class SlackObjectsClient:
     """
     Central factory / context object.
-    Owns config, Slack client, and rate-limited API caller.
+    Owns config, Slack client, rate-limited API caller, and the shared HTTP session.
+
+    Connection reuse:
+    - The WebClient gets one SSL context, so CA certificates are loaded once rather than
+      on every HTTPS connection.
+    - SCIM requests and file downloads from every helper go through one `requests.Session`,
+      whose keep-alive connection pool (sized for the threaded helpers) saves a TCP+TLS
+      handshake per request. The session is built on the first such request, not when a
+      helper is created.
+    - Set ``ascim_session`` to an ``aiohttp.ClientSession`` (created inside your event loop) and
+      every ``idp_groups()`` helper's async SCIM calls share its connections; otherwise each
+      call opens a short-lived session.
     """
 
     def __init__(self, cfg: SlackObjectsConfig, logger: Optional[logging.Logger] = None):
+        # Dependencies are validated once here; helpers built by the factories below trust them.
+        if cfg is None:
+            raise ValueError("cfg is required")
         self.cfg = cfg
-        self.logger = logger or logging.getLogger("slack-objects")
+        self.logger = logger or _DEFAULT_LOGGER
 
         # Prefer bot token for general Web API calls; fall back to user token.
         web_token = cfg.bot_token or cfg.user_token
         if not web_token:
             raise ValueError("SlackObjectsClient requires cfg.bot_token or cfg.user_token.")
 
-        self.web_client = WebClient(token=web_token)
+        self.ssl_context = ssl.create_default_context()
+        self.web_client = WebClient(token=web_token, ssl=self.ssl_context)
         self.api = SlackApiCaller(cfg)
+        # Resolved once and handed to every helper, so their construction is plain field assignment.
+        self.rate_policy = self.api.policy
+        # Shares the sync caller's limiter, so mixed sync/async use stays within one budget.
+        self.async_api = AsyncSlackApiCaller(cfg, limiter=self.api.limiter)
+        self._http_session = None
+        # What the factories hand out: the session is only built when a helper first sends a request.
+        self._lazy_http_session = LazyHttpSession(lambda: self.http_session)
+        # Helper-level lookup cache (e.g. resolved conversations.info), shared by every helper built here;
+        # with cfg.redis_url it is shared across processes too.
+        redis_url = getattr(cfg, "redis_url", None)
+        self.cache = RedisCache.from_url(redis_url) if redis_url else TTLCache()
+        self._web_token = web_token
+        self._async_web_client = None
+        # aiohttp sessions belong to the loop they were created in, so the caller supplies it.
+        self.ascim_session = None
+
+    @property
+    def http_session(self):
+        """Pooled requests.Session shared by the SCIM and file-download helpers, created on first access."""
+        if self._http_session is None:
+            self._http_session = new_http_session()
+        return self._http_session
+
+    @http_session.setter
+    def http_session(self, session) -> None:
+        self._http_session = session
+
+    @property
+    def async_web_client(self):
+        """
+        AsyncWebClient for use with ``async_api``, created on first access.
+
+        Requires the optional aiohttp dependency (``pip install slack-objects[async]``).
+        """
+        if self._async_web_client is None:
+            if AsyncWebClient is None:
+                raise ImportError("async support requires aiohttp: pip install slack-objects[async]")
+            self._async_web_client = AsyncWebClient(token=self._web_token, ssl=self.ssl_context)
+        return self._async_web_client
 
     def users(self, user_id: Optional[str] = None) -> Users:
-        return Users(cfg=self.cfg, client=self.web_client, api=self.api, logger=self.logger, user_id=user_id)
+        return Users(cfg=self.cfg, client=self.web_client, api=self.api, logger=self.logger, rate_policy=self.rate_policy, cache=self.cache, user_id=user_id, scim_session=self._lazy_http_session)
 
     def conversations(self, channel_id: Optional[str] = None) -> Conversations:
-        return Conversations(cfg=self.cfg, client=self.web_client, api=self.api, logger=self.logger, channel_id=channel_id)
+        # The async client is only wired in when aiohttp is available; it opens no connection until used.
+        async_client = self.async_web_client if AsyncWebClient is not None else None
+        return Conversations(cfg=self.cfg, client=self.web_client, api=self.api, logger=self.logger, rate_policy=self.rate_policy, cache=self.cache, async_api=self.async_api, async_client=async_client, channel_id=channel_id)
 
     def files(self, file_id: Optional[str] = None) -> Files:
-        return Files(cfg=self.cfg, client=self.web_client, api=self.api, logger=self.logger, file_id=file_id)
+        return Files(cfg=self.cfg, client=self.web_client, api=self.api, logger=self.logger, rate_policy=self.rate_policy, cache=self.cache, file_id=file_id, http_session=self._lazy_http_session)
 
     def messages(self, channel_id: Optional[str] = None, ts: Optional[str] = None) -> Messages:
-        return Messages(cfg=self.cfg, client=self.web_client, api=self.api, logger=self.logger, channel_id=channel_id, ts=ts)
+        async_client = self.async_web_client if AsyncWebClient is not None else None
+        return Messages(cfg=self.cfg, client=self.web_client, api=self.api, logger=self.logger, rate_policy=self.rate_policy, cache=self.cache, async_api=self.async_api, async_client=async_client, channel_id=channel_id, ts=ts)
 
     def workspaces(self, workspace_id: Optional[str] = None) -> Workspaces:
-        return Workspaces(cfg=self.cfg, client=self.web_client, api=self.api, logger=self.logger, workspace_id=workspace_id)
+        return Workspaces(cfg=self.cfg, client=self.web_client, api=self.api, logger=self.logger, rate_policy=self.rate_policy, cache=self.cache, workspace_id=workspace_id)
 
     def idp_groups(self, group_id: Optional[str] = None) -> IDP_groups:
-        return IDP_groups(cfg=self.cfg, client=self.web_client, api=self.api, logger=self.logger, group_id=group_id)
+        return IDP_groups(cfg=self.cfg, client=self.web_client, api=self.api, logger=self.logger, rate_policy=self.rate_policy, cache=self.cache, group_id=group_id, scim_session=self._lazy_http_session, ascim_session=self.ascim_session)
+
+    def usergroups(self, usergroup_id: Optional[str] = None) -> Usergroups:
+        async_client = self.async_web_client if AsyncWebClient is not None else None
+        return Usergroups(cfg=self.cfg, client=self.web_client, api=self.api, logger=self.logger, rate_policy=self.rate_policy, cache=self.cache, async_api=self.async_api, async_client=async_client, usergroup_id=usergroup_id)
@@ -14,6 +14,30 @@ CONVERSATION_ID_RE = re.compile(r"^[CGD][A-Z0-9]+$")
 # "+" precedes "\-" in the character class so it is not read as a range.
 EMAIL_RE = re.compile(r"^[\w.+\-]+@[\w.\-]+\.\w+$")
 
+# Slack token shape: xoxb-/xoxp-/xoxa-/xoxe-/xoxs- (plus rotating "xoxe.xoxp-") followed by
+# non-whitespace. Deliberately lenient about the body; it only catches pasted garbage early.
+_TOKEN_RE = re.compile(r"^xox(?:e\.xox)?[abeps]-\S+$")
+
+# Bound .match methods, so bulk validation skips the attribute lookup on every call.
+_user_id_match = USER_ID_RE.match
+_conversation_id_match = CONVERSATION_ID_RE.match
+_email_match = EMAIL_RE.match
+
+
+def is_user_id(value: str) -> bool:
+	"""Return True if *value* looks like a Slack user/bot ID (U… or W…)."""
+	return _user_id_match(value) is not None
+
+
+def is_conversation_id(value: str) -> bool:
+	"""Return True if *value* looks like a Slack conversation ID (C…, G…, or D…)."""
+	return _conversation_id_match(value) is not None
+
+
+def is_email(value: str) -> bool:
+	"""Return True if *value* looks like an email address."""
+	return _email_match(value) is not None
+
 
 class RateTier(float, Enum):
 	"""
@@ -28,6 +52,16 @@ class RateTier(float, Enum):
 	TIER_D = 0.05	# 1200+ per minute
 
 
+# Seconds per tier as plain floats, so hot paths skip the Enum -> float coercion.
+RATE_TIER_SECONDS: dict[RateTier, float] = {t: float(t) for t in RateTier}
+
+
+def tier_seconds(tier: float) -> float:
+	"""Return *tier*'s interval in seconds; plain floats (e.g. a 0.0 test policy) pass through."""
+	seconds = RATE_TIER_SECONDS.get(tier)
+	return float(tier) if seconds is None else seconds
+
+
 @dataclass(frozen=True)
 class SlackObjectsConfig:
 	"""
@@ -54,6 +88,19 @@ class SlackObjectsConfig:
 
 	# HTTP timeout for SCIM and file-download requests (seconds)
 	http_timeout_seconds: int = 30
+	# Cap on opening a new connection (None disables), so an unreachable host fails fast
+	http_connect_timeout_seconds: Optional[float] = 3.05
+
+	# Optional Redis URL; when set, SlackObjectsClient shares its helper cache through Redis
+	# (may embed a password, so it is masked like the tokens)
+	redis_url: Optional[str] = field(default=None, repr=False)
+
+	def __post_init__(self) -> None:
+		""" Fail fast on malformed tokens instead of at the first (rate-limited) API call. """
+		for name in ("bot_token", "user_token", "scim_token"):
+			value = getattr(self, name)
+			if value and not _TOKEN_RE.match(value):
+				raise ValueError(f"{name} does not look like a Slack token (expected an xoxb, xoxp, xoxa, xoxe or xoxs token)")
 
 	def __repr__(self) -> str:
 		""" Modifying the default dataclass __repr__ to mask token values for security. """
@@ -70,5 +117,7 @@ class SlackObjectsConfig:
 			f"auth_idp_groups_write_access={self.auth_idp_groups_write_access}, "
 			f"scim_base_url={self.scim_base_url}, "
 			f"scim_version={self.scim_version}, "
-			f"http_timeout_seconds={self.http_timeout_seconds})"
+			f"http_timeout_seconds={self.http_timeout_seconds}, "
+			f"http_connect_timeout_seconds={self.http_connect_timeout_seconds}, "
+			f"redis_url={_mask(self.redis_url)})"
 		)
\ No newline at end of file
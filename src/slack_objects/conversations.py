@@ -15,6 +15,7 @@ and (in Grid) enterprise conversations), including:
 - Restricting access via IdP group allowlists (`admin.conversations.restrictAccess.addGroup`)
 - Reading history (`conversations.history`)
 - Listing members via Discovery (`discovery.conversations.members`)
+- asyncio variants of the paginated lookups (`aget_members`, `aget_conversation_ids_from_name`)
 
 Design goals:
 - Factory-friendly:
@@ -29,12 +30,38 @@ Design goals:
     This class will attempt user token (if provided) and fallback to bot token.
 """
 
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+
+from slack_sdk.errors import SlackApiError
+
+from . import _json
+from .base import SlackObjectBase, aprefetch_pages, prefetch_pages, safe_error_context
+from .config import RateTier, is_conversation_id
+
+if TYPE_CHECKING:  # imported lazily in messages(), which also keeps Messages free to import Conversations
+    from .messages import Messages
+
+# conversations.info errors for which a retry with the bot token can succeed: the user token
+# can't see/read the channel, or the user token itself is unusable.
+_BOT_RETRY_ERRORS = frozenset({
+    "channel_not_found",
+    "not_in_channel",
+    "missing_scope",
+    "not_authed",
+    "invalid_auth",
+    "token_revoked",
+    "token_expired",
+    "account_inactive",
+})
+
+# admin.conversations.archive errors that mean the desired end state already holds.
+_ARCHIVE_DONE_ERRORS = frozenset({"already_archived"})
+
+# Server-side errors worth retrying later; archive() raises on these rather than returning False.
+_TRANSIENT_ERRORS = frozenset({"ratelimited", "fatal_error", "internal_error", "service_unavailable", "request_timeout"})
 
-from .base import SlackObjectBase, safe_error_context
-from .config import RateTier, CONVERSATION_ID_RE
-from .messages import Messages
 
 @dataclass
 class Conversations(SlackObjectBase):
@@ -48,16 +75,32 @@ class Conversations(SlackObjectBase):
 
     Notes:
     - channel_id is optional. Methods that need it require a passed channel_id or a bound instance.
-    - attributes cache is populated via refresh().
+    - attributes cache is populated via refresh(); it stays None until then, so the many
+      throwaway helpers built by with_conversation()/messages() don't each allocate a dict.
+    - Successful conversations.info lookups are kept in the shared `cache` for `info_ttl` seconds,
+      so repeated refresh()/get_conversation_name() calls skip the (possibly doubled) round trip.
+      Writes that change a conversation (archive, setTeams) drop its entry.
+    - get_conversation_ids_from_name() results, including "no such channel", are cached for
+      `name_ttl` seconds per (name, workspace_id); the same writes drop them when the name is known.
+    - The a*-prefixed coroutines need `async_api` and `async_client` (an AsyncWebClient);
+      SlackObjectsClient.conversations() supplies both when aiohttp is installed.
     """
     channel_id: Optional[str] = None
-    attributes: Dict[str, Any] = field(default_factory=dict)
+    attributes: Optional[Dict[str, Any]] = None
+
+    # Lease for cached conversations.info results; channel metadata changes rarely.
+    info_ttl: float = 300.0
+    # Lease for name -> IDs lookups (positive and negative); channels are rarely created or renamed.
+    name_ttl: float = 120.0
+
+    # Last Messages helper used by get_messages()/get_message_threads(), reused while the channel matches.
+    _messages_helper: Optional[Messages] = field(default=None, init=False, repr=False, compare=False)
 
     # ---------- factory helpers ----------
 
     def with_conversation(self, channel_id: str) -> "Conversations":
         """Return a new Conversations instance bound to channel_id, sharing cfg/client/logger/api."""
-        return Conversations(cfg=self.cfg, client=self.client, logger=self.logger, api=self.api, channel_id=channel_id)
+        return Conversations(cfg=self.cfg, client=self.client, logger=self.logger, api=self.api, rate_policy=self.rate_policy, cache=self.cache, async_api=self.async_api, async_client=self.async_client, channel_id=channel_id)
 
     # ---------- attribute lifecycle ----------
 
@@ -80,7 +123,7 @@ class Conversations(SlackObjectBase):
         return self.attributes
 
     def _require_attributes(self) -> Dict[str, Any]:
-        """Ensure attributes are loaded before helpers rely on them."""
+        """Ensure attributes are loaded before helpers rely on them (None means not loaded yet)."""
         if self.attributes:
             return self.attributes
         if self.channel_id:
@@ -99,28 +142,56 @@ class Conversations(SlackObjectBase):
         If a user token exists in cfg, we try it first because bot tokens often cannot see
         private channels the bot is not a member of. This mirrors your PCbot behavior/fallback. :contentReference[oaicite:3]{index=3}
         """
-        kwargs: Dict[str, Any] = {"channel": channel_id}
-
         # Token override handling:
         # - If explicit token provided: use it
         # - Else if cfg.user_token exists: try user token first, fallback to default client token
         if token:
-            kwargs["token"] = token
-            return self.api.call(self.client, "conversations.info", rate_tier=RateTier.TIER_3, **kwargs)
+            return self.api.call(self.client, "conversations.info", rate_tier=RateTier.TIER_3, channel=channel_id, token=token)
+
+        # The resolved answer (after any fallback) is cached, so a hit costs neither attempt.
+        cache_key = ("conversations.info", channel_id)
+        cached = self.cache.get(cache_key)
+        if cached is not None:
+            return _json.loads(cached)
 
         if getattr(self.cfg, "user_token", None):
             # First attempt with user_token
-            kwargs_user = dict(kwargs)
-            kwargs_user["token"] = self.cfg.user_token
-            resp = self.api.call(self.client, "conversations.info", rate_tier=RateTier.TIER_3, **kwargs_user)
-            if resp.get("ok"):
-                return resp
+            try:
+                resp = self.api.call(
+                    self.client, "conversations.info", rate_tier=RateTier.TIER_3, channel=channel_id, token=self.cfg.user_token
+                )
+            except SlackApiError as e:
+                # WebClient raises on ok=false; treat it like the returned-error case below.
+                resp = getattr(e.response, "data", None) or {"ok": False}
+                if resp.get("error") not in _BOT_RETRY_ERRORS:
+                    raise
+            # Fallback: bot token / default client token, but only when the bot could see more
+            # than the user (errors like invalid_arguments would fail the same way twice).
+            if not resp.get("ok") and resp.get("error") in _BOT_RETRY_ERRORS:
+                resp = self.api.call(self.client, "conversations.info", rate_tier=RateTier.TIER_3, channel=channel_id)
+        else:
+            # Default
+            resp = self.api.call(self.client, "conversations.info", rate_tier=RateTier.TIER_3, channel=channel_id)
+
+        if resp.get("ok"):
+            self.cache.set(cache_key, _json.dumps(resp), self.info_ttl)
+        return resp
 
-            # Fallback: bot token / default client token
-            return self.api.call(self.client, "conversations.info", rate_tier=RateTier.TIER_3, **kwargs)
+    def _invalidate_info(self, channel_id: str, *workspace_ids: str) -> None:
+        """
+        Drop cached lookups for channel_id (call after writes that change it).
 
-        # Default
-        return self.api.call(self.client, "conversations.info", rate_tier=RateTier.TIER_3, **kwargs)
+        Besides the conversations.info entry, name searches for the channel's name are dropped,
+        unscoped and for each of *workspace_ids*, when the name is known from that entry or from
+        this instance's attributes; otherwise they simply age out after `name_ttl`.
+        """
+        cached = self.cache.pop(("conversations.info", channel_id))
+        name = (_json.loads(cached).get("channel") or {}).get("name") if cached is not None else None
+        if not name and self.attributes and self.attributes.get("id") == channel_id:
+            name = self.attributes.get("name")
+        if name:
+            for ws in (None, *workspace_ids):
+                self.cache.pop(("admin.conversations.search", name, ws or None))
 
     def _conversations_history(self, payload: Dict[str, Any]) -> Dict[str, Any]:
         """Wrapper for conversations.history."""
@@ -130,9 +201,30 @@ class Conversations(SlackObjectBase):
         """Wrapper for conversations.replies. Used to fetch thread replies for a parent message."""
         return self.api.call(self.client, "conversations.replies", rate_tier=RateTier.TIER_3, **payload)
 
-    def _admin_conversations_search(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+    def _admin_conversations_search(
+        self, query: str, *, limit: int = 20, team_ids: Optional[str] = None, cursor: Optional[str] = None
+    ) -> Dict[str, Any]:
         """Wrapper for admin.conversations.search (max limit appears to be 20 in legacy). :contentReference[oaicite:4]{index=4}"""
-        return self.api.call(self.client, "admin.conversations.search", rate_tier=RateTier.TIER_2, **payload)
+        kwargs = self._search_kwargs(query, limit, team_ids, cursor)
+        return self.api.call(self.client, "admin.conversations.search", rate_tier=RateTier.TIER_2, **kwargs)
+
+    async def _aadmin_conversations_search(
+        self, query: str, *, limit: int = 20, team_ids: Optional[str] = None, cursor: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Async wrapper for admin.conversations.search."""
+        kwargs = self._search_kwargs(query, limit, team_ids, cursor)
+        return await self._async_api().call(
+            self.async_client, "admin.conversations.search", rate_tier=RateTier.TIER_2, **kwargs
+        )
+
+    @staticmethod
+    def _search_kwargs(query: str, limit: int, team_ids: Optional[str], cursor: Optional[str]) -> Dict[str, Any]:
+        kwargs: Dict[str, Any] = {"query": query, "limit": limit}
+        if team_ids:
+            kwargs["team_ids"] = team_ids
+        if cursor:
+            kwargs["cursor"] = cursor
+        return kwargs
 
     def _admin_conversations_archive(self, channel_id: str) -> Dict[str, Any]:
         """Wrapper for admin.conversations.archive."""
@@ -140,9 +232,14 @@ class Conversations(SlackObjectBase):
             self.client, "admin.conversations.archive", rate_tier=RateTier.TIER_2, channel_id=channel_id
         )
 
-    def _admin_conversations_set_teams(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+    def _admin_conversations_set_teams(
+        self, channel_id: str, target_team_ids: str, *, team_id: Optional[str] = None
+    ) -> Dict[str, Any]:
         """Wrapper for admin.conversations.setTeams (share/move). :contentReference[oaicite:5]{index=5}"""
-        return self.api.call(self.client, "admin.conversations.setTeams", rate_tier=RateTier.TIER_2, **payload)
+        kwargs: Dict[str, Any] = {"channel_id": channel_id, "target_team_ids": target_team_ids}
+        if team_id:
+            kwargs["team_id"] = team_id
+        return self.api.call(self.client, "admin.conversations.setTeams", rate_tier=RateTier.TIER_2, **kwargs)
 
     def _admin_conversations_restrict_access_add_group(self, payload: Dict[str, Any]) -> Dict[str, Any]:
         """Wrapper for admin.conversations.restrictAccess.addGroup. :contentReference[oaicite:6]{index=6}"""
@@ -153,9 +250,50 @@ class Conversations(SlackObjectBase):
             **payload,
         )
 
-    def _discovery_conversations_members(self, payload: Dict[str, Any]) -> Dict[str, Any]:
-        """Wrapper for discovery.conversations.members. :contentReference[oaicite:7]{index=7}"""
-        return self.api.call(self.client, "discovery.conversations.members", rate_tier=RateTier.TIER_3, **payload)
+    def _discovery_conversations_members(
+        self,
+        channel: str,
+        *,
+        limit: int = 1000,
+        team: Optional[str] = None,
+        include_member_left: bool = False,
+        offset: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """
+        Wrapper for discovery.conversations.members. :contentReference[oaicite:7]{index=7}
+
+        Optional arguments are only sent when set, so the request carries no empty fields.
+        """
+        kwargs = self._members_kwargs(channel, limit, team, include_member_left, offset)
+        return self.api.call(self.client, "discovery.conversations.members", rate_tier=RateTier.TIER_3, **kwargs)
+
+    async def _adiscovery_conversations_members(
+        self,
+        channel: str,
+        *,
+        limit: int = 1000,
+        team: Optional[str] = None,
+        include_member_left: bool = False,
+        offset: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """Async wrapper for discovery.conversations.members."""
+        kwargs = self._members_kwargs(channel, limit, team, include_member_left, offset)
+        return await self._async_api().call(
+            self.async_client, "discovery.conversations.members", rate_tier=RateTier.TIER_3, **kwargs
+        )
+
+    @staticmethod
+    def _members_kwargs(
+        channel: str, limit: int, team: Optional[str], include_member_left: bool, offset: Optional[str]
+    ) -> Dict[str, Any]:
+        kwargs: Dict[str, Any] = {"channel": channel, "limit": limit}
+        if team:
+            kwargs["team"] = team
+        if include_member_left:
+            kwargs["include_member_left"] = True
+        if offset:
+            kwargs["offset"] = offset
+        return kwargs
 
     # ============================================================
     # Public methods (call wrappers above)
@@ -172,18 +310,60 @@ class Conversations(SlackObjectBase):
         cid = channel_id or self.channel_id
         if not cid:
             raise ValueError("messages() requires channel_id (passed or bound).")
-        return Messages(cfg=self.cfg, client=self.client, logger=self.logger, api=self.api, channel_id=cid)
+        from .messages import Messages
+
+        return Messages(cfg=self.cfg, client=self.client, logger=self.logger, api=self.api, rate_policy=self.rate_policy, cache=self.cache, async_api=self.async_api, async_client=self.async_client, channel_id=cid)
+
+    def _channel_messages(self, channel_id: Optional[str]) -> Messages:
+        """
+        Like messages(), but reuses the previous helper when it is bound to the same channel.
+
+        Only used by the read-only forwarders below, which pass everything per call and never
+        mutate the helper; messages() itself keeps returning a fresh instance callers may rebind.
+        """
+        cid = channel_id or self.channel_id
+        helper = self._messages_helper
+        if helper is None or helper.channel_id != cid:
+            helper = self._messages_helper = self.messages(cid)
+        return helper
 
     def get_conversation_info(self, channel_id: str) -> Dict[str, Any]:
         """Public method for conversations.info (calls wrapper)."""
         return self._conversations_info(channel_id)
 
+    def prefetch(self, channel_ids: Iterable[str], *, max_workers: int = 4) -> Dict[str, Dict[str, Any]]:
+        """
+        Warm the shared info cache for many conversations at once; returns ``{channel_id: channel}``.
+
+        Lookups run on up to *max_workers* threads (the API caller still paces them), so helpers
+        later built with slack.conversations(cid) answer refresh()/is_private()/get_conversation_name()
+        from the cache. IDs that cannot be looked up are omitted from the result.
+        """
+        wanted = list(dict.fromkeys(cid for cid in channel_ids if cid))
+
+        def lookup(cid: str) -> Dict[str, Any]:
+            try:
+                return self._conversations_info(cid)
+            except SlackApiError:
+                return {"ok": False}
+
+        found: Dict[str, Dict[str, Any]] = {}
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(wanted) or 1))) as pool:
+            for cid, resp in zip(wanted, pool.map(lookup, wanted)):
+                if resp.get("ok") and resp.get("channel"):
+                    found[cid] = resp["channel"]
+        return found
+
     def is_private(self) -> bool:
         """
         Returns True if the conversation is private.
 
         Uses cached attributes if available; otherwise raises unless bound (then refreshes).
+        An unloaded, bound G… (legacy private / group DM) or D… (DM) conversation is private by
+        its ID alone, so no conversations.info call is made; C… IDs can be either and are looked up.
         """
+        if not self.attributes and self.channel_id and self.channel_id.startswith(("G", "D")):
+            return True
         attrs = self._require_attributes()
         return bool(attrs.get("is_private", False))
 
@@ -191,8 +371,8 @@ class Conversations(SlackObjectBase):
         """
         Returns conversation name for self (cached) or for the provided channel_id (fresh lookup).
 
-        Mirrors legacy behavior: when channel_id is supplied, we fetch fresh attributes rather than
-        trusting local cache. :contentReference[oaicite:8]{index=8}
+        Mirrors legacy behavior: when channel_id is supplied, we look it up rather than trusting
+        this instance's attributes (the lookup itself may be served from the info cache). :contentReference[oaicite:8]{index=8}
         """
         if channel_id:
             info = self.get_conversation_info(channel_id)
@@ -211,6 +391,7 @@ class Conversations(SlackObjectBase):
         *,
         workspace_id: Optional[str] = None,
         workspace_name: Optional[str] = None,
+        first_only: bool = False,
     ) -> List[str]:
         """
         Search for conversations by name and return matching IDs (exact name match).
@@ -222,60 +403,124 @@ class Conversations(SlackObjectBase):
         - If workspace_id is provided, we scope the search (team_ids).
         - workspace_name resolution is intentionally omitted here to keep this class focused;
           do it via Workspaces helper (slack.workspaces()) and pass workspace_id.
+        - Pages are filtered as they arrive; only matching IDs are kept.
+        - first_only=True stops paging at the first exact match (returns at most one ID).
+        - Completed searches are cached for `name_ttl` seconds, empty results included, so
+          resolving the same name again skips the paginated tier-2 walk.
         """
         if workspace_name and not workspace_id:
             raise ValueError("workspace_name resolution should be done via Workspaces; pass workspace_id instead.")
 
-        limit = 20  # legacy note: admin.conversations.search max appears to be 20 :contentReference[oaicite:10]{index=10}
-        payload: Dict[str, Any] = {"limit": limit, "query": channel_name}
-        if workspace_id:
-            payload["team_ids"] = workspace_id
+        cache_key = ("admin.conversations.search", channel_name, workspace_id or None)
+        cached = self.cache.get(cache_key)
+        if cached is not None:
+            ids = _json.loads(cached)
+            return ids[:1] if first_only else ids
 
-        found_tmp: List[Dict[str, Any]] = []
         found: List[str] = []
 
-        while True:
-            resp = self._admin_conversations_search(payload)
+        # The next page is requested while this one is processed; only the cursor changes per page.
+        # legacy note: admin.conversations.search max limit appears to be 20 :contentReference[oaicite:10]{index=10}
+        pages = prefetch_pages(
+            lambda page: self._admin_conversations_search(
+                channel_name, limit=20, team_ids=workspace_id or None, cursor=page.get("cursor")
+            ),
+            {},
+            lambda resp: {"cursor": resp["next_cursor"]} if resp.get("next_cursor") else None,
+        )
+        for resp in pages:
             if not resp.get("ok"):
                 # keep it explicit; scripts can catch and decide
                 raise RuntimeError(f"admin.conversations.search failed: {resp}")
 
-            found_tmp.extend(resp.get("conversations") or [])
+            found.extend(self._exact_name_ids(resp.get("conversations") or (), channel_name))
+            if first_only and found:
+                return found[:1]
 
-            next_cursor = resp.get("next_cursor") or ""
-            if not next_cursor:
-                break
-            payload["cursor"] = next_cursor
+        # Only full walks are cached; a first_only early exit may have missed later matches.
+        self.cache.set(cache_key, _json.dumps(found), self.name_ttl)
+        return found
 
-        for convo in found_tmp:
-            if convo.get("name") == channel_name and convo.get("id"):
-                found.append(convo["id"])
+    async def aget_conversation_ids_from_name(
+        self,
+        channel_name: str,
+        *,
+        workspace_id: Optional[str] = None,
+        workspace_name: Optional[str] = None,
+        first_only: bool = False,
+    ) -> List[str]:
+        """
+        asyncio variant of get_conversation_ids_from_name() (same arguments, result and name cache).
 
+        The next page's request runs as a task while the current page is filtered.
+        """
+        if workspace_name and not workspace_id:
+            raise ValueError("workspace_name resolution should be done via Workspaces; pass workspace_id instead.")
+
+        cache_key = ("admin.conversations.search", channel_name, workspace_id or None)
+        cached = self.cache.get(cache_key)
+        if cached is not None:
+            ids = _json.loads(cached)
+            return ids[:1] if first_only else ids
+
+        found: List[str] = []
+        pages = aprefetch_pages(
+            lambda page: self._aadmin_conversations_search(
+                channel_name, limit=20, team_ids=workspace_id or None, cursor=page.get("cursor")
+            ),
+            {},
+            lambda resp: {"cursor": resp["next_cursor"]} if resp.get("next_cursor") else None,
+        )
+        try:
+            async for resp in pages:
+                if not resp.get("ok"):
+                    raise RuntimeError(f"admin.conversations.search failed: {resp}")
+
+                found.extend(self._exact_name_ids(resp.get("conversations") or (), channel_name))
+                if first_only and found:
+                    return found[:1]
+        finally:
+            await pages.aclose()
+
+        self.cache.set(cache_key, _json.dumps(found), self.name_ttl)
         return found
 
     def archive(self, channel_id: Optional[str] = None) -> bool:
         """
         Archive a conversation via admin.conversations.archive.
 
-        Returns True if archived or already archived.
+        Returns True if archived or already archived, False for other (permanent) errors.
+        Raises RuntimeError on transient server errors (e.g. ratelimited) so callers can retry
+        instead of mistaking them for a refusal.
         """
         cid = channel_id or self.channel_id
         if not cid:
             raise ValueError("archive() requires channel_id (passed or bound)")
 
-        resp = self._admin_conversations_archive(cid)
+        try:
+            resp = self._admin_conversations_archive(cid)
+        except SlackApiError as e:
+            # WebClient raises on ok=false; already_archived is still a success.
+            resp = getattr(e.response, "data", None) or {"ok": False}
+            if resp.get("error") not in _ARCHIVE_DONE_ERRORS:
+                raise
+        finally:
+            self._invalidate_info(cid)
         if resp.get("ok"):
             return True
 
+        err = resp.get("error")
         # legacy behavior treated already_archived as success :contentReference[oaicite:11]{index=11}
-        if resp.get("error") == "already_archived":
+        if err in _ARCHIVE_DONE_ERRORS:
             return True
+        if err in _TRANSIENT_ERRORS:
+            raise RuntimeError(f"admin.conversations.archive failed transiently for {cid}: {safe_error_context(resp)}")
 
         return False
 
     def share_to_workspaces(
         self,
-        target_ws_id: str,
+        target_ws_id: Union[str, Sequence[str]],
         *,
         channel_id: Optional[str] = None,
         source_ws_id: Optional[str] = None,
@@ -287,26 +532,25 @@ class Conversations(SlackObjectBase):
 
         - If source_ws_id is provided: setTeams includes both source and target (team_id + target_team_ids)
         - Else: target_team_ids includes only target
+        - target_ws_id may be a single workspace ID or a sequence of them (share into N workspaces)
         """
         cid = channel_id or self.channel_id
         if not cid:
             raise ValueError("share_to_workspaces() requires channel_id (passed or bound)")
 
-        payload: Dict[str, Any] = {"channel_id": cid}
-
+        targets = self._workspace_ids(target_ws_id)
         if source_ws_id:
-            payload["team_id"] = source_ws_id
-            payload["target_team_ids"] = f"{source_ws_id},{target_ws_id}"
+            resp = self._admin_conversations_set_teams(cid, ",".join((source_ws_id, *targets)), team_id=source_ws_id)
         else:
-            payload["target_team_ids"] = target_ws_id
-
-        return self._admin_conversations_set_teams(payload)
+            resp = self._admin_conversations_set_teams(cid, ",".join(targets))
+        self._invalidate_info(cid, *targets, source_ws_id or "")
+        return resp
 
     def move_to_workspace(
         self,
         channel_id: str,
         source_ws_id: str,
-        target_ws_id: str,
+        target_ws_id: Union[str, Sequence[str]],
     ) -> Dict[str, Any]:
         """
         Move a conversation from one workspace to another via two-step setTeams.
@@ -314,17 +558,55 @@ class Conversations(SlackObjectBase):
         Matches your legacy `moveChannel` flow:
         1) setTeams with source + target
         2) setTeams with target only (removes from source) :contentReference[oaicite:13]{index=13}
+
+        target_ws_id may be a sequence of workspace IDs to move the conversation into several at once.
         """
+        resp1, resp2 = self._move_steps(channel_id, source_ws_id, self._workspace_ids(target_ws_id))
+        return resp1 if resp2 is None else resp2
+
+    def move_many_to_workspace(
+        self,
+        channel_ids: Iterable[str],
+        source_ws_id: str,
+        target_ws_id: Union[str, Sequence[str]],
+        *,
+        max_workers: int = 3,
+    ) -> Dict[str, Tuple[Dict[str, Any], Optional[Dict[str, Any]]]]:
+        """
+        Move many conversations with move_to_workspace()'s two-step flow, pipelined across channels.
+
+        Each channel's step 2 still waits for its own step 1, but up to *max_workers* channels are
+        in flight at once, so one channel's step 2 overlaps another's step 1 (the API caller keeps
+        the setTeams pace). Returns ``{channel_id: (step1_resp, step2_resp)}``; step2_resp is None
+        when step 1 failed. A SlackApiError for one channel is recorded as its response rather than
+        aborting the rest of the batch.
+        """
+        targets = self._workspace_ids(target_ws_id)
+        ids = list(dict.fromkeys(cid for cid in channel_ids if cid))
+
+        def move(cid: str) -> Tuple[Dict[str, Any], Optional[Dict[str, Any]]]:
+            try:
+                return self._move_steps(cid, source_ws_id, targets)
+            except SlackApiError as e:
+                return (getattr(e.response, "data", None) or {"ok": False, "error": str(e)}), None
+
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(ids) or 1))) as pool:
+            return dict(zip(ids, pool.map(move, ids)))
+
+    def _move_steps(
+        self, channel_id: str, source_ws_id: str, targets: Tuple[str, ...]
+    ) -> Tuple[Dict[str, Any], Optional[Dict[str, Any]]]:
+        """Run both setTeams steps of a move; step 2 is skipped (None) when step 1 fails."""
         # Step 1
-        payload_1 = {"channel_id": channel_id, "target_team_ids": f"{source_ws_id},{target_ws_id}"}
-        resp1 = self._admin_conversations_set_teams(payload_1)
+        resp1 = self._admin_conversations_set_teams(channel_id, ",".join((source_ws_id, *targets)))
+        self._invalidate_info(channel_id, source_ws_id, *targets)
         if not resp1.get("ok"):
-            return resp1
+            return resp1, None
 
         # Step 2
-        payload_2 = {"channel_id": channel_id, "target_team_ids": target_ws_id}
-        resp2 = self._admin_conversations_set_teams(payload_2)
-        return resp2
+        resp2 = self._admin_conversations_set_teams(channel_id, ",".join(targets))
+        self._invalidate_info(channel_id, source_ws_id, *targets)
+        return resp1, resp2
 
     def restrict_access_add_group(
         self,
@@ -345,46 +627,119 @@ class Conversations(SlackObjectBase):
             payload["team_id"] = workspace_id
         return self._admin_conversations_restrict_access_add_group(payload)
 
-    def get_members(
+    def _member_pages(self, cid: str, workspace_id: str, include_members_who_left: bool, *, read_ahead: bool) -> Iterator[Dict[str, Any]]:
+        """
+        Yield discovery.conversations.members pages; only the offset changes per page.
+
+        read_ahead=True requests the next page while this one is processed (worth it when every
+        page is wanted); otherwise a page is only requested once the caller asks for it.
+        """
+        def fetch(page: Dict[str, Any]) -> Dict[str, Any]:
+            return self._discovery_conversations_members(
+                cid, team=workspace_id or None, include_member_left=include_members_who_left, offset=page.get("offset")
+            )
+
+        def next_params(resp: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+            return {"offset": resp["offset"]} if resp.get("offset") else None
+
+        if read_ahead:
+            pages: Iterator[Dict[str, Any]] = prefetch_pages(fetch, {}, next_params)
+        else:
+            pages = self._sequential_pages(fetch, next_params)
+        for page, resp in enumerate(pages, start=1):
+            if not resp.get("ok"):
+                raise RuntimeError(f"discovery.conversations.members failed on page {page}: {resp}")
+            yield resp
+
+    @staticmethod
+    def _sequential_pages(
+        fetch: Callable[[Dict[str, Any]], Dict[str, Any]],
+        next_params: Callable[[Dict[str, Any]], Optional[Dict[str, Any]]],
+    ) -> Iterator[Dict[str, Any]]:
+        """prefetch_pages() without the read-ahead: page N+1 is requested only after page N is consumed."""
+        params: Optional[Dict[str, Any]] = {}
+        while params is not None:
+            resp = fetch(params)
+            yield resp
+            params = next_params(resp)
+
+    def iter_members(
         self,
         *,
         channel_id: Optional[str] = None,
         workspace_id: str = "",
         include_members_who_left: bool = False,
-    ) -> List[str]:
+    ) -> Iterator[str]:
         """
-        Return member IDs for a conversation via discovery.conversations.members.
+        Lazily yield member IDs for a conversation via discovery.conversations.members.
 
+        Each page is requested only when the caller reaches it (no read-ahead), so membership
+        checks such as ``any(m == uid for m in convo.iter_members())`` stop paginating at the
+        first hit without paying for an extra page.
         Mirrors legacy: supports team context for single-workspace conversations and optional
         include_member_left. :contentReference[oaicite:15]{index=15}
         """
         cid = channel_id or self.channel_id
         if not cid:
-            raise ValueError("get_members() requires channel_id (passed or bound)")
+            raise ValueError("iter_members() requires channel_id (passed or bound)")
+        for resp in self._member_pages(cid, workspace_id, include_members_who_left, read_ahead=False):
+            yield from resp.get("members") or ()
 
-        payload: Dict[str, Any] = {"channel": cid, "limit": 1000}
-        if workspace_id:
-            payload["team"] = workspace_id
-        if include_members_who_left:
-            payload["include_member_left"] = True
-
-        members: List[str] = []
-        page = 0
+    def get_members(
+        self,
+        *,
+        channel_id: Optional[str] = None,
+        workspace_id: str = "",
+        include_members_who_left: bool = False,
+    ) -> List[str]:
+        """
+        Return all member IDs for a conversation as a list.
 
-        while True:
-            page += 1
-            resp = self._discovery_conversations_members(payload)
-            if not resp.get("ok"):
-                raise RuntimeError(f"discovery.conversations.members failed on page {page}: {resp}")
+        Reads every page, so the next page is requested while the current one is processed;
+        prefer ``iter_members()`` when the caller can stop early.
+        """
+        cid = channel_id or self.channel_id
+        if not cid:
+            raise ValueError("get_members() requires channel_id (passed or bound)")
+        return [
+            member
+            for resp in self._member_pages(cid, workspace_id, include_members_who_left, read_ahead=True)
+            for member in resp.get("members") or ()
+        ]
 
-            members.extend(resp.get("members") or [])
+    async def aget_members(
+        self,
+        *,
+        channel_id: Optional[str] = None,
+        workspace_id: str = "",
+        include_members_who_left: bool = False,
+    ) -> List[str]:
+        """
+        asyncio variant of get_members() (same arguments and result).
 
-            offset = resp.get("offset")
-            if offset:
-                payload["offset"] = offset
-            else:
-                break
+        The next page's request runs as a task while the current page is collected.
+        """
+        cid = channel_id or self.channel_id
+        if not cid:
+            raise ValueError("aget_members() requires channel_id (passed or bound)")
 
+        members: List[str] = []
+        pages = aprefetch_pages(
+            lambda page: self._adiscovery_conversations_members(
+                cid, team=workspace_id or None, include_member_left=include_members_who_left, offset=page.get("offset")
+            ),
+            {},
+            lambda resp: {"offset": resp["offset"]} if resp.get("offset") else None,
+        )
+        try:
+            page = 0
+            async for resp in pages:
+                page += 1
+                if not resp.get("ok"):
+                    raise RuntimeError(f"discovery.conversations.members failed on page {page}: {resp}")
+                members.extend(resp.get("members") or ())
+        finally:
+            await pages.aclose()
         return members
 
     def get_messages(
@@ -400,10 +755,10 @@ class Conversations(SlackObjectBase):
         """
         Fetch conversation history.
 
-        Delegates to Messages.get_messages() so message logic stays centralized in messages.py.
+        Delegates to Messages.get_messages() so message logic stays centralized in messages.py;
+        the helper is already bound to the channel, so it isn't passed again.
         """
-        return self.messages(channel_id).get_messages(
-            channel_id=channel_id,  # harmless redundancy; Messages will resolve the same channel_id
+        return self._channel_messages(channel_id).get_messages(
             include_all_metadata=include_all_metadata,
             limit=limit,
             inclusive=inclusive,
@@ -426,8 +781,7 @@ class Conversations(SlackObjectBase):
 
         Delegates to Messages.get_message_threads() so thread logic stays centralized in messages.py.
         """
-        return self.messages(channel_id).get_message_threads(
-            channel_id=channel_id,
+        return self._channel_messages(channel_id).get_message_threads(
             thread_ts=thread_ts,
             limit=limit,
             latest=latest,
@@ -435,7 +789,27 @@ class Conversations(SlackObjectBase):
             inclusive=inclusive,
         )
 
+    @staticmethod
+    def _exact_name_ids(convos: Sequence[Dict[str, Any]], channel_name: str) -> List[str]:
+        """IDs of the search results named exactly *channel_name* (search itself is "contains")."""
+        ids: List[str] = []
+        append = ids.append  # hoisted: pages can hold many near-miss names
+        for convo in convos:
+            get = convo.get
+            if get("name") == channel_name:
+                cid = get("id")
+                if cid:
+                    append(cid)
+        return ids
+
+    @staticmethod
+    def _workspace_ids(ws_ids: Union[str, Sequence[str]]) -> Tuple[str, ...]:
+        """Normalize one workspace ID or a sequence of them to a tuple (a str is a single ID, not a sequence)."""
+        if isinstance(ws_ids, str):
+            return (ws_ids,)
+        return tuple(ws_ids)
+
     @staticmethod
     def _looks_like_channel_id(value: str) -> bool:
         """Return True if *value* matches the Slack conversation ID pattern (C…, G…, or D…)."""
-        return bool(CONVERSATION_ID_RE.match(value))
+        return is_conversation_id(value)
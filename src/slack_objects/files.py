@@ -16,21 +16,29 @@ Design goals (mirrors Users):
     file downloads use an injectable requests.Session.
 
 This module provides file-centric behaviors:
-- Load file metadata (files.info)
-- Download text file content (via url_private)
+- Load file metadata (files.info), cached briefly in the shared helper cache
+- Download text file content (via url_private), streamed and decoded incrementally
 - Upload content (files.uploadV2)
 - Delete/list files
 - Identify the message where a file was shared (via a Conversations/Channels-like helper)
 """
 
+import codecs
+import time
 from dataclasses import dataclass, field
-from typing import Any, Dict, Optional, Union
+from typing import IO, TYPE_CHECKING, Any, Dict, Iterable, Iterator, Optional, Tuple, Union
 
-import requests
-
-from .base import SlackObjectBase
+from . import _json
+from .base import LazyHttpSession, SlackObjectBase, http_timeout, resolve_http_session
 from .config import RateTier
 
+if TYPE_CHECKING:
+    import requests
+
+# Text up to this many characters is uploaded inline as `content`; larger payloads (and any
+# bytes) go through the multipart `file` field instead.
+INLINE_CONTENT_MAX_CHARS = 1024 * 1024
+
 
 @dataclass
 class Files(SlackObjectBase):
@@ -57,7 +65,18 @@ class Files(SlackObjectBase):
     source_message: Optional[Dict[str, Any]] = None
 
     # Optional requests session (handy for unit tests and connection pooling)
-    http_session: requests.Session = field(default_factory=requests.Session, repr=False)
+    # None (or a client's LazyHttpSession) until the first download resolves it (see base.resolve_http_session).
+    http_session: Optional[Union[requests.Session, LazyHttpSession]] = field(default=None, repr=False)
+
+    # Lease for cached files.info results; delete_file() drops the entry.
+    # Also how long attributes loaded by refresh() are trusted by _require_attributes().
+    info_ttl: float = 60.0
+
+    # Monotonic time of the last refresh(); 0.0 means attributes were never fetched here.
+    _attrs_fetched_at: float = field(default=0.0, init=False, repr=False)
+
+    # (token, headers) for url_private downloads, built on the first download.
+    _download_headers: Optional[Tuple[str, Dict[str, str]]] = field(default=None, init=False, repr=False)
 
     # ---------- factory helpers ----------
 
@@ -68,28 +87,42 @@ class Files(SlackObjectBase):
             client=self.client,
             logger=self.logger,
             api=self.api,
+            rate_policy=self.rate_policy,
+            cache=self.cache,
             file_id=file_id,
             http_session=self.http_session,
         )
 
     # ---------- attribute lifecycle ----------
 
-    def refresh(self, file_id: Optional[str] = None, *, get_content: bool = False) -> Dict[str, Any]:
+    def refresh(
+        self,
+        file_id: Optional[str] = None,
+        *,
+        get_content: bool = False,
+        force: bool = False,
+        include_comments: bool = True,
+    ) -> Dict[str, Any]:
         """
         Refresh attributes for file_id (or self.file_id) using files.info.
         If get_content=True and mimetype is text/*, also fetch the file content.
+        force=True skips the shared files.info cache for a hard reload.
+        include_comments=False loads only the first files.info page (see get_file_info()).
         """
         if file_id:
             self.file_id = file_id
         if not self.file_id:
             raise ValueError("refresh() requires file_id (passed or already set)")
 
-        resp = self.get_file_info(self.file_id)
+        if force:
+            self.invalidate(self.file_id)
+        resp = self.get_file_info(self.file_id, include_comments=include_comments)
         if not resp.get("ok"):
             raise RuntimeError(f"Files.get_file_info() failed: {resp}")
 
         # Slack returns file info under 'file'
         self.attributes = resp.get("file") or {}
+        self._attrs_fetched_at = time.monotonic()
 
         if get_content and self._is_text_file():
             self.get_text_content()
@@ -97,16 +130,26 @@ class Files(SlackObjectBase):
         return self.attributes
 
     def _require_attributes(self) -> Dict[str, Any]:
-        """Ensure file attributes are loaded before accessing fields like url_private/mimetype."""
+        """
+        Ensure file attributes are loaded before accessing fields like url_private/mimetype.
+
+        Attributes from refresh() are reused for info_ttl seconds (even an empty record), then
+        reloaded. Attributes assigned by the caller are trusted as-is. Loads here skip the
+        comment pages, since callers only read file fields.
+        """
+        if self._attrs_fetched_at:
+            if time.monotonic() - self._attrs_fetched_at < self.info_ttl or not self.file_id:
+                return self.attributes
+            return self.refresh(include_comments=False)
         if self.attributes:
             return self.attributes
         if self.file_id:
-            return self.refresh()
+            return self.refresh(include_comments=False)
         raise ValueError("File attributes not loaded and no file_id set (call refresh() or bind file_id).")
 
     def _is_text_file(self) -> bool:
         attrs = self._require_attributes()
-        return "text/" in str(attrs.get("mimetype", ""))
+        return str(attrs.get("mimetype", "")).startswith("text/")
 
     # ============================================================
     # Slack Web API wrapper layer
@@ -139,32 +182,57 @@ class Files(SlackObjectBase):
     # HTTP wrapper layer (for url_private download)
     # ============================================================
 
-    def _http_get_private_url(self, url: str) -> requests.Response:
+    def _http_get_private_url(self, url: str, *, stream: bool = True) -> requests.Response:
         """
         Download url_private content.
 
         Slack file downloads require Authorization: Bearer <bot_token> (or a token that can read the file).
-        We use cfg.bot_token by default.
+        We use cfg.bot_token by default. With stream=True (the default) the body is not read up front;
+        the caller iterates it and must close the response.
         """
         token = getattr(self.cfg, "bot_token", None)
         if not token:
             raise ValueError("Downloading url_private requires cfg.bot_token")
 
-        headers = {"Authorization": f"Bearer {token}"}
-        timeout = getattr(self.cfg, "http_timeout_seconds", 30)
-        return self.http_session.get(url, headers=headers, timeout=timeout)
+        memo = self._download_headers
+        if memo is None or memo[0] != token:
+            # requests copies headers when preparing a request, so one dict serves every download.
+            memo = self._download_headers = (token, {"Authorization": f"Bearer {token}"})
+        headers = memo[1]
+        return self._download_session().get(url, headers=headers, timeout=http_timeout(self.cfg), stream=stream)
+
+    def _download_session(self) -> requests.Session:
+        """The requests.Session for downloads; a lazy or missing session is resolved on first use."""
+        session = self.http_session
+        if session is None or isinstance(session, LazyHttpSession):
+            session = self.http_session = resolve_http_session(session)
+        return session
 
     # ============================================================
     # Public Slack Web API methods (call wrappers above)
     # ============================================================
 
-    def get_file_info(self, file_id: str) -> Dict[str, Any]:
+    def get_file_info(self, file_id: str, *, include_comments: bool = True) -> Dict[str, Any]:
         """
         Public method for files.info.
         Supports pagination via cursor if Slack includes response_metadata.next_cursor.
-        Legacy class looped through pages for comments; we keep that behavior.
+        Legacy class looped through pages for comments; we keep that behavior, appending each
+        page's list fields (e.g. comments) to the first page's file object.
+
+        include_comments=False returns after the first page, for callers that only need the
+        file's own fields (name, mimetype, url_private, ...).
+
+        Results are cached for ``info_ttl`` seconds (see ``invalidate()``); a complete result
+        also serves later include_comments=False calls.
         """
-        combined_file: Dict[str, Any] = {}
+        cache_key = ("files.info", file_id)
+        cached = self.cache.get(cache_key)
+        if cached is None and not include_comments:
+            cached = self.cache.get(("files.info", file_id, "first_page"))
+        if cached is not None:
+            return _json.loads(cached)
+
+        combined_file: Optional[Dict[str, Any]] = None
         cursor: Optional[str] = None
 
         while True:
@@ -173,23 +241,47 @@ class Files(SlackObjectBase):
                 return resp
 
             file_obj = resp.get("file") or {}
-            combined_file.update(file_obj)  # merge paginated data (comments, etc.)
+            if combined_file is None:
+                combined_file = dict(file_obj)
+            else:
+                # Later pages only add to paginated collections (comments, etc.); their scalar
+                # fields repeat the first page and are dropped.
+                for key, value in file_obj.items():
+                    existing = combined_file.get(key)
+                    if isinstance(existing, list) and isinstance(value, list):
+                        existing.extend(value)
 
             meta = resp.get("response_metadata") or {}
-            next_cursor = (meta.get("next_cursor") or "").strip()
-            if next_cursor:
-                cursor = next_cursor
-            else:
+            cursor = (meta.get("next_cursor") or "").strip()
+            del resp, file_obj  # don't hold the page while the next one is fetched
+            if not cursor:
                 break
+            if not include_comments:
+                # More pages exist, so this is not the complete record; keep it apart.
+                resp = {"ok": True, "file": combined_file}
+                self.cache.set(("files.info", file_id, "first_page"), _json.dumps(resp), self.info_ttl)
+                return resp
 
-        return {"ok": True, "file": combined_file}
+        resp = {"ok": True, "file": combined_file or {}}
+        self.cache.set(cache_key, _json.dumps(resp), self.info_ttl)
+        return resp
+
+    def invalidate(self, file_id: Optional[str] = None) -> None:
+        """Drop the cached files.info result for file_id (defaults to bound self.file_id)."""
+        fid = file_id or self.file_id
+        if fid:
+            self.cache.pop(("files.info", fid))
+            self.cache.pop(("files.info", fid, "first_page"))
 
     def delete_file(self, file_id: Optional[str] = None) -> Dict[str, Any]:
         """Delete a file by id (defaults to bound self.file_id)."""
         fid = file_id or self.file_id
         if not fid:
             raise ValueError("delete_file requires file_id (passed or bound)")
-        return self._files_delete(fid)
+        try:
+            return self._files_delete(fid)
+        finally:
+            self.invalidate(fid)
 
     def list_files(self, **kwargs) -> Dict[str, Any]:
         """
@@ -207,31 +299,40 @@ class Files(SlackObjectBase):
         thread_ts: str = "",
         filename: Optional[str] = None,
         content: Optional[str] = None,
+        file_stream: Optional[IO[bytes]] = None,
     ) -> Dict[str, Any]:
         """
         Upload file content to Slack via files.uploadV2.
 
         Behavior (legacy-inspired):
-        - Uses self.file_content if `content` is not passed.
+        - Uses file_stream if passed, else `content`, else self.file_content.
         - Uses attributes['name'] as filename if filename not passed and available.
         - If upload succeeds, updates self.file_id from response.
 
-        Note: Slack supports also uploading via `file` parameter (multipart). Here we use `content`.
+        Short text goes inline as `content`. A file_stream, bytes, or text longer than
+        INLINE_CONTENT_MAX_CHARS is sent as the multipart `file` field instead, so large
+        uploads skip the string round trip.
         """
         # Decide content source
         upload_content = content if content is not None else self.file_content
-        if upload_content is None:
-            raise ValueError("upload_to_slack requires content (pass content=... or set self.file_content).")
+        if file_stream is None and upload_content is None:
+            raise ValueError(
+                "upload_to_slack requires content (pass file_stream=..., content=... or set self.file_content)."
+            )
 
         # Decide filename
         if filename is None:
             filename = str((self.attributes or {}).get("name") or "slack_objects_upload.txt")
 
-        payload: Dict[str, Any] = {
-            "content": upload_content,
-            "filename": filename,
-            "title": title,
-        }
+        payload: Dict[str, Any] = {"filename": filename, "title": title}
+        if file_stream is not None:
+            payload["file"] = file_stream
+        elif isinstance(upload_content, bytes):
+            payload["file"] = upload_content
+        elif len(upload_content) > INLINE_CONTENT_MAX_CHARS:
+            payload["file"] = upload_content.encode("utf-8")
+        else:
+            payload["content"] = upload_content
         if channel:
             payload["channel"] = channel
         if thread_ts:
@@ -242,12 +343,18 @@ class Files(SlackObjectBase):
         # Update bound file id if Slack returns it
         if resp.get("ok"):
             # files.uploadV2 can return either file or files list depending on usage
+            new_id = None
             if "file" in resp and isinstance(resp["file"], dict) and resp["file"].get("id"):
-                self.file_id = resp["file"]["id"]
+                new_id = resp["file"]["id"]
             elif "files" in resp and isinstance(resp["files"], list) and resp["files"]:
                 first = resp["files"][0]
                 if isinstance(first, dict) and first.get("id"):
-                    self.file_id = first["id"]
+                    new_id = first["id"]
+            if new_id and new_id != self.file_id:
+                # Loaded attributes described the previous file; the next access reloads.
+                self.file_id = new_id
+                self.attributes = {}
+                self._attrs_fetched_at = 0.0
 
         return resp
 
@@ -255,12 +362,25 @@ class Files(SlackObjectBase):
         """
         Download and store file content for text/* files using url_private.
 
-        Stores decoded text in self.file_content and returns it.
+        Stores decoded text in self.file_content and returns it. The body is streamed and decoded
+        chunk by chunk (see iter_text_content()), so the raw bytes are never held alongside the text.
+        """
+        text = "".join(self.iter_text_content())
+        self.file_content = text
+        return text
+
+    def iter_text_content(self, *, chunk_size: int = 64 * 1024) -> Iterator[str]:
+        """
+        Stream a text/* file's content from url_private as decoded UTF-8 chunks.
+
+        For consumers that process the file as it arrives (memory stays O(chunk_size));
+        nothing is stored on the instance. Raises before yielding on non-text files and
+        non-2xx responses.
         """
         attrs = self._require_attributes()
         mimetype = str(attrs.get("mimetype", ""))
 
-        if "text/" not in mimetype:
+        if not mimetype.startswith("text/"):
             pretty_type = attrs.get("pretty_type", "unknown")
             name = attrs.get("name", self.file_id or "unknown")
             raise ValueError(
@@ -271,13 +391,22 @@ class Files(SlackObjectBase):
         if not url:
             raise ValueError("File attributes do not include url_private; cannot download content.")
 
-        resp = self._http_get_private_url(url)
-        if not resp.ok:
-            raise RuntimeError(f"Failed to download file content (HTTP {resp.status_code}): {resp.text[:200]}")
-
-        text = resp.content.decode("utf-8")
-        self.file_content = text
-        return text
+        resp = self._http_get_private_url(url, stream=True)
+        try:
+            if not resp.ok:
+                raise RuntimeError(f"Failed to download file content (HTTP {resp.status_code}): {resp.text[:200]}")
+
+            # Incremental, so a multi-byte character split across chunks still decodes correctly.
+            decoder = codecs.getincrementaldecoder("utf-8")()
+            for chunk in resp.iter_content(chunk_size=chunk_size):
+                text = decoder.decode(chunk)
+                if text:
+                    yield text
+            tail = decoder.decode(b"", final=True)
+            if tail:
+                yield tail
+        finally:
+            resp.close()
 
     def get_file_source_message(
         self,
@@ -317,14 +446,19 @@ class Files(SlackObjectBase):
 
         messages = conversation.get_messages(channel_id=conversation.channel_id, limit=limit)
 
+        msg = self._find_file_message(messages, fid, uid or None)
+        if msg is not None:
+            self.source_message = msg
+        return msg
+
+    @staticmethod
+    def _find_file_message(messages: Iterable[Dict[str, Any]], fid: str, uid: Optional[str]) -> Optional[Dict[str, Any]]:
+        """First message (optionally from *uid*) whose files include *fid*, or None."""
+        # The uploader check runs before a message's files are scanned.
+        if uid is not None:
+            messages = (msg for msg in messages if msg.get("user") == uid)
         for msg in messages:
-            files = msg.get("files")
-            if not files:
-                continue
-            if uid and msg.get("user") != uid:
-                continue
-            if any(isinstance(f, dict) and f.get("id") == fid for f in files):
-                self.source_message = msg
-                return msg
-
+            for f in msg.get("files") or ():
+                if isinstance(f, dict) and f.get("id") == fid:
+                    return msg
         return None
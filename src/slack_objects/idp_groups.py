@@ -13,8 +13,9 @@ This module implements the following functionality:
 
 - list groups (paginated)
 - get a single group's full SCIM record (name, members, metadata)
-- get members of a given group
-- check whether a user is a member of a group
+- get members of a given group (full member dicts, or just their user IDs as a frozenset)
+- check whether a user (or many users at once) is a member of a group
+- list the groups one user belongs to (for "is this user in any of these groups" checks)
 
 Design decisions
 ----------------
@@ -22,21 +23,31 @@ Design decisions
 - Uses an injectable `requests.Session` (`scim_session`) so tests can pass a fake session.
 - Keeps legacy output shapes: lists of dicts for groups and members.
 - ``get_group()`` is the single read path for GET Groups/{id}; ``get_members()``,
-  ``is_member()`` and the ``display_name``/``members`` properties all compose on it
+  ``get_member_ids()``, ``is_member()`` and the ``display_name``/``members`` properties all compose on it
   so the endpoint is only ever called from one place.
 - Attributes are loaded lazily (like ``Users``): binding a group_id does no network I/O,
   the fetch happens on first property access or on ``refresh()``.
+- Resolved group records are kept in the shared helper ``cache`` for ``group_ttl`` seconds,
+  so repeated lookups of one group (e.g. ``is_member`` over many users) cost one request.
+- ``aget_groups()``, ``aget_group()``, ``aget_members()`` and ``ais_member()`` are asyncio twins
+  over aiohttp (``pip install slack-objects[async]``); they share the cache and rate limiter.
 - This module is SCIM-only. For Slack-native usergroups, see ``usergroups.py``.
 """
 
+import asyncio
+import itertools
+import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Dict, FrozenSet, Iterable, List, Optional, Tuple, Union
 
-import requests
-
-from .base import SlackObjectBase
+from . import _json
+from .base import LazyHttpSession, SlackObjectBase
 from .scim_base import ScimMixin, ScimResponse, validate_scim_id
 
+if TYPE_CHECKING:
+    import requests
+
 
 @dataclass
 class IDP_groups(ScimMixin, SlackObjectBase):
@@ -57,10 +68,20 @@ class IDP_groups(ScimMixin, SlackObjectBase):
         members = group.members     # served from the same cached response
 
     The SCIM session can be replaced for unit tests by passing scim_session argument.
+    The a*-prefixed coroutines use ascim_session (an aiohttp.ClientSession) when given,
+    else a short-lived session per call.
     """
     group_id: Optional[str] = None
     attributes: Dict[str, Any] = field(default_factory=dict)
-    scim_session: requests.Session = field(default_factory=requests.Session, repr=False)
+    # None (or a client's LazyHttpSession) until the first SCIM call resolves it (see base.resolve_http_session).
+    scim_session: Optional[Union[requests.Session, LazyHttpSession]] = field(default=None, repr=False)
+    ascim_session: Any = field(default=None, repr=False)
+
+    # Lease for cached GET Groups/{id} records; IdP sync changes membership on its own schedule.
+    group_ttl: float = 60.0
+
+    # group_id -> (expires_at, member user IDs), so membership checks are set lookups.
+    _member_ids: Dict[str, Tuple[float, FrozenSet[str]]] = field(default_factory=dict, init=False, repr=False, compare=False)
 
     # ---------- factory ----------
     def with_group(self, group_id: str) -> "IDP_groups":
@@ -70,8 +91,11 @@ class IDP_groups(ScimMixin, SlackObjectBase):
             client=self.client,
             logger=self.logger,
             api=self.api,
+            rate_policy=self.rate_policy,
+            cache=self.cache,
             group_id=group_id,
             scim_session=self.scim_session,
+            ascim_session=self.ascim_session,
         )
 
     # ---------- identifier resolution ----------
@@ -146,50 +170,86 @@ class IDP_groups(ScimMixin, SlackObjectBase):
         # Pass params only when set, so the default call is byte-for-byte the legacy request.
         return self._scim_request(path=f"Groups/{group_id}", method="GET", params=params or None)      # https://docs.slack.dev/reference/scim-api/#get-groups-id
 
+    def _scim_user_get(self, user_id: str) -> ScimResponse:
+        """Wrapper for GET Users/{id}; the record's ``groups`` list names every group the user is in."""
+        validate_scim_id(user_id, "user_id")
+        return self._scim_request(path=f"Users/{user_id}", method="GET")      # https://docs.slack.dev/reference/scim-api/#get-users-id
+
+    async def _ascim_groups_list(self, *, count: int = 1000, start_index: Optional[int] = None) -> ScimResponse:
+        """Async wrapper for GET Groups (paginated)."""
+        params: Dict[str, Any] = {"count": count}
+        if start_index is not None:
+            params["startIndex"] = start_index
+        return await self._ascim_request(path="Groups", method="GET", params=params)
+
+    async def _ascim_group_get(self, group_id: str, *, count: Optional[int] = None, start_index: Optional[int] = None) -> ScimResponse:
+        """Async wrapper for GET Groups/{id}."""
+        validate_scim_id(group_id, "group_id")
+        params: Dict[str, Any] = {}
+        if count is not None:
+            params["count"] = count
+        if start_index is not None:
+            params["startIndex"] = start_index
+        return await self._ascim_request(path=f"Groups/{group_id}", method="GET", params=params or None)
+
+    # ---------- page helpers (shared by the sync and async paths) ----------
+
+    @staticmethod
+    def _remaining_start_indexes(first_page: Dict[str, Any]) -> range:
+        """startIndex of every Groups page after *first_page*; empty when it is the last page."""
+        resources = first_page.get("Resources", []) or []
+        total_results = first_page.get("totalResults")
+        # If API doesn't give a total, stop after the first page to avoid guessing.
+        if total_results is None or not resources or len(resources) >= int(total_results):
+            return range(0)
+        # The server may cap pages below the requested count, so step by the page it actually
+        # returned. SCIM startIndex is 1-based; page N starts at N*page_size + 1.
+        page_size = len(resources)
+        return range(page_size + 1, int(total_results) + 1, page_size)
+
+    @staticmethod
+    def _group_rows(pages: Iterable[List[Dict[str, Any]]]) -> List[Dict[str, str]]:
+        """Legacy {'group id', 'group name'} rows from ordered pages, stopping after the first short page."""
+        rows: List[Dict[str, str]] = []
+        page_size = None
+        for resources in pages:
+            rows.extend({"group id": grp.get("id"), "group name": grp.get("displayName")} for grp in resources)
+            # Pages after the first are as long as it was; a shorter one means the total
+            # overstated the data, and later pages are empty too.
+            if page_size is None:
+                page_size = len(resources)
+            elif len(resources) < page_size:
+                break
+        return rows
+
     # ---------- public helpers ----------
 
-    def get_groups(self, fetch_count: int = 1000) -> List[Dict[str, str]]:
+    def get_groups(self, fetch_count: int = 1000, *, max_workers: int = 4) -> List[Dict[str, str]]:
         """
         Return a list of IdP groups visible to the SCIM token.
 
         Legacy behavior: returns a list of maps containing only 'group id' and 'group name'.
         Pagination is respected; this method aggregates all pages.
 
+        The first page reveals ``totalResults``; every remaining ``startIndex`` is then known,
+        so those pages are fetched on up to *max_workers* threads (paced by the shared rate
+        limiter) and reassembled in order.
+
         Raises:
             requests.HTTPError on non-2xx responses.
         """
-        groups_out: List[Dict[str, str]] = []
-        start_index = None
-        total_results = None
-        retrieved = 0
-
-        while True:
-            scim_resp = self._scim_groups_list(count=fetch_count, start_index=start_index)
-            resp = scim_resp.data
-
-            # Slack SCIM returns 'Resources' (list) and 'totalResults' and 'startIndex' values.
-            resources = resp.get("Resources", []) or []
-            for grp in resources:
-                groups_out.append({"group id": grp.get("id"), "group name": grp.get("displayName")})
-                retrieved += 1
-
-            total_results = resp.get("totalResults", total_results)
-            # Calculate next page: SCIM uses startIndex + count
-            if total_results is None:
-                # If API doesn't give a total, break to avoid infinite loop
-                break
+        # Slack SCIM returns 'Resources' (list) and 'totalResults' and 'startIndex' values.
+        first = self._scim_groups_list(count=fetch_count).data
+        first_resources = first.get("Resources", []) or []
+        start_indexes = self._remaining_start_indexes(first)
+        if not start_indexes:
+            return self._group_rows([first_resources])
 
-            # Determine if we fetched all
-            if retrieved >= int(total_results):
-                break
+        def fetch(start_index: int) -> List[Dict[str, Any]]:
+            return self._scim_groups_list(count=fetch_count, start_index=start_index).data.get("Resources", []) or []
 
-            # Move cursor forward; SCIM startIndex is 1-based
-            if start_index is None:
-                start_index = fetch_count + 1
-            else:
-                start_index = start_index + fetch_count
-
-        return groups_out
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(start_indexes)))) as pool:
+            return self._group_rows(itertools.chain([first_resources], pool.map(fetch, start_indexes)))
 
     def get_group(self, group_id: Optional[str] = None, *, fetch_count: int = 1000) -> Dict[str, Any]:
         """
@@ -204,10 +264,16 @@ class IDP_groups(ScimMixin, SlackObjectBase):
         the remaining member pages are fetched and merged, so large groups are not
         silently truncated.
 
+        The merged record is cached for ``group_ttl`` seconds (see ``invalidate()``); each
+        call returns a fresh copy, so callers may mutate it.
+
         Raises:
             requests.HTTPError on non-2xx responses.
         """
         gid = self._resolve_group_id(group_id)
+        cached = self.cache.get(("scim.Groups", gid))
+        if cached is not None:
+            return _json.loads(cached)
 
         # First request sends no pagination params, so it is identical to the legacy call.
         # Copy so callers mutating the result cannot corrupt our cached attributes.
@@ -229,8 +295,17 @@ class IDP_groups(ScimMixin, SlackObjectBase):
                 members.extend(page_members)
 
         group["members"] = members
+        self.cache.set(("scim.Groups", gid), _json.dumps(group), self.group_ttl)
         return group
 
+    def invalidate(self, group_id: Optional[str] = None) -> None:
+        """Drop the cached record for group_id (or the bound group); call after changing the group."""
+        gid = self._resolve_group_id(group_id)
+        self.cache.pop(("scim.Groups", gid))
+        self._member_ids.pop(gid, None)
+        if self.attributes and self.attributes.get("id") == gid:
+            self.attributes = {}
+
     def get_members(self, group_id: Optional[str] = None) -> List[Dict[str, str]]:
         """
         Return group members via SCIM (GET Groups/{id}) as a list of dicts `{'value': <user_id>, 'display': <name>}`.
@@ -250,15 +325,107 @@ class IDP_groups(ScimMixin, SlackObjectBase):
         """
         Return True if ``user_id`` is a member of ``group_id`` (via SCIM).
 
-        Higher-level convenience that composes on ``get_members()``.
-        Preserves legacy semantics (scans the members list).
+        Higher-level convenience that composes on ``get_members()``. The group's member IDs
+        are kept as a frozenset for ``group_ttl`` seconds, so checking many users against one
+        group costs one fetch and a hash lookup per user. See also ``are_members()``.
+        """
+        return user_id in self.get_member_ids(group_id)
+
+    def are_members(self, user_ids: Iterable[str], group_id: Optional[str] = None) -> Dict[str, bool]:
+        """Return ``{user_id: is_member}`` for many users against one group (a single fetch)."""
+        member_ids = self.get_member_ids(group_id)
+        return {uid: uid in member_ids for uid in user_ids}
+
+    def get_member_ids(self, group_id: Optional[str] = None) -> FrozenSet[str]:
+        """
+        Return the group's member user IDs as a frozenset (the SCIM ``value`` of each member).
+
+        Cheaper than ``get_members()`` for membership work: the set is memoized per group for
+        ``group_ttl`` seconds and supports O(1) lookups. ``get_members()`` keeps the legacy shape.
+        """
+        gid = self._resolve_group_id(group_id)
+        entry = self._member_ids.get(gid)
+        now = time.monotonic()
+        if entry is not None and entry[0] > now:
+            return entry[1]
+        return self._remember_member_ids(gid, self.get_members(group_id=gid), now)
+
+    def get_user_group_ids(self, user_id: str) -> FrozenSet[str]:
+        """
+        Return the IDs of every group *user_id* belongs to, from one GET Users/{id}.
 
-        Each call fetches the group unless its attributes are already cached, so when
-        testing many users bind the group once (or hoist ``get_members()`` out of the loop).
+        The right read when one user is checked against several groups: a single request
+        however many (or however large) the groups are. Kept in the shared ``cache`` for
+        ``group_ttl`` seconds, so helpers built per check reuse it.
+
+        Raises:
+            requests.HTTPError on non-2xx responses.
+        """
+        key = ("scim.Users.groups", user_id)
+        cached = self.cache.get(key)
+        if cached is not None:
+            return frozenset(_json.loads(cached))
+        groups = self._scim_user_get(user_id).data.get("groups") or []
+        ids = frozenset(g.get("value") for g in groups if g.get("value"))
+        self.cache.set(key, _json.dumps(sorted(ids)), self.group_ttl)
+        return ids
+
+    def _remember_member_ids(self, gid: str, members: List[Dict[str, str]], now: float) -> FrozenSet[str]:
+        # member dicts historically had 'value' for id
+        ids = frozenset(m.get("value") for m in members if m.get("value"))
+        self._member_ids[gid] = (now + self.group_ttl, ids)
+        return ids
+
+    # ---------- asyncio twins ----------
+
+    async def aget_groups(self, fetch_count: int = 1000) -> List[Dict[str, str]]:
         """
-        members = self.get_members(group_id=group_id)
-        for member in members:
-            # member dicts historically had 'value' for id
-            if member.get("value") == user_id:
-                return True
-        return False
+        asyncio counterpart of ``get_groups()``: after the first page, the remaining pages are
+        requested concurrently on the event loop (paced by the shared rate limiter).
+        """
+        first = (await self._ascim_groups_list(count=fetch_count)).data
+        first_resources = first.get("Resources", []) or []
+        start_indexes = self._remaining_start_indexes(first)
+        responses = await asyncio.gather(
+            *(self._ascim_groups_list(count=fetch_count, start_index=i) for i in start_indexes)
+        )
+        pages = [first_resources] + [resp.data.get("Resources", []) or [] for resp in responses]
+        return self._group_rows(pages)
+
+    async def aget_group(self, group_id: Optional[str] = None, *, fetch_count: int = 1000) -> Dict[str, Any]:
+        """asyncio counterpart of ``get_group()``; shares its cache entries."""
+        gid = self._resolve_group_id(group_id)
+        cached = self.cache.get(("scim.Groups", gid))
+        if cached is not None:
+            return _json.loads(cached)
+
+        group = dict((await self._ascim_group_get(gid)).data)
+        members: List[Dict[str, str]] = list(group.get("members") or [])
+        total_results = group.get("totalResults")
+        if total_results is not None:
+            while len(members) < int(total_results):
+                resp = await self._ascim_group_get(gid, count=fetch_count, start_index=len(members) + 1)
+                page_members = resp.data.get("members") or []
+                if not page_members:
+                    break
+                members.extend(page_members)
+
+        group["members"] = members
+        self.cache.set(("scim.Groups", gid), _json.dumps(group), self.group_ttl)
+        return group
+
+    async def aget_members(self, group_id: Optional[str] = None) -> List[Dict[str, str]]:
+        """asyncio counterpart of ``get_members()``."""
+        gid = self._resolve_group_id(group_id)
+        if self.attributes and self.attributes.get("id") == gid:
+            return self.attributes.get("members", []) or []
+        return (await self.aget_group(gid)).get("members", []) or []
+
+    async def ais_member(self, user_id: str, group_id: Optional[str] = None) -> bool:
+        """asyncio counterpart of ``is_member()``; shares the member-ID memo."""
+        gid = self._resolve_group_id(group_id)
+        entry = self._member_ids.get(gid)
+        now = time.monotonic()
+        if entry is not None and entry[0] > now:
+            return user_id in entry[1]
+        return user_id in self._remember_member_ids(gid, await self.aget_members(gid), now)
@@ -21,14 +21,73 @@ Design goals:
     Only endpoint wrapper methods call self.api.call(...)
 - Practical:
     Provide common message operations: update/delete, thread replies, and block replacement.
+- Streaming:
+    iter_messages()/iter_message_threads() yield one page at a time and can stop early;
+    slim=True yields compact SlackMessage objects instead of full API dicts.
+- asyncio:
+    aget_messages()/aget_message_threads() request the next page while the current one is collected
+    (needs async_api + async_client, which SlackObjectsClient supplies when aiohttp is installed).
 """
 
+import logging
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional
+from itertools import islice
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple, Union
 
-from .base import SlackObjectBase
+from .api_caller import next_cursor
+from .base import SlackObjectBase, aprefetch_pages
 from .config import RateTier
 
+# Block fields replace_message_blocks() can match on, in precedence order.
+_BLOCK_MATCH_KEYS = ("block_id", "type")
+
+
+class SlackMessage:
+    """
+    Compact, read-only view of a message holding only its commonly used fields.
+
+    Opt-in (``iter_messages(slim=True)``) for walks that keep many messages around: a slotted
+    object with five attributes is far smaller than the full API dict, which is not retained.
+    ``as_dict()`` rebuilds a dict of the kept fields for code expecting the API shape.
+    """
+    __slots__ = ("ts", "user", "text", "thread_ts", "blocks")
+
+    def __init__(
+        self,
+        ts: str,
+        user: Optional[str] = None,
+        text: str = "",
+        thread_ts: Optional[str] = None,
+        blocks: Optional[List[Dict[str, Any]]] = None,
+    ):
+        self.ts = ts
+        self.user = user
+        self.text = text
+        self.thread_ts = thread_ts
+        self.blocks = blocks
+
+    @classmethod
+    def from_dict(cls, message: Dict[str, Any]) -> "SlackMessage":
+        get = message.get
+        return cls(get("ts"), get("user"), get("text") or "", get("thread_ts"), get("blocks"))
+
+    def as_dict(self) -> Dict[str, Any]:
+        """The kept fields in the API's shape (fields that were absent are omitted)."""
+        out: Dict[str, Any] = {"ts": self.ts, "text": self.text}
+        for name in ("user", "thread_ts", "blocks"):
+            value = getattr(self, name)
+            if value is not None:
+                out[name] = value
+        return out
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, SlackMessage):
+            return NotImplemented
+        return self.as_dict() == other.as_dict()
+
+    def __repr__(self) -> str:
+        return f"SlackMessage(ts={self.ts!r}, user={self.user!r}, text={self.text[:40]!r})"
+
 
 @dataclass
 class Messages(SlackObjectBase):
@@ -39,6 +98,8 @@ class Messages(SlackObjectBase):
     - channel_id: for channel-scoped message operations
     - ts: message timestamp (for update/delete/thread replies)
     - message: cached message payload (used by replace_message_block if blocks not provided)
+
+    The a*-prefixed coroutines need `async_api` and `async_client` (an AsyncWebClient).
     """
     channel_id: Optional[str] = None
     ts: Optional[str] = None
@@ -50,7 +111,7 @@ class Messages(SlackObjectBase):
 
     def with_channel(self, channel_id: str) -> "Messages":
         """Return a new Messages instance bound to channel_id, sharing cfg/client/logger/api."""
-        return Messages(cfg=self.cfg, client=self.client, logger=self.logger, api=self.api, channel_id=channel_id)
+        return Messages(cfg=self.cfg, client=self.client, logger=self.logger, api=self.api, rate_policy=self.rate_policy, cache=self.cache, async_api=self.async_api, async_client=self.async_client, channel_id=channel_id)
 
     def with_message(self, channel_id: str, ts: str, message: Optional[Dict[str, Any]] = None) -> "Messages":
         """Return a new Messages instance bound to (channel_id, ts), optionally caching message payload."""
@@ -59,6 +120,10 @@ class Messages(SlackObjectBase):
             client=self.client,
             logger=self.logger,
             api=self.api,
+            rate_policy=self.rate_policy,
+            cache=self.cache,
+            async_api=self.async_api,
+            async_client=self.async_client,
             channel_id=channel_id,
             ts=ts,
             message=message,
@@ -84,6 +149,113 @@ class Messages(SlackObjectBase):
         """Wrapper for conversations.history (channel history)."""
         return self.api.call(self.client, "conversations.history", rate_tier=RateTier.TIER_3, **payload)
 
+    async def _aconversations_replies(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        """Async wrapper for conversations.replies."""
+        return await self._async_api().call(self.async_client, "conversations.replies", rate_tier=RateTier.TIER_3, **payload)
+
+    async def _aconversations_history(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        """Async wrapper for conversations.history."""
+        return await self._async_api().call(self.async_client, "conversations.history", rate_tier=RateTier.TIER_3, **payload)
+
+    # ============================================================
+    # Pagination helpers (shared by the sync and async readers)
+    # ============================================================
+
+    @staticmethod
+    def _next_cursor(resp: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        cursor = next_cursor(resp)
+        return {"cursor": cursor} if cursor else None
+
+    def _replies_payload(
+        self,
+        channel_id: Optional[str],
+        thread_ts: Optional[str],
+        limit: Optional[int],
+        inclusive: bool,
+        latest: Optional[str],
+        oldest: Optional[str],
+    ) -> Dict[str, Any]:
+        cid = channel_id or self.channel_id
+        tts = thread_ts or self.ts
+        if not cid or not tts:
+            raise ValueError("get_message_threads requires channel_id and thread_ts (passed or bound).")
+
+        payload: Dict[str, Any] = {"channel": cid, "ts": tts, "inclusive": inclusive}
+        if limit is not None:
+            payload["limit"] = min(limit, self.MAX_PAGE_SIZE)
+        if latest:
+            payload["latest"] = latest
+        if oldest:
+            payload["oldest"] = oldest
+        return payload
+
+    def _history_payload(
+        self,
+        channel_id: Optional[str],
+        include_all_metadata: bool,
+        limit: Optional[int],
+        inclusive: bool,
+        latest: Optional[str],
+        oldest: Optional[str],
+    ) -> Dict[str, Any]:
+        cid = channel_id or self.channel_id
+        if not cid:
+            raise ValueError("get_messages requires channel_id (passed or bound).")
+
+        payload: Dict[str, Any] = {
+            "channel": cid,
+            "include_all_metadata": include_all_metadata,
+            "inclusive": inclusive,
+        }
+        if limit is not None:
+            payload["limit"] = min(limit, self.MAX_PAGE_SIZE)
+        if latest:
+            payload["latest"] = latest
+        if oldest:
+            payload["oldest"] = oldest
+        return payload
+
+    def _limited_cursor(self, limit: Optional[int]) -> Callable[[Dict[str, Any]], Optional[Dict[str, Any]]]:
+        """``next_params`` for aprefetch_pages() that shrinks each page to what *limit* still needs."""
+        if limit is None:
+            return self._next_cursor
+        seen = 0
+
+        def next_params(resp: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+            nonlocal seen
+            seen += len(resp.get("messages") or ())
+            updates = self._next_cursor(resp) if seen < limit else None
+            if updates:
+                updates["limit"] = min(limit - seen, self.MAX_PAGE_SIZE)
+            return updates
+
+        return next_params
+
+    @staticmethod
+    def _find_block_index(blocks: List[Dict[str, Any]], key: str, target: str) -> int:
+        """Index of the first block whose *key* equals *target*, or -1."""
+        return next((i for i, b in enumerate(blocks) if b.get(key) == target), -1)
+
+    async def _acollect(self, fetch, payload: Dict[str, Any], limit: Optional[int], method: str) -> List[Dict[str, Any]]:
+        """Gather `messages` across cursor pages, prefetching the next page; stops early at *limit*."""
+        out: List[Dict[str, Any]] = []
+        pages = aprefetch_pages(fetch, payload, self._limited_cursor(limit))
+        try:
+            async for resp in pages:
+                if not resp.get("ok"):
+                    raise RuntimeError(f"{method} failed: {resp}")
+                batch = resp.get("messages") or []
+                if limit is None:
+                    out.extend(batch)
+                    continue
+                # Take only what the limit still allows, so the result is never copied by a slice.
+                out.extend(islice(batch, limit - len(out)))
+                if len(out) >= limit:
+                    return out
+        finally:
+            await pages.aclose()
+        return out
+
     # ============================================================
     # Public operations
     # ============================================================
@@ -165,37 +337,8 @@ class Messages(SlackObjectBase):
 
         Note: Slack returns the parent message as the first element in `messages`.
         """
-        cid = channel_id or self.channel_id
-        tts = thread_ts or self.ts
-        if not cid or not tts:
-            raise ValueError("get_message_threads requires channel_id and thread_ts (passed or bound).")
-
-        payload: Dict[str, Any] = {"channel": cid, "ts": tts, "inclusive": inclusive}
-        if limit is not None:
-            payload["limit"] = limit
-        if latest:
-            payload["latest"] = latest
-        if oldest:
-            payload["oldest"] = oldest
-
-        replies: List[Dict[str, Any]] = []
-        while True:
-            resp = self._conversations_replies(payload)
-            if not resp.get("ok"):
-                raise RuntimeError(f"conversations.replies failed: {resp}")
-
-            batch = resp.get("messages") or []
-            replies.extend(batch)
-
-            if limit is not None and len(replies) >= limit:
-                return replies[:limit]
-
-            cursor = ((resp.get("response_metadata") or {}).get("next_cursor")) or ""
-            if not cursor:
-                break
-            payload["cursor"] = cursor
-
-        return replies
+        payload = self._replies_payload(channel_id, thread_ts, limit, inclusive, latest, oldest)
+        return list(islice(self._paginate(self._conversations_replies, payload, items_key="messages", method="conversations.replies", limit=limit), limit))
 
     def get_messages(
         self,
@@ -214,40 +357,85 @@ class Messages(SlackObjectBase):
         putting it here makes Conversations.py cleaner: Conversations delegates to Messages
         for anything message/history/thread related.
         """
-        cid = channel_id or self.channel_id
-        if not cid:
-            raise ValueError("get_messages requires channel_id (passed or bound).")
+        payload = self._history_payload(channel_id, include_all_metadata, limit, inclusive, latest, oldest)
+        return list(islice(self._paginate(self._conversations_history, payload, items_key="messages", method="conversations.history", limit=limit), limit))
 
-        payload: Dict[str, Any] = {
-            "channel": cid,
-            "include_all_metadata": include_all_metadata,
-            "inclusive": inclusive,
-        }
-        if limit is not None:
-            payload["limit"] = limit
-        if latest:
-            payload["latest"] = latest
-        if oldest:
-            payload["oldest"] = oldest
+    def iter_message_threads(
+        self,
+        *,
+        channel_id: Optional[str] = None,
+        thread_ts: Optional[str] = None,
+        page_size: Optional[int] = None,
+        inclusive: bool = True,
+        latest: Optional[str] = None,
+        oldest: Optional[str] = None,
+        stop: Optional[Callable[[Dict[str, Any]], bool]] = None,
+        slim: bool = False,
+    ) -> Iterator[Union[Dict[str, Any], SlackMessage]]:
+        """
+        Lazily yield thread replies (parent first), fetching the next page only when needed.
 
-        out: List[Dict[str, Any]] = []
-        while True:
-            resp = self._conversations_history(payload)
-            if not resp.get("ok"):
-                raise RuntimeError(f"conversations.history failed: {resp}")
+        Iteration ends at the first message for which *stop* returns True (that message is not
+        yielded), so a caller looking for something near the top never pays for the whole thread.
+        With *slim*, each message is yielded as a SlackMessage (*stop* still sees the dict).
+        """
+        payload = self._replies_payload(channel_id, thread_ts, page_size, inclusive, latest, oldest)
+        messages = self._paginate(self._conversations_replies, payload, items_key="messages", method="conversations.replies", stop=stop)
+        return map(SlackMessage.from_dict, messages) if slim else messages
 
-            batch = resp.get("messages") or []
-            out.extend(batch)
+    def iter_messages(
+        self,
+        *,
+        channel_id: Optional[str] = None,
+        include_all_metadata: bool = False,
+        page_size: Optional[int] = None,
+        inclusive: bool = True,
+        latest: Optional[str] = None,
+        oldest: Optional[str] = None,
+        stop: Optional[Callable[[Dict[str, Any]], bool]] = None,
+        slim: bool = False,
+    ) -> Iterator[Union[Dict[str, Any], SlackMessage]]:
+        """
+        Lazily yield channel history (newest first), one page in memory at a time.
 
-            if limit is not None and len(out) >= limit:
-                return out[:limit]
+        *stop* and *slim* work like in iter_message_threads(); breaking out of the loop works too.
+        """
+        payload = self._history_payload(channel_id, include_all_metadata, page_size, inclusive, latest, oldest)
+        messages = self._paginate(self._conversations_history, payload, items_key="messages", method="conversations.history", stop=stop)
+        return map(SlackMessage.from_dict, messages) if slim else messages
 
-            cursor = ((resp.get("response_metadata") or {}).get("next_cursor")) or ""
-            if not cursor:
-                break
-            payload["cursor"] = cursor
+    async def aget_message_threads(
+        self,
+        *,
+        channel_id: Optional[str] = None,
+        thread_ts: Optional[str] = None,
+        limit: Optional[int] = None,
+        inclusive: bool = True,
+        latest: Optional[str] = None,
+        oldest: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        asyncio variant of get_message_threads() (same arguments and result).
 
-        return out
+        Cursor pages depend on each other, so they cannot be fetched in parallel; instead the
+        next page's request runs as a task while the current page is collected.
+        """
+        payload = self._replies_payload(channel_id, thread_ts, limit, inclusive, latest, oldest)
+        return await self._acollect(self._aconversations_replies, payload, limit, "conversations.replies")
+
+    async def aget_messages(
+        self,
+        *,
+        channel_id: Optional[str] = None,
+        include_all_metadata: bool = False,
+        limit: Optional[int] = None,
+        inclusive: bool = True,
+        latest: Optional[str] = None,
+        oldest: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
+        """asyncio variant of get_messages() (same arguments and result); see aget_message_threads()."""
+        payload = self._history_payload(channel_id, include_all_metadata, limit, inclusive, latest, oldest)
+        return await self._acollect(self._aconversations_history, payload, limit, "conversations.history")
 
     def replace_message_block(
         self,
@@ -270,16 +458,6 @@ class Messages(SlackObjectBase):
         - If blocks is omitted, it uses self.message["blocks"] if available.
         - If neither block_type nor block_id is supplied, this raises.
         """
-        cid = channel_id or self.channel_id
-        mts = ts or self.ts
-        if not cid or not mts:
-            raise ValueError("replace_message_block requires channel_id and ts (passed or bound).")
-
-        if blocks is None:
-            if not self.message or "blocks" not in self.message:
-                raise ValueError("No blocks provided and no cached message.blocks available.")
-            blocks = list(self.message["blocks"])
-
         # Default behavior from legacy: blank text means "remove" area by replacing with a space section.
         if not text:
             text = " "
@@ -306,17 +484,69 @@ class Messages(SlackObjectBase):
         if not key:
             raise ValueError("replace_message_block requires block_type or block_id.")
 
-        # Replace first match
-        replaced = False
-        for i, b in enumerate(blocks):
-            if b.get(key) == target:
-                blocks[i] = new_block
-                replaced = True
-                break
-
-        if not replaced:
-            self.logger.info("No block matched %s=%r; no update performed.", key, target)
-            return {"ok": False, "error": "block_not_found", "key": key, "target": target}
+        return self.replace_message_blocks([(key, target, new_block)], blocks=blocks, channel_id=channel_id, ts=ts)
+
+    def replace_message_blocks(
+        self,
+        replacements: Sequence[Tuple[str, str, Dict[str, Any]]],
+        *,
+        blocks: Optional[List[Dict[str, Any]]] = None,
+        channel_id: Optional[str] = None,
+        ts: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """
+        Apply several block replacements with a single chat.update.
+
+        Each replacement is ``(key, target, new_block)`` where *key* is ``"block_id"`` or
+        ``"type"``; it replaces the first block whose *key* equals *target* (a later entry for
+        the same key/target wins). Blocks are scanned once and each is replaced at most once,
+        block_id matches taking precedence. If any replacement matches nothing, no update is
+        sent and ``{"ok": False, "error": "block_not_found", ...}`` lists the misses.
+        """
+        cid = channel_id or self.channel_id
+        mts = ts or self.ts
+        if not cid or not mts:
+            raise ValueError("replace_message_block requires channel_id and ts (passed or bound).")
+
+        if blocks is None:
+            if not self.message or "blocks" not in self.message:
+                raise ValueError("No blocks provided and no cached message.blocks available.")
+            blocks = self.message["blocks"]
+
+        pending: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        for key, target, new_block in replacements:
+            if key not in _BLOCK_MATCH_KEYS:
+                raise ValueError(f"replacement key must be one of {_BLOCK_MATCH_KEYS}, not {key!r}.")
+            pending[(key, target)] = new_block
+
+        # Resolve every match before touching anything, so a miss leaves the blocks as they were.
+        hits: Dict[int, Dict[str, Any]] = {}
+        if len(pending) == 1:
+            (key, target), = pending
+            i = self._find_block_index(blocks, key, target)
+            if i >= 0:
+                hits[i] = pending.pop((key, target))
+        else:
+            for i, b in enumerate(blocks):
+                if not pending:
+                    break
+                for key in _BLOCK_MATCH_KEYS:
+                    new_block = pending.pop((key, b.get(key)), None)
+                    if new_block is not None:
+                        hits[i] = new_block
+                        break
+
+        if pending:
+            missing = list(pending)
+            if self.logger.isEnabledFor(logging.INFO):  # the join is only worth building when it is logged
+                self.logger.info("No block matched %s; no update performed.", ", ".join(f"{k}={t!r}" for k, t in missing))
+            key, target = missing[0]
+            return {"ok": False, "error": "block_not_found", "key": key, "target": target, "missing": missing}
+
+        # Never edit the caller's list (or the cached message) in place.
+        blocks = list(blocks)
+        for i, new_block in hits.items():
+            blocks[i] = new_block
 
         # Update message with modified blocks
         return self.update_message(channel_id=cid, ts=mts, blocks=blocks)
@@ -1,7 +1,10 @@
-from dataclasses import dataclass, replace
-from typing import Mapping
+import asyncio
+import threading
+import time
+from dataclasses import dataclass, field, replace
+from typing import Any, Dict, Mapping, Optional, Tuple
 
-from .config import RateTier
+from .config import RateTier, tier_seconds
 
 
 @dataclass(frozen=True)
@@ -15,27 +18,211 @@ class RateLimitPolicy:
     # fallback
     default: RateTier = RateTier.TIER_3
 
+    # prefix_rules sorted longest-first, so the first match is the longest one
+    _sorted_prefixes: Tuple[Tuple[str, RateTier], ...] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        ordered = tuple(sorted(self.prefix_rules.items(), key=lambda kv: -len(kv[0])))
+        object.__setattr__(self, "_sorted_prefixes", ordered)
+
     def with_default(self, tier: RateTier) -> "RateLimitPolicy":
         """Return a copy of this policy with a different fallback tier."""
         return replace(self, default=tier)
 
     def tier_for(self, method: str) -> RateTier:
         # 1) exact match wins
-        if method in self.method_overrides:
-            return self.method_overrides[method]
+        tier = self.method_overrides.get(method)
+        if tier is not None:
+            return tier
 
         # 2) longest prefix match wins
-        best = None
-        for prefix, tier in self.prefix_rules.items():
-            if method.startswith(prefix) and (best is None or len(prefix) > len(best[0])):
-                best = (prefix, tier)
-        if best:
-            return best[1]
+        for prefix, tier in self._sorted_prefixes:
+            if method.startswith(prefix):
+                return tier
 
         # 3) default
         return self.default
 
 
+# At or below this many calls left (per a response's rate-limit headers), the next call waits
+# even if the local bucket has budget: until the window resets, spread over the calls left, or
+# a tier interval when no reset is reported.
+LOW_REMAINING_THRESHOLD = 2
+
+# Spellings of the "calls left in this window" / "window resets at" headers seen on Slack responses.
+_REMAINING_HEADERS = ("X-Rate-Limit-Remaining", "X-RateLimit-Remaining")
+_RESET_HEADERS = ("X-Rate-Limit-Reset", "X-RateLimit-Reset")
+
+# Reset values above this are epoch timestamps; smaller ones are seconds from now.
+_EPOCH_CUTOFF = 1_000_000_000
+
+
+def remaining_calls(headers: Optional[Mapping[str, Any]]) -> Optional[int]:
+    """The server-reported calls left in the current window, or None when not reported."""
+    if not headers:
+        return None
+    for name in _REMAINING_HEADERS:
+        raw = headers.get(name)
+        if raw is not None:
+            try:
+                return int(raw)
+            except (TypeError, ValueError):
+                return None
+    return None
+
+
+def reset_in(headers: Optional[Mapping[str, Any]]) -> Optional[float]:
+    """Seconds until the server's rate-limit window resets, or None when not reported."""
+    if not headers:
+        return None
+    for name in _RESET_HEADERS:
+        raw = headers.get(name)
+        if raw is not None:
+            try:
+                value = float(raw)
+            except (TypeError, ValueError):
+                return None
+            if value > _EPOCH_CUTOFF:
+                value -= time.time()
+            return max(0.0, value)
+    return None
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket that paces calls to a single rate-limited endpoint.
+
+    Tokens refill continuously at *rate* per second, up to *capacity*. ``acquire()``
+    only sleeps when the bucket is empty, so a caller that has been idle goes out
+    immediately instead of paying a fixed delay on every call.
+    """
+
+    def __init__(self, rate: float, capacity: float = 1.0):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """Take one token without sleeping. Returns the seconds the caller must wait before using it."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._last) * self.rate)
+            self._last = now
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return 0.0
+            wait = (1 - self._tokens) / self.rate
+            # Reserve the token now (the balance goes negative) so concurrent callers
+            # queue up behind us instead of all waking at the same instant.
+            self._tokens -= 1
+            return wait
+
+    def acquire(self) -> float:
+        """Take one token, sleeping until it is available. Returns the seconds slept."""
+        wait = self.reserve()
+        # Sleep outside the lock so other threads can compute their own wait.
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    def drain(self, seconds: float) -> None:
+        """Empty the bucket so the next token is at least *seconds* away (e.g. after a 429's Retry-After)."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._last) * self.rate)
+            self._last = now
+            self._tokens = min(self._tokens, 1 - seconds * self.rate)
+
+
+class RateLimiter:
+    """
+    Registry of TokenBuckets, one per rate-limit key (a Slack method name, or ``scim.<resource>``).
+
+    Each bucket refills at one token per ``tier_seconds(tier)`` seconds, i.e. the tier's
+    documented steady-state rate. ``burst`` is the bucket capacity: the default of 1
+    never exceeds the tier's rate, it only stops sleeping when budget is already available.
+
+    One limiter can be shared by sync (``acquire``) and asyncio (``acquire_async``) callers;
+    both draw from the same buckets.
+    """
+
+    def __init__(self, burst: float = 1.0):
+        self.burst = burst
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._lock = threading.Lock()
+
+    def _bucket(self, key: str, seconds: float) -> TokenBucket:
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            with self._lock:
+                bucket = self._buckets.setdefault(key, TokenBucket(rate=1.0 / seconds, capacity=self.burst))
+        return bucket
+
+    def reserve(self, key: str, tier: RateTier) -> float:
+        """Take a token on *key*'s bucket without sleeping. Returns the seconds to wait before the call."""
+        seconds = tier_seconds(tier)
+        if seconds <= 0:
+            return 0.0
+        return self._bucket(key, seconds).reserve()
+
+    def acquire(self, key: str, tier: RateTier) -> float:
+        """Wait (if needed) for a token on *key*'s bucket. Returns the seconds slept."""
+        seconds = tier_seconds(tier)
+        if seconds <= 0:
+            return 0.0
+        return self._bucket(key, seconds).acquire()
+
+    def drain(self, key: str, tier: RateTier, seconds: float) -> None:
+        """
+        Hold off every caller of *key* for *seconds*, e.g. when the server answered 429.
+
+        The wait is charged to the shared bucket, so concurrent callers back off together;
+        tiers without pacing have no bucket, so the current caller simply sleeps.
+        """
+        tier_s = tier_seconds(tier)
+        if tier_s <= 0:
+            if seconds > 0:
+                time.sleep(seconds)
+            return
+        self._bucket(key, tier_s).drain(seconds)
+
+    def observe(self, key: str, tier: RateTier, headers: Optional[Mapping[str, Any]]) -> None:
+        """
+        Fold a response's rate-limit headers into *key*'s bucket.
+
+        When the server reports at most LOW_REMAINING_THRESHOLD calls left, the bucket is emptied
+        so the next caller waits ``reset / remaining`` seconds (the window's reset spread over the
+        calls left), or one tier interval when no reset header is sent. Healthy responses cost
+        nothing. Unpaced tiers have no bucket and are left alone; this never sleeps.
+        """
+        remaining = remaining_calls(headers)
+        if remaining is None or remaining > LOW_REMAINING_THRESHOLD:
+            return
+        tier_s = tier_seconds(tier)
+        if tier_s <= 0:
+            return
+        until_reset = reset_in(headers)
+        wait = tier_s if until_reset is None else until_reset / max(remaining, 1)
+        self._bucket(key, tier_s).drain(wait)
+
+    async def acquire_async(self, key: str, tier: RateTier) -> float:
+        """Like ``acquire()``, but waits with ``asyncio.sleep`` so the event loop keeps running."""
+        wait = self.reserve(key, tier)
+        if wait > 0:
+            await asyncio.sleep(wait)
+        return wait
+
+    async def drain_async(self, key: str, tier: RateTier, seconds: float) -> None:
+        """Like ``drain()``, but an unpaced tier waits with ``asyncio.sleep`` instead of blocking the loop."""
+        if tier_seconds(tier) <= 0:
+            if seconds > 0:
+                await asyncio.sleep(seconds)
+            return
+        self.drain(key, tier, seconds)
+
+
 DEFAULT_RATE_POLICY = RateLimitPolicy(
     method_overrides={
         # add only the truly special cases
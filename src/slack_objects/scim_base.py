@@ -5,37 +5,60 @@ Centralizes:
 - ID validation (path-injection defense)
 - Base URL construction
 - Token-guarded HTTP request + JSON parsing
-- Rate-tier sleep
+- Rate-tier pacing through a token bucket, with 429/Retry-After retries
+- An asyncio twin of the request (``_ascim_request``) over aiohttp (``pip install slack-objects[async]``)
 """
 
 from __future__ import annotations
 
-import re
-import time
+import string
 from dataclasses import dataclass
-from typing import Any, Dict, Optional
-
-import requests  # used by self.scim_session (requests.Session) and resp.raise_for_status()
+from typing import Any, Dict, Optional, Tuple, Union
 
+from . import _json
+from .api_caller import MAX_RETRIES, backoff_delay, retry_after_seconds
+from .base import LazyHttpSession, http_timeout, resolve_http_session
 from .config import RateTier
+from .rate_limits import RateLimiter
 
 # Slack IDs are alphanumeric with hyphens/underscores.
-_SLACK_ID_RE = re.compile(r"^[A-Za-z0-9_\-]+$")
+_SLACK_ID_CHARS = frozenset(string.ascii_letters + string.digits + "_-")
 
 
 def validate_scim_id(value: str, label: str = "id") -> str:
     """Raise ValueError if *value* contains path-traversal or unexpected characters."""
-    if not value or not _SLACK_ID_RE.match(value):
+    if not value or not _SLACK_ID_CHARS.issuperset(value):
         raise ValueError(f"Invalid {label}: {value!r}")
     return value
 
 
+# Paces SCIM calls for hosts whose API caller has no limiter of its own.
+_SCIM_LIMITER = RateLimiter()
+
+# Gateway errors worth retrying, but only for methods that are safe to repeat
+# (a POST that timed out behind a 502 may still have created the user).
+_TRANSIENT_STATUSES = frozenset({502, 503, 504})
+_IDEMPOTENT_METHODS = frozenset({"GET", "PUT", "DELETE"})
+
+
+def _encode_body(payload: Optional[Union[Dict[str, Any], bytes]]) -> Optional[bytes]:
+    """JSON-encode a SCIM body; bytes (e.g. a module-level constant encoded once) pass through."""
+    if payload is None or isinstance(payload, bytes):
+        return payload
+    return _json.dumps(payload)
+
+
+def _should_retry(status: int, method: str) -> bool:
+    return status == 429 or (status in _TRANSIENT_STATUSES and method in _IDEMPOTENT_METHODS)
+
+
 @dataclass(frozen=True)
 class ScimResponse:
     """Structured result for SCIM calls (no Slack 'ok' boolean)."""
     ok: bool
     status_code: int
     data: Dict[str, Any]
+    # Decoded body of a failed response (for error reporting); "" when ok.
     text: str
 
 
@@ -45,14 +68,68 @@ class ScimMixin:
 
     Requirements on the host class (satisfied by SlackObjectBase subclasses):
         - self.cfg            (SlackObjectsConfig)
-        - self.scim_session   (requests.Session)
+        - self.scim_session   (requests.Session, a LazyHttpSession, or None for the process-wide default)
         - self.rate_policy    (RateLimitPolicy)
+    SCIM calls draw from the ``scim.<resource>`` buckets of ``self.api.limiter`` when the API
+    caller has one (so they share its budget), otherwise from a module-wide RateLimiter.
+
+    ``_ascim_request()`` uses ``self.ascim_session`` (an aiohttp.ClientSession) when the host
+    has one; otherwise it opens a short-lived session per call, like AsyncWebClient does.
     """
 
+    # Per-instance memos, filled on first use (cfg is frozen, so they never go stale).
+    _scim_url_root: Optional[str] = None
+    # (token, headers without body, headers with JSON body)
+    _scim_headers_memo: Optional[Tuple[str, Dict[str, str], Dict[str, str]]] = None
+
     # --- URL ---
 
     def _scim_base_url(self) -> str:
-        return f"{self.cfg.scim_base_url.rstrip('/')}/{self.cfg.scim_version}/"
+        url = self._scim_url_root
+        if url is None:
+            url = self._scim_url_root = f"{self.cfg.scim_base_url.rstrip('/')}/{self.cfg.scim_version}/"
+        return url
+
+    def _scim_headers(self, token: str, has_body: bool) -> Dict[str, str]:
+        """Request headers for *token*; built once per token and reused (requests copies them)."""
+        memo = self._scim_headers_memo
+        if memo is None or memo[0] != token:
+            plain = {"Authorization": f"Bearer {token}"}
+            memo = self._scim_headers_memo = (token, plain, {**plain, "Content-Type": "application/json; charset=utf-8"})
+        return memo[2] if has_body else memo[1]
+
+    def _scim_pacing(self, path: str, rate_tier: Optional[RateTier]) -> Tuple[str, RateTier, RateLimiter]:
+        """Return the (limiter key, tier, limiter) that pace a request to *path*."""
+        # Resolve rate tier: explicit override → policy lookup → TIER_2 fallback
+        path_root = path.lstrip("/").split("/")[0]          # "Users/U123" → "Users"
+        key = f"scim.{path_root}"
+        tier = rate_tier or self.rate_policy.tier_for(key)
+        limiter = getattr(getattr(self, "api", None), "limiter", None) or _SCIM_LIMITER
+        return key, tier, limiter
+
+    @staticmethod
+    def _scim_response(status_code: int, ok: bool, content: bytes) -> ScimResponse:
+        """Build a ScimResponse from a raw body."""
+        # SCIM bodies are UTF-8 JSON, parsed straight from the bytes: this skips requests' charset
+        # detection (resp.text runs it whenever Content-Type has no charset). The body is only
+        # decoded to text for failures and unparseable bodies, so large Groups pages are not
+        # held twice.
+        content = content or b""
+        try:
+            data = _json.loads(content) if content else {}
+        except Exception:
+            data = {"_raw_text": content.decode("utf-8", "replace")}
+
+        ok = ok and (data.get("Errors") is None)
+        text = "" if ok else content.decode("utf-8", "replace")
+        return ScimResponse(ok=ok, status_code=status_code, data=data, text=text)
+
+    def _scim_http(self) -> Any:
+        """The requests.Session for SCIM calls; a lazy or missing session is resolved on first use."""
+        session = self.scim_session
+        if session is None or isinstance(session, LazyHttpSession):
+            session = self.scim_session = resolve_http_session(session)
+        return session
 
     # --- Low-level request ---
 
@@ -61,7 +138,7 @@ class ScimMixin:
         *,
         path: str,
         method: str = "GET",
-        payload: Optional[Dict[str, Any]] = None,
+        payload: Optional[Union[Dict[str, Any], bytes]] = None,
         token: Optional[str] = None,
         params: Optional[Dict[str, Any]] = None,
         raise_for_status: bool = True,
@@ -72,46 +149,132 @@ class ScimMixin:
 
         Rate limiting uses *rate_tier* if given, otherwise resolves via
         ``self.rate_policy`` using a ``scim.<path_root>`` method key
-        (e.g. ``scim.Users``, ``scim.Groups``).
+        (e.g. ``scim.Users``, ``scim.Groups``). The call waits for a token up front, so an
+        idle client goes straight through. A 429 drains the bucket for the server's
+        Retry-After (or a jittered backoff) and is retried up to MAX_RETRIES times; a
+        502/503/504 on GET/PUT/DELETE is retried the same way.
+
+        Every call goes through one long-lived session (``scim_session``, else the process-wide
+        pooled one), so pagination walks reuse warm keep-alive TLS connections; retries live
+        here rather than in the session's adapter so they share the rate limiter.
 
         Raises ValueError when the token is missing.
         Raises requests.HTTPError on non-2xx when raise_for_status is True.
+        Raises RuntimeError when still rate-limited after MAX_RETRIES retries.
         """
         tok = token or self.cfg.scim_token
         if not tok:
             raise ValueError("SCIM request requires cfg.scim_token (or token override)")
 
+        key, tier, limiter = self._scim_pacing(path, rate_tier)
+
+        verb = method.upper()
         url = self._scim_base_url() + path.lstrip("/")
-        headers = {
-            "Authorization": f"Bearer {tok}",
-        }
+        # Only set Content-Type when there is a body to send. The body is encoded once here
+        # (orjson when installed), not by requests on every retry; bytes are sent as given.
+        headers = self._scim_headers(tok, payload is not None)
+        body = _encode_body(payload)
 
-        # Only set Content-Type when there is a body to send.
-        if payload is not None:
-            headers["Content-Type"] = "application/json; charset=utf-8"
+        for attempt in range(MAX_RETRIES + 1):
+            limiter.acquire(key, tier)
+            resp = self._scim_http().request(
+                method=verb,
+                url=url,
+                headers=headers,
+                params=params,
+                data=body,
+                timeout=http_timeout(self.cfg),
+            )
+            if not _should_retry(resp.status_code, verb):
+                break
+            if attempt >= MAX_RETRIES:
+                if resp.status_code != 429:
+                    break  # surfaced by raise_for_status below
+                raise RuntimeError(f"Rate-limited {MAX_RETRIES} times on {key}; giving up.")
+            retry_after = retry_after_seconds(getattr(resp, "headers", None))
+            limiter.drain(key, tier, backoff_delay(tier, attempt, retry_after))
 
-        resp = self.scim_session.request(
-            method=method.upper(),
-            url=url,
-            headers=headers,
-            params=params,
-            json=payload if payload is not None else None,
-            timeout=self.cfg.http_timeout_seconds,
-        )
+        # Healthy responses cost nothing; a nearly spent window slows the next call.
+        limiter.observe(key, tier, getattr(resp, "headers", None))
 
         if raise_for_status:
             resp.raise_for_status()
 
-        text = resp.text or ""
+        return self._scim_response(resp.status_code, resp.ok, resp.content)
+
+    async def _ascim_request(
+        self,
+        *,
+        path: str,
+        method: str = "GET",
+        payload: Optional[Union[Dict[str, Any], bytes]] = None,
+        token: Optional[str] = None,
+        params: Optional[Dict[str, Any]] = None,
+        raise_for_status: bool = True,
+        rate_tier: Optional[RateTier] = None,
+    ) -> ScimResponse:
+        """
+        asyncio counterpart of ``_scim_request()``; pacing and 429 backoff await instead of sleeping.
+
+        Raises ValueError when the token is missing.
+        Raises ImportError when no ascim_session is set and aiohttp is not installed.
+        Raises aiohttp.ClientResponseError on non-2xx when raise_for_status is True.
+        Raises RuntimeError when still rate-limited after MAX_RETRIES retries.
+        """
+        tok = token or self.cfg.scim_token
+        if not tok:
+            raise ValueError("SCIM request requires cfg.scim_token (or token override)")
+
+        key, tier, limiter = self._scim_pacing(path, rate_tier)
+        request = dict(
+            method=method.upper(),
+            url=self._scim_base_url() + path.lstrip("/"),
+            headers=self._scim_headers(tok, payload is not None),
+            params=params,
+            data=_encode_body(payload),
+        )
+
+        session = getattr(self, "ascim_session", None)
+        if session is not None:
+            return await self._ascim_send(session, request, key, tier, limiter, raise_for_status)
         try:
-            data = resp.json() if text else {}
-        except Exception:
-            data = {"_raw_text": text}
+            import aiohttp
+        except ImportError as e:
+            raise ImportError("async SCIM calls require aiohttp: pip install slack-objects[async]") from e
+        timeout = aiohttp.ClientTimeout(
+            total=self.cfg.http_timeout_seconds,
+            sock_connect=getattr(self.cfg, "http_connect_timeout_seconds", None),
+        )
+        async with aiohttp.ClientSession(timeout=timeout) as session:
+            return await self._ascim_send(session, request, key, tier, limiter, raise_for_status)
+
+    async def _ascim_send(
+        self,
+        session: Any,
+        request: Dict[str, Any],
+        key: str,
+        tier: RateTier,
+        limiter: RateLimiter,
+        raise_for_status: bool,
+    ) -> ScimResponse:
+        """Send one SCIM request on an aiohttp session, retrying 429s and idempotent gateway errors."""
+        for attempt in range(MAX_RETRIES + 1):
+            await limiter.acquire_async(key, tier)
+            async with session.request(**request) as resp:
+                content = await resp.read()
+                if not _should_retry(resp.status, request["method"]):
+                    break
+                retry_after = retry_after_seconds(resp.headers)
+            if attempt >= MAX_RETRIES:
+                if resp.status != 429:
+                    break
+                raise RuntimeError(f"Rate-limited {MAX_RETRIES} times on {key}; giving up.")
+            await limiter.drain_async(key, tier, backoff_delay(tier, attempt, retry_after))
 
-        ok = resp.ok and (data.get("Errors") is None)
+        # Healthy responses cost nothing; a nearly spent window slows the next call.
+        limiter.observe(key, tier, getattr(resp, "headers", None))
 
-        # Resolve rate tier: explicit override → policy lookup → TIER_2 fallback
-        path_root = path.lstrip("/").split("/")[0]          # "Users/U123" → "Users"
-        tier = rate_tier or self.rate_policy.tier_for(f"scim.{path_root}")
-        time.sleep(float(tier))
-        return ScimResponse(ok=ok, status_code=resp.status_code, data=data, text=text)
\ No newline at end of file
+        if raise_for_status:
+            resp.raise_for_status()
+
+        return self._scim_response(resp.status, 200 <= resp.status < 400, content)
@@ -16,11 +16,20 @@ Design decisions
 - Only calls the Slack Web API via SlackApiCaller; no SCIM dependency.
 - Keeps the same output shape as IDP_groups members
   (``[{'value': <user_id>, 'display': ''}]``) so callers can swap sources.
+- usergroups.list and usergroups.users.list results are kept in the shared helper ``cache``
+  for ``usergroup_ttl`` seconds (per team), so repeated ``is_member()`` checks are set lookups.
+- Member IDs for many usergroups can be fetched at once: ``get_member_ids_many()`` on a few
+  threads, ``aget_member_ids_many()`` on the event loop (needs async_api + async_client).
+  Both stay within the shared rate limiter.
 """
 
-from dataclasses import dataclass
-from typing import Any, Dict, List, Optional
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional, Tuple
 
+from . import _json
 from .base import SlackObjectBase
 from .config import RateTier
 
@@ -34,9 +43,17 @@ class Usergroups(SlackObjectBase):
         slack = SlackObjectsClient(cfg)
         ug = slack.usergroups()              # unbound
         bound = slack.usergroups("S0614TZR7") # bound to a usergroup_id
+
+    The a*-prefixed coroutines need `async_api` and `async_client` (an AsyncWebClient).
     """
     usergroup_id: Optional[str] = None
 
+    # Lease for cached usergroups.list / usergroups.users.list results.
+    usergroup_ttl: float = 300.0
+
+    # usergroup_id -> (expires_at, member user IDs), so membership checks are set lookups.
+    _member_ids: Dict[str, Tuple[float, FrozenSet[str]]] = field(default_factory=dict, init=False, repr=False, compare=False)
+
     # ---------- factory ----------
 
     def with_usergroup(self, usergroup_id: str) -> "Usergroups":
@@ -46,6 +63,10 @@ class Usergroups(SlackObjectBase):
             client=self.client,
             logger=self.logger,
             api=self.api,
+            rate_policy=self.rate_policy,
+            cache=self.cache,
+            async_api=self.async_api,
+            async_client=self.async_client,
             usergroup_id=usergroup_id,
         )
 
@@ -73,12 +94,54 @@ class Usergroups(SlackObjectBase):
             kwargs["team_id"] = self.cfg.team_id
         return self.api.call(self.client, "usergroups.users.list", rate_tier=RateTier.TIER_2, **kwargs)
 
+    async def _ausergroups_users_list(self, usergroup_id: str) -> Dict[str, Any]:
+        """Async wrapper for usergroups.users.list."""
+        kwargs: Dict[str, Any] = {"usergroup": usergroup_id}
+        if self.cfg.team_id:
+            kwargs["team_id"] = self.cfg.team_id
+        return await self._async_api().call(self.async_client, "usergroups.users.list", rate_tier=RateTier.TIER_2, **kwargs)
+
     # ---------- public helpers ----------
 
     def get_usergroups(self) -> List[Dict[str, Any]]:
-        """Return all usergroups visible to the bot token (usergroups.list)."""
+        """Return all usergroups visible to the bot token (usergroups.list), cached for ``usergroup_ttl``."""
+        key = ("usergroups.list", self.cfg.team_id)
+        cached = self.cache.get(key)
+        if cached is not None:
+            return _json.loads(cached)
+
         resp = self._usergroups_list()
-        return resp.get("usergroups", [])
+        usergroups = resp.get("usergroups", [])
+        if resp.get("ok"):
+            self.cache.set(key, _json.dumps(usergroups), self.usergroup_ttl)
+        return usergroups
+
+    def _member_user_ids(self, ugid: str) -> List[str]:
+        """usergroups.users.list for *ugid*, served from the shared cache when fresh."""
+        cached = self.cache.get(("usergroups.users.list", self.cfg.team_id, ugid))
+        if cached is not None:
+            return _json.loads(cached)
+        return self._store_member_user_ids(ugid, self._usergroups_users_list(ugid))
+
+    async def _amember_user_ids(self, ugid: str) -> List[str]:
+        """asyncio counterpart of ``_member_user_ids()``; shares its cache entries."""
+        cached = self.cache.get(("usergroups.users.list", self.cfg.team_id, ugid))
+        if cached is not None:
+            return _json.loads(cached)
+        return self._store_member_user_ids(ugid, await self._ausergroups_users_list(ugid))
+
+    def _store_member_user_ids(self, ugid: str, resp: Dict[str, Any]) -> List[str]:
+        users = resp.get("users", [])
+        if resp.get("ok"):
+            self.cache.set(("usergroups.users.list", self.cfg.team_id, ugid), _json.dumps(users), self.usergroup_ttl)
+        return users
+
+    def invalidate(self, usergroup_id: Optional[str] = None) -> None:
+        """Drop cached results for usergroup_id (or the bound usergroup); call after changing the usergroup."""
+        ugid = self._resolve_usergroup_id(usergroup_id)
+        self.cache.pop(("usergroups.users.list", self.cfg.team_id, ugid))
+        self.cache.pop(("usergroups.list", self.cfg.team_id))
+        self._member_ids.pop(ugid, None)
 
     def get_members(self, usergroup_id: Optional[str] = None) -> List[Dict[str, str]]:
         """
@@ -92,14 +155,61 @@ class Usergroups(SlackObjectBase):
         For org-wide tokens, ``cfg.team_id`` must be set.
         """
         ugid = self._resolve_usergroup_id(usergroup_id)
-        resp = self._usergroups_users_list(ugid)
-        users = resp.get("users", [])
-        return [{"value": uid, "display": ""} for uid in users]
+        return [{"value": uid, "display": ""} for uid in self._member_user_ids(ugid)]
+
+    def get_member_ids(self, usergroup_id: Optional[str] = None) -> FrozenSet[str]:
+        """
+        Return the usergroup's member user IDs as a frozenset.
+
+        Memoized per usergroup for ``usergroup_ttl`` seconds, so membership checks after the
+        first fetch are O(1). ``get_members()`` keeps the IDP_groups-compatible shape.
+        """
+        ugid = self._resolve_usergroup_id(usergroup_id)
+        entry = self._member_ids.get(ugid)
+        now = time.monotonic()
+        if entry is not None and entry[0] > now:
+            return entry[1]
+        return self._remember_member_ids(ugid, self._member_user_ids(ugid), now)
+
+    def _remember_member_ids(self, ugid: str, users: List[str], now: float) -> FrozenSet[str]:
+        ids = frozenset(users)
+        self._member_ids[ugid] = (now + self.usergroup_ttl, ids)
+        return ids
+
+    def get_member_ids_many(self, usergroup_ids: Iterable[str], *, max_workers: int = 4) -> Dict[str, FrozenSet[str]]:
+        """
+        Return ``{usergroup_id: member user IDs}`` for many usergroups.
+
+        Uncached lists are fetched on up to *max_workers* threads; the API caller still paces
+        them, so the tier's budget is never exceeded, only the idle gaps between calls go away.
+        """
+        wanted = list(dict.fromkeys(ugid for ugid in usergroup_ids if ugid))
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(wanted) or 1))) as pool:
+            return dict(zip(wanted, pool.map(self.get_member_ids, wanted)))
+
+    async def aget_member_ids_many(self, usergroup_ids: Iterable[str], *, concurrency: int = 4) -> Dict[str, FrozenSet[str]]:
+        """
+        asyncio variant of ``get_member_ids_many()``: at most *concurrency* requests are in
+        flight, each paced by the shared limiter. Shares the cache with the sync methods.
+        """
+        wanted = list(dict.fromkeys(ugid for ugid in usergroup_ids if ugid))
+        gate = asyncio.Semaphore(max(1, concurrency))
+
+        async def one(ugid: str) -> FrozenSet[str]:
+            entry = self._member_ids.get(ugid)
+            if entry is not None and entry[0] > time.monotonic():
+                return entry[1]
+            async with gate:
+                users = await self._amember_user_ids(ugid)
+            return self._remember_member_ids(ugid, users, time.monotonic())
+
+        return dict(zip(wanted, await asyncio.gather(*(one(ugid) for ugid in wanted))))
 
     def is_member(self, user_id: str, usergroup_id: Optional[str] = None) -> bool:
-        """Return True if ``user_id`` is a member of the usergroup."""
-        members = self.get_members(usergroup_id=usergroup_id)
-        for member in members:
-            if member.get("value") == user_id:
-                return True
-        return False
\ No newline at end of file
+        """Return True if ``user_id`` is a member of the usergroup (one fetch per ``usergroup_ttl``)."""
+        return user_id in self.get_member_ids(usergroup_id)
+
+    def are_members(self, user_ids: Iterable[str], usergroup_id: Optional[str] = None) -> Dict[str, bool]:
+        """Return ``{user_id: is_member}`` for many users against one usergroup (a single fetch)."""
+        member_ids = self.get_member_ids(usergroup_id)
+        return {uid: uid in member_ids for uid in user_ids}
\ No newline at end of file
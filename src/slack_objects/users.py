@@ -15,16 +15,56 @@ Goals:
 This module intentionally covers only user-related operations and helpers.
 """
 
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
-from typing import Any, Dict, Optional, Sequence, Union, List
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, Iterator, Optional, Sequence, Union, List
 
-import requests
 from slack_sdk.errors import SlackApiError
 
-from .base import SlackObjectBase, safe_error_context
-from .config import RateTier, USER_ID_RE, EMAIL_RE
+from .base import LazyHttpSession, SlackObjectBase, safe_error_context
+from .config import RateTier, is_user_id, is_email
+from . import _json
 from .scim_base import ScimMixin, ScimResponse, validate_scim_id
 
+if TYPE_CHECKING:
+    import requests
+
+# At or above this many IDs, one paginated users.list beats N users.info calls.
+BULK_USERS_LIST_THRESHOLD = 20
+
+# SCIM PATCH bodies that never vary per user, JSON-encoded once at import and keyed by cfg.scim_version.
+_SCIM_REACTIVATE_BODIES = {
+    "v2": _json.dumps({
+        "schemas": ["urn:ietf:params:scim:api:messages:2.0:PatchOp"],
+        "Operations": [{"op": "replace", "path": "active", "value": True}],
+    }),
+    "v1": _json.dumps({
+        "schemas": ["urn:scim:schemas:core:1.0"],
+        "active": True,
+    }),
+}
+_SCIM_MULTI_CHANNEL_GUEST_BODIES = {
+    "v2": _json.dumps({
+        "schemas": ["urn:ietf:params:scim:api:messages:2.0:PatchOp"],
+        "Operations": [
+            {
+                "path": "urn:ietf:params:scim:schemas:extension:slack:guest:2.0:User",
+                "op": "add",
+                "value": {"type": "multi"},
+            }
+        ],
+    }),
+    "v1": _json.dumps({
+        "schemas": [
+            "urn:scim:schemas:core:1.0",
+            "urn:scim:schemas:extension:enterprise:1.0",
+            "urn:scim:schemas:extension:slack:guest:1.0",
+        ],
+        "urn:scim:schemas:extension:slack:guest:1.0": {"type": "multi"},
+    }),
+}
+
+
 @dataclass
 class Users(ScimMixin, SlackObjectBase):
     """
@@ -39,15 +79,22 @@ class Users(ScimMixin, SlackObjectBase):
     - `user_id` is optional. If you call methods that need a user, they will require a bound
       user_id or a passed user_id.
     - `attributes` are loaded lazily via `_require_attributes()` on first access; many helpers read from this cache.
+    - Successful users.info lookups are kept in the shared `cache` for `info_ttl` seconds, so helpers
+      built for the same user (per request, per handler) reuse one call. Writes made through this
+      helper drop the entry; call `invalidate(user_id)` after changing a user some other way.
     """
     user_id: Optional[str] = None
     attributes: Dict[str, Any] = field(default_factory=dict)
 
+    # Lease for cached users.info results; profiles change rarely.
+    info_ttl: float = 1800.0
+
     # Heuristic label used historically to identify contingent workers
     cw_label: str = "[External]"
 
     # Optional requests session (handy for unit tests and connection pooling)
-    scim_session: requests.Session = field(default_factory=requests.Session, repr=False)
+    # None (or a client's LazyHttpSession) until the first SCIM call resolves it (see base.resolve_http_session).
+    scim_session: Optional[Union[requests.Session, LazyHttpSession]] = field(default=None, repr=False)
 
 
     # ---------- factory helpers ----------
@@ -61,24 +108,30 @@ class Users(ScimMixin, SlackObjectBase):
             client=self.client,
             logger=self.logger,
             api=self.api,
+            rate_policy=self.rate_policy,
+            cache=self.cache,
             user_id=user_id,
             scim_session=self.scim_session,
         )
 
     # ---------- attribute lifecycle ----------
 
-    def refresh(self, user_id: Optional[str] = None) -> Dict[str, Any]:
+    def refresh(self, user_id: Optional[str] = None, *, force: bool = False) -> Dict[str, Any]:
         """
         Refresh attributes for user_id (or self.user_id) using users.info.
 
         This method is intentionally layered: it calls `get_user_info()`, which calls the
-        underlying endpoint wrapper.
+        underlying endpoint wrapper. The result may come from the shared users.info cache
+        (up to `info_ttl` old); force=True drops the cached copies first for a hard reload,
+        and the fresh record re-seeds the cache.
         """
         if user_id:
             self.user_id = user_id
         if not self.user_id:
             raise ValueError("refresh() requires user_id (passed or already set)")
 
+        if force:
+            self.invalidate(self.user_id)
         resp = self.get_user_info(self.user_id)
         if not resp.get("ok"):
             raise RuntimeError(f"Users.get_user_info() failed: {safe_error_context(resp)}")
@@ -103,8 +156,15 @@ class Users(ScimMixin, SlackObjectBase):
     # Everything else should call these wrappers.
 
     def _users_info(self, user_id: str) -> Dict[str, Any]:
-        """Wrapper for users.info."""
-        return self.api.call(self.client, "users.info", rate_tier=RateTier.TIER_4, user=user_id)
+        """Wrapper for users.info; bypasses the API caller's cache, since get_user_info() keeps the only copy."""
+        return self.api.call(self.client, "users.info", rate_tier=RateTier.TIER_4, cache=False, user=user_id)
+
+    def _users_list_members(self) -> Iterator[Dict[str, Any]]:
+        """Wrapper for users.list; yields members across all pages."""
+        payload: Dict[str, Any] = {"limit": 200}
+        if self.cfg.team_id:
+            payload["team_id"] = self.cfg.team_id
+        return self.api.paginate(self.client, "users.list", "members", rate_tier=RateTier.TIER_2, **payload)
 
     def _users_lookup_by_email(self, email: str) -> Dict[str, Any]:
         """Wrapper for users.lookupByEmail."""
@@ -185,8 +245,78 @@ class Users(ScimMixin, SlackObjectBase):
     # ============================================================
 
     def get_user_info(self, user_id: str) -> Dict[str, Any]:
-        """Public method for users.info (calls wrapper)."""
-        return self._users_info(user_id)
+        """Public method for users.info (calls wrapper); served from the shared cache for ``info_ttl``."""
+        cached = self.cache.get(("users.info", user_id))
+        if cached is not None:
+            return {"ok": True, "user": _json.loads(cached)}
+        resp = self._users_info(user_id)
+        if resp.get("ok") and resp.get("user"):
+            self._remember_user(user_id, resp["user"])
+        return resp
+
+    def _remember_user(self, user_id: str, user: Dict[str, Any]) -> None:
+        self.cache.set(("users.info", user_id), _json.dumps(user), self.info_ttl)
+
+    def invalidate(self, user_id: Optional[str] = None) -> None:
+        """Drop cached users.info data (and its email mapping) for user_id (or the bound user); call after changing the user."""
+        uid = user_id or self.user_id
+        if not uid:
+            raise ValueError("invalidate requires user_id (passed or bound)")
+        emails = set()
+        cached = self.cache.pop(("users.info", uid))
+        if cached is not None:
+            emails.add((_json.loads(cached).get("profile") or {}).get("email"))
+        # The email entry can outlive the users.info one, so it is also found from its reverse key.
+        mapped = self.cache.pop(("users.lookupByEmail.email", uid))
+        if mapped is not None:
+            emails.add(mapped.decode() if isinstance(mapped, bytes) else mapped)
+        if uid == self.user_id:
+            emails.add((self.attributes.get("profile") or {}).get("email"))
+            self.attributes = {}
+        for email in emails:
+            if email:
+                self.cache.pop(("users.lookupByEmail", email.strip().lower()))
+
+    def get_users_info(self, user_ids: Sequence[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Fetch user objects for many IDs, returned as ``{user_id: user}``.
+
+        Below BULK_USERS_LIST_THRESHOLD IDs this calls users.info per ID. At or above it, it
+        pages through users.list once (stopping as soon as every ID is found) and only falls
+        back to users.info for IDs the listing did not contain. IDs that cannot be found are
+        omitted from the result.
+        """
+        wanted = list(dict.fromkeys(uid for uid in user_ids if uid))
+        found: Dict[str, Dict[str, Any]] = {}
+        for uid in wanted:
+            cached = self.cache.get(("users.info", uid))
+            if cached is not None:
+                found[uid] = _json.loads(cached)
+        wanted = [uid for uid in wanted if uid not in found]
+
+        if len(wanted) >= BULK_USERS_LIST_THRESHOLD:
+            remaining = set(wanted)
+            for member in self._users_list_members():
+                uid = member.get("id")
+                if uid in remaining:
+                    found[uid] = member
+                    self._remember_user(uid, member)
+                    remaining.discard(uid)
+                    if not remaining:
+                        break  # stop paging; dropping the generator cancels any prefetch
+
+        for uid in wanted:
+            if uid in found:
+                continue
+            try:
+                resp = self._users_info(uid)
+            except SlackApiError:
+                continue  # user_not_found and friends
+            if resp.get("ok") and resp.get("user"):
+                found[uid] = resp["user"]
+                self._remember_user(uid, resp["user"])
+
+        return found
 
     def lookup_by_email(self, email: str) -> Dict[str, Any]:
         """Public method for users.lookupByEmail (calls wrapper)."""
@@ -198,14 +328,26 @@ class Users(ScimMixin, SlackObjectBase):
 
         Returns ``""`` on miss (deactivated, not found, or API error) for
         backward compatibility.
+
+        Hits are kept in the shared ``cache`` for ``info_ttl`` seconds (misses are not, so a
+        newly provisioned user is found on the next try), and the returned user record also
+        seeds the users.info entry.
         """
+        key = ("users.lookupByEmail", email.strip().lower())
+        cached = self.cache.get(key)
+        if cached is not None:
+            return cached.decode() if isinstance(cached, bytes) else cached
         try:
             resp = self.lookup_by_email(email)
-            if resp.get("ok"):
-                return (resp.get("user") or {}).get("id", "") or ""
         except SlackApiError:
-            pass  # users_not_found for deactivated / non-existent users
-        return ""
+            return ""  # users_not_found for deactivated / non-existent users
+        user = (resp.get("user") or {}) if resp.get("ok") else {}
+        uid = user.get("id", "") or ""
+        if uid:
+            self.cache.set(key, uid, self.info_ttl)
+            self.cache.set(("users.lookupByEmail.email", uid), key[1], self.info_ttl)
+            self._remember_user(uid, user)
+        return uid
 
     def get_user_profile(self, user_id: Optional[str] = None) -> Dict[str, Any]:
         """Fetch user profile (users.profile.get)."""
@@ -219,7 +361,9 @@ class Users(ScimMixin, SlackObjectBase):
         uid = user_id or self.user_id
         if not uid:
             raise ValueError("set_user_profile_field requires user_id (passed or bound)")
-        return self._users_profile_set_name_value(uid, field_id, new_value)
+        resp = self._users_profile_set_name_value(uid, field_id, new_value)
+        self.invalidate(uid)
+        return resp
 
     # ---------- classification helpers ----------
 
@@ -235,6 +379,11 @@ class Users(ScimMixin, SlackObjectBase):
         attrs = self._require_attributes()
         return bool(attrs.get("is_restricted") or attrs.get("is_ultra_restricted"))
 
+    def is_multi_channel_guest(self) -> bool:
+        """Return True for multi-channel guests (restricted but not ultra-restricted)."""
+        attrs = self._require_attributes()
+        return bool(attrs.get("is_restricted")) and not attrs.get("is_ultra_restricted")
+
     def is_active(self, user_id: Optional[str] = None) -> bool:
         """Return True if the user account is not deactivated (deleted).
 
@@ -289,7 +438,9 @@ class Users(ScimMixin, SlackObjectBase):
             cfg.auth_idp_groups_read_access:  dict[str, list[str]]
             cfg.auth_idp_groups_write_access: dict[str, list[str]]
 
-        This method intentionally delegates all membership checks to IDP_groups.
+        This method intentionally delegates all membership checks to IDP_groups: the user's
+        group IDs are read once (one SCIM call, cached) and intersected with the policy, so
+        the cost does not grow with the number or size of the groups listed.
         """
         if not self.user_id:
             raise ValueError("is_user_authorized requires a bound user_id")
@@ -318,13 +469,12 @@ class Users(ScimMixin, SlackObjectBase):
             client=self.client,
             logger=self.logger,
             api=self.api,
+            rate_policy=self.rate_policy,
+            cache=self.cache,
+            scim_session=self.scim_session,
         )
 
-        for group_id in group_ids:
-            if idp.is_member(user_id=self.user_id, group_id=group_id):
-                return True
-
-        return False
+        return not idp.get_user_group_ids(self.user_id).isdisjoint(group_ids)
 
 
     # ---------- admin api helpers ----------
@@ -367,11 +517,25 @@ class Users(ScimMixin, SlackObjectBase):
 
     def add_to_workspace(self, user_id: str, workspace_id: str) -> Dict[str, Any]:
         """admin.users.assign"""
-        return self._admin_users_assign(user_id=user_id, team_id=workspace_id)
+        resp = self._admin_users_assign(user_id=user_id, team_id=workspace_id)
+        self.invalidate(user_id)
+        return resp
 
     def remove_from_workspace(self, user_id: str, workspace_id: str) -> Dict[str, Any]:
         """admin.users.remove"""
-        return self._admin_users_remove(user_id=user_id, team_id=workspace_id)
+        resp = self._admin_users_remove(user_id=user_id, team_id=workspace_id)
+        self.invalidate(user_id)
+        return resp
+
+    def remove_from_workspaces(self, user_id: str, workspace_ids: Iterable[str], *, max_workers: int = 4) -> Dict[str, Dict[str, Any]]:
+        """
+        admin.users.remove for each workspace; returns ``{workspace_id: response}``.
+
+        See ``_for_each()`` for how the calls are spread over threads and how errors are reported.
+        """
+        results = self._for_each(workspace_ids, lambda ws: self._admin_users_remove(user_id=user_id, team_id=ws), max_workers)
+        self.invalidate(user_id)
+        return results
 
     def add_to_conversation(self, user_ids: Sequence[str], channel_id: str) -> Dict[str, Any]:
         """admin.conversations.invite"""
@@ -381,6 +545,37 @@ class Users(ScimMixin, SlackObjectBase):
         """conversations.kick"""
         return self._conversations_kick(user_id=user_id, channel_id=channel_id)
 
+    def remove_from_conversations(self, user_id: str, channel_ids: Iterable[str], *, max_workers: int = 4) -> Dict[str, Dict[str, Any]]:
+        """
+        conversations.kick for each channel; returns ``{channel_id: response}``.
+
+        See ``_for_each()`` for how the calls are spread over threads and how errors are reported.
+        """
+        return self._for_each(channel_ids, lambda cid: self._conversations_kick(user_id=user_id, channel_id=cid), max_workers)
+
+    def _for_each(
+        self, ids: Iterable[str], call: Callable[[str], Dict[str, Any]], max_workers: int
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Run *call* once per distinct ID on up to *max_workers* threads (inline for a single ID).
+
+        The API caller's shared bucket still paces the method, so the threads only overlap
+        round trips with each other's waits. A SlackApiError for one ID is recorded as its
+        response rather than aborting the rest of the batch.
+        """
+        wanted = list(dict.fromkeys(i for i in ids if i))
+
+        def run(item: str) -> Dict[str, Any]:
+            try:
+                return call(item)
+            except SlackApiError as e:
+                return getattr(e.response, "data", None) or {"ok": False, "error": str(e)}
+
+        if len(wanted) <= 1:
+            return {item: run(item) for item in wanted}
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(wanted)))) as pool:
+            return dict(zip(wanted, pool.map(run, wanted)))
+
     def set_guest_expiration_date(self, expiration_date: str, user_id: Optional[str] = None, workspace_id: str = "") -> Dict[str, Any]:
         """
         Set the expiration date for a guest user (admin.users.setExpiration).
@@ -399,7 +594,9 @@ class Users(ScimMixin, SlackObjectBase):
         from PC_Utils.Datetime import Datetime
 
         expiration_ts = Datetime.date_to_epoch(expiration_date)
-        return self._admin_users_set_expiration(user_id=uid, expiration_ts=expiration_ts, workspace_id=workspace_id)
+        resp = self._admin_users_set_expiration(user_id=uid, expiration_ts=expiration_ts, workspace_id=workspace_id)
+        self.invalidate(uid)
+        return resp
 
 
     # ---------- discovery helper ----------
@@ -501,7 +698,7 @@ class Users(ScimMixin, SlackObjectBase):
     @staticmethod
     def _looks_like_user_id(value: str) -> bool:
         """Return True if *value* matches the Slack user/bot ID pattern (U… or W…)."""
-        return bool(USER_ID_RE.match(value))
+        return is_user_id(value)
 
     @staticmethod
     def _first_scim_user_id(scim_resp: ScimResponse) -> str:
@@ -565,7 +762,7 @@ class Users(ScimMixin, SlackObjectBase):
             raise LookupError(f"No user found for user ID: {identifier}")
 
         # ── 2. Email address ──────────────────────────────────────
-        if EMAIL_RE.match(identifier):
+        if is_email(identifier):
             # Fast path: Web API (active users only)
             uid = self.get_user_id_from_email(identifier)
             if uid:
@@ -621,7 +818,9 @@ class Users(ScimMixin, SlackObjectBase):
     def scim_deactivate_user(self, user_id: str) -> ScimResponse:
         """SCIM DELETE Users/<id>"""
         validate_scim_id(user_id, "user_id")
-        return self._scim_request(path=f"Users/{user_id}", method="DELETE")
+        resp = self._scim_request(path=f"Users/{user_id}", method="DELETE")
+        self.invalidate(user_id)
+        return resp
 
     def scim_reactivate_user(self, user_id: Optional[str] = None) -> ScimResponse:
         """Reactivate a deactivated user via SCIM PATCH Users/<id>."""
@@ -631,20 +830,13 @@ class Users(ScimMixin, SlackObjectBase):
         validate_scim_id(uid, "user_id")
 
         scim_version = self.cfg.scim_version
-        if scim_version == "v2":
-            payload: Dict[str, Any] = {
-                "schemas": ["urn:ietf:params:scim:api:messages:2.0:PatchOp"],
-                "Operations": [{"op": "replace", "path": "active", "value": True}],
-            }
-        elif scim_version == "v1":
-            payload = {
-                "schemas": ["urn:scim:schemas:core:1.0"],
-                "active": True,
-            }
-        else:
+        payload = _SCIM_REACTIVATE_BODIES.get(scim_version)
+        if payload is None:
             raise NotImplementedError(f"Invalid SCIM version: {scim_version}")
 
-        return self._scim_request(path=f"Users/{uid}", method="PATCH", payload=payload)
+        resp = self._scim_request(path=f"Users/{uid}", method="PATCH", payload=payload)
+        self.invalidate(uid)
+        return resp
 
     def scim_update_user_attribute(
         self,
@@ -675,7 +867,9 @@ class Users(ScimMixin, SlackObjectBase):
         else:
             raise NotImplementedError(f"Invalid SCIM version: {scim_version}")
 
-        return self._scim_request(path=f"Users/{uid}", method="PATCH", payload=payload)
+        resp = self._scim_request(path=f"Users/{uid}", method="PATCH", payload=payload)
+        self.invalidate(uid)
+        return resp
 
     def scim_update_email(
         self,
@@ -720,37 +914,27 @@ class Users(ScimMixin, SlackObjectBase):
         else:
             raise NotImplementedError(f"Invalid SCIM version: {scim_version}")
 
-        return self._scim_request(path=f"Users/{uid}", method="PATCH", payload=payload)
+        resp = self._scim_request(path=f"Users/{uid}", method="PATCH", payload=payload)
+        self.invalidate(uid)
+        return resp
 
     def make_multi_channel_guest(self, user_id: Optional[str] = None) -> ScimResponse:
-        """Convert a user to a multi-channel guest via SCIM PATCH."""
+        """
+        Convert a user to a multi-channel guest via SCIM PATCH.
+
+        Always sends the PATCH. Callers that want idempotent re-runs can check
+        ``is_multi_channel_guest()`` first (after ``refresh(force=True)`` if the record may be stale).
+        """
         uid = user_id or self.user_id
         if not uid:
             raise ValueError("make_multi_channel_guest requires user_id (passed or bound)")
         validate_scim_id(uid, "user_id")
 
         scim_version = self.cfg.scim_version
-        if scim_version == "v2":
-            payload = {
-                "schemas": ["urn:ietf:params:scim:api:messages:2.0:PatchOp"],
-                "Operations": [
-                    {
-                        "path": "urn:ietf:params:scim:schemas:extension:slack:guest:2.0:User",
-                        "op": "add",
-                        "value": {"type": "multi"},
-                    }
-                ],
-            }
-        elif scim_version == "v1":
-            payload = {
-                "schemas": [
-                    "urn:scim:schemas:core:1.0",
-                    "urn:scim:schemas:extension:enterprise:1.0",
-                    "urn:scim:schemas:extension:slack:guest:1.0",
-                ],
-                "urn:scim:schemas:extension:slack:guest:1.0": {"type": "multi"},
-            }
-        else:
+        payload = _SCIM_MULTI_CHANNEL_GUEST_BODIES.get(scim_version)
+        if payload is None:
             raise NotImplementedError(f"Invalid SCIM version: {scim_version}")
 
-        return self._scim_request(path=f"Users/{uid}", method="PATCH", payload=payload)
+        resp = self._scim_request(path=f"Users/{uid}", method="PATCH", payload=payload)
+        self.invalidate(uid)
+        return resp
@@ -53,6 +53,8 @@ class Workspaces(SlackObjectBase):
             client=self.client,
             logger=self.logger,
             api=self.api,
+            rate_policy=self.rate_policy,
+            cache=self.cache,
             workspace_id=workspace_id,
             workspaces_cache=self.workspaces_cache,
         )
@@ -124,25 +126,7 @@ class Workspaces(SlackObjectBase):
         if self.workspaces_cache and not force_refresh:
             return self.workspaces_cache
 
-        workspaces: List[Dict[str, Any]] = []
-        payload: Dict[str, Any] = {}
-
-        while True:
-            resp = self._admin_teams_list(payload)
-            if not resp.get("ok"):
-                raise RuntimeError(f"admin.teams.list failed: {resp}")
-
-            teams = resp.get("teams") or []
-            workspaces.extend(teams)
-
-            # Slack commonly returns cursor pagination via response_metadata.next_cursor
-            meta = resp.get("response_metadata") or {}
-            cursor = meta.get("next_cursor") or ""
-            if cursor:
-                payload["cursor"] = cursor
-            else:
-                break
-
+        workspaces = list(self._paginate(self._admin_teams_list, {}, items_key="teams", method="admin.teams.list"))
         self.workspaces_cache = workspaces
         return workspaces
 
@@ -214,24 +198,7 @@ class Workspaces(SlackObjectBase):
         """
         wid = self._require_workspace_id(workspace_id)
 
-        payload: Dict[str, Any] = {"team_id": wid}
-        users: List[Dict[str, Any]] = []
-
-        while True:
-            resp = self._admin_users_list(payload)
-            if not resp.get("ok"):
-                raise RuntimeError(f"admin.users.list failed: {resp}")
-
-            users.extend(resp.get("users") or [])
-
-            meta = resp.get("response_metadata") or {}
-            cursor = meta.get("next_cursor") or ""
-            if cursor:
-                payload["cursor"] = cursor
-            else:
-                break
-
-        return users
+        return list(self._paginate(self._admin_users_list, {"team_id": wid}, items_key="users", method="admin.users.list"))
 
     def list_admin_ids(self, workspace_id: Optional[str] = None) -> List[str]:
         """
@@ -241,21 +208,5 @@ class Workspaces(SlackObjectBase):
         """
         wid = self._require_workspace_id(workspace_id)
 
-        payload: Dict[str, Any] = {"team_id": wid}
-        admin_ids: List[str] = []
-
-        while True:
-            resp = self._admin_teams_admins_list(payload)
-            if not resp.get("ok"):
-                raise RuntimeError(f"admin.teams.admins.list failed: {resp}")
-
-            admin_ids.extend([str(x) for x in (resp.get("admin_ids") or [])])
-
-            meta = resp.get("response_metadata") or {}
-            cursor = meta.get("next_cursor") or ""
-            if cursor:
-                payload["cursor"] = cursor
-            else:
-                break
-
-        return admin_ids
+        admin_ids = self._paginate(self._admin_teams_admins_list, {"team_id": wid}, items_key="admin_ids", method="admin.teams.admins.list")
+        return [str(x) for x in admin_ids]
@@ -15,6 +15,7 @@ Run any smoke test:
 
 from __future__ import annotations
 
+import json
 from dataclasses import dataclass
 from typing import Any, Callable, Dict, List, Optional, Tuple
 
@@ -222,12 +223,18 @@ class FakeApiCaller:
 class FakeHttpSession:
     """Used by Files._http_get_private_url -> http_session.get()."""
 
-    def get(self, url: str, headers: Optional[Dict[str, str]] = None, timeout: Optional[int] = None):
+    def get(self, url: str, headers: Optional[Dict[str, str]] = None, timeout: Optional[int] = None, stream: bool = False):
         class Resp:
             ok = True
             status_code = 200
             text = "ok"
             content = b"hello from fake download\n"
+
+            def iter_content(self, chunk_size: int = 1):
+                yield self.content
+
+            def close(self):
+                pass
         return Resp()
 
 
@@ -243,7 +250,7 @@ class FakeScimSession:
     """
 
     def request(self, method: str, url: str, **kwargs):
-        # kwargs may include: headers, params, json, data, timeout, etc.
+        # kwargs may include: headers, params, data (JSON-encoded body), timeout, etc.
         params = kwargs.get("params") or {}
 
         class Resp:
@@ -251,7 +258,8 @@ class FakeScimSession:
                 self._payload = payload
                 self.status_code = status
                 self.ok = True
-                self.text = "json"
+                self.content = json.dumps(payload).encode("utf-8")
+                self.text = self.content.decode("utf-8")
 
             def raise_for_status(self):
                 return None
@@ -8,15 +8,28 @@ Validates:
 - 429 retries succeed after transient rate-limits
 - 429 retries give up after MAX_RETRIES
 - Malformed Retry-After header falls back gracefully
+- HTTP-date Retry-After header is honored
+- Backoff never retries earlier than Retry-After (or X-RateLimit-Reset when that is all we get)
 - use_json flag is preserved across retries
+- Cacheable reads are served from the response cache; writes are not cached
+- paginate() follows cursors (nested or top-level) and yields every item
+- Real WebClients are dispatched to the SDK's typed methods when possible
+- Tier resolution is memoized per method
+- Stale entries are served while a background call refreshes them
+- Concurrent identical reads share one in-flight request (single-flight)
 """
 
 import logging
+import threading
 import time
+from email.utils import format_datetime
+from datetime import datetime, timedelta, timezone
 from typing import Any, Dict, Optional
 
+from slack_sdk import WebClient
+
 from slack_objects.config import SlackObjectsConfig, RateTier
-from slack_objects.api_caller import SlackApiCaller
+from slack_objects.api_caller import SlackApiCaller, parse_retry_after, retry_after_seconds
 
 from tests.Smoke._smoke_harness import CallSpec, run_smoke
 
@@ -80,6 +93,39 @@ class RateLimitingClient:
         return FakeSlackResponse({"ok": True, "method": method})
 
 
+class PagingClient:
+    """A fake WebClient serving `pages` in order, linked by cursors."""
+    def __init__(self, pages, top_level_cursor: bool = False):
+        self.pages = pages
+        self.top_level_cursor = top_level_cursor
+        self.cursors_seen = []
+
+    def api_call(self, method: str, json: Optional[Dict[str, Any]] = None,
+                 params: Optional[Dict[str, Any]] = None) -> FakeSlackResponse:
+        payload = json if json is not None else params
+        cursor = payload.get("cursor", "")
+        self.cursors_seen.append(cursor)
+        index = int(cursor or 0)
+        nxt = str(index + 1) if index + 1 < len(self.pages) else ""
+        data: Dict[str, Any] = {"ok": True, "members": self.pages[index]}
+        if self.top_level_cursor:
+            data["next_cursor"] = nxt
+        else:
+            data["response_metadata"] = {"next_cursor": nxt}
+        return FakeSlackResponse(data)
+
+
+class RecordingWebClient(WebClient):
+    """A real WebClient whose transport is replaced by a recorder, so typed methods run as-is."""
+    def __init__(self):
+        super().__init__(token="xoxb-fake")
+        self.calls = []
+
+    def api_call(self, api_method: str, *, http_verb: str = "POST", json=None, params=None, **kwargs):
+        self.calls.append((api_method, http_verb, json, params))
+        return FakeSlackResponse({"ok": True, "method": api_method})
+
+
 # ---------------------------------------------------------------------------
 # Test helpers
 # ---------------------------------------------------------------------------
@@ -136,6 +182,37 @@ def test_malformed_retry_after_header() -> None:
     assert result["ok"] is True, f"Expected graceful fallback, got {result}"
 
 
+def test_http_date_retry_after() -> None:
+    when = datetime.now(timezone.utc) + timedelta(seconds=30)
+    seconds = parse_retry_after(format_datetime(when, usegmt=True))
+    assert seconds is not None and 25 <= seconds <= 30, f"Expected ~30s, got {seconds}"
+    assert parse_retry_after("12") == 12.0
+    assert parse_retry_after("garbage") is None
+    assert parse_retry_after(None) is None
+
+
+def test_backoff_respects_retry_after() -> None:
+    slept = []
+    patched_sleep = time.sleep
+    time.sleep = slept.append
+    try:
+        caller = _make_caller()
+        client = RateLimitingClient(fail_count=3, retry_after="7")
+        caller.call(client, "users.info", user="U1")
+    finally:
+        time.sleep = patched_sleep
+    # The backoff drains the shared bucket, so each retry's acquire() does the waiting,
+    # counted from the 429 (less the few ms spent between the two).
+    assert len(slept) == 3, f"Expected one sleep per retry, got {slept}"
+    assert all(s >= 6.9 for s in slept), f"Retried earlier than Retry-After: {slept}"
+
+
+def test_backoff_falls_back_to_ratelimit_reset() -> None:
+    assert retry_after_seconds({"Retry-After": "4", "X-RateLimit-Reset": "60"}) == 4.0
+    assert retry_after_seconds({"X-RateLimit-Reset": "9"}) == 9.0
+    assert retry_after_seconds(None) is None
+
+
 def test_use_json_preserved_across_retries() -> None:
     caller = _make_caller()
     client = RateLimitingClient(fail_count=2, retry_after="0")
@@ -145,6 +222,133 @@ def test_use_json_preserved_across_retries() -> None:
     )
 
 
+def test_cached_read_skips_api_call() -> None:
+    caller = _make_caller()
+    client = RateLimitingClient(fail_count=0)
+    first = caller.call(client, "users.info", user="U1")
+    first["mutated"] = True  # callers must not be able to poison the cache
+    second = caller.call(client, "users.info", user="U1")
+    assert client.call_count == 1, f"Expected one API call, got {client.call_count}"
+    assert "mutated" not in second, f"Cached response was mutated: {second}"
+    caller.call(client, "users.info", user="U2")
+    assert client.call_count == 2, "Different kwargs must not share a cache entry"
+
+
+def test_cache_bypass_and_invalidate() -> None:
+    caller = _make_caller()
+    client = RateLimitingClient(fail_count=0)
+    caller.call(client, "users.info", user="U1")
+    caller.call(client, "users.info", cache=False, user="U1")
+    assert client.call_count == 2, f"cache=False should force a fresh read, got {client.call_count}"
+    caller.invalidate("users.info", user="U1")
+    caller.call(client, "users.info", user="U1")
+    assert client.call_count == 3, f"invalidate() should drop the entry, got {client.call_count}"
+
+
+def test_writes_are_not_cached() -> None:
+    caller = _make_caller()
+    client = RateLimitingClient(fail_count=0)
+    caller.call(client, "chat.postMessage", channel="C1", text="hi")
+    caller.call(client, "chat.postMessage", channel="C1", text="hi")
+    assert client.call_count == 2, f"Writes must always reach Slack, got {client.call_count}"
+
+
+def test_paginate_follows_cursors() -> None:
+    caller = _make_caller()
+    client = PagingClient([["U1", "U2"], ["U3"], ["U4", "U5"]])
+    items = list(caller.paginate(client, "conversations.members", "members", channel="C1"))
+    assert items == ["U1", "U2", "U3", "U4", "U5"], f"Unexpected items: {items}"
+    assert client.cursors_seen == ["", "1", "2"], f"Unexpected cursors: {client.cursors_seen}"
+
+
+def test_paginate_top_level_cursor() -> None:
+    caller = _make_caller()
+    client = PagingClient([[{"id": "C1"}], [{"id": "C2"}]], top_level_cursor=True)
+    items = list(caller.paginate(client, "admin.conversations.search", "members", query="x"))
+    assert [i["id"] for i in items] == ["C1", "C2"], f"Unexpected items: {items}"
+
+
+def test_typed_method_dispatch() -> None:
+    caller = _make_caller()
+    client = RecordingWebClient()
+    caller.call(client, "conversations.kick", channel="C1", user="U1")
+    method, verb, _, params = client.calls[-1]
+    assert method == "conversations.kick" and params == {"channel": "C1", "user": "U1"}, client.calls
+    # users.info is a GET in the SDK; the generic path would have POSTed
+    caller.call(client, "users.info", user="U1")
+    assert client.calls[-1][1] == "GET", f"Expected typed users_info (GET), got {client.calls[-1]}"
+    # Missing a required argument falls back to the generic api_call
+    caller.call(client, "users.info", cache=False)
+    assert client.calls[-1][1] == "POST", f"Expected generic api_call, got {client.calls[-1]}"
+
+
+def test_tier_lookup_memoized() -> None:
+    caller = _make_caller()
+    client = RateLimitingClient(fail_count=0)
+    resolved = []
+    tier_for = caller.policy.tier_for
+    caller.policy = type("Policy", (), {"tier_for": lambda _, m: resolved.append(m) or tier_for(m)})()
+    for _ in range(3):
+        caller.call(client, "chat.postMessage", channel="C1", text="hi")
+    assert resolved == ["chat.postMessage"], f"Expected a single policy lookup, got {resolved}"
+    assert caller._tier_lut["chat.postMessage"] == tier_for("chat.postMessage")
+
+
+def test_stale_while_revalidate() -> None:
+    cfg = SlackObjectsConfig(bot_token="xoxb-fake", default_rate_tier=RateTier.TIER_4)
+    caller = SlackApiCaller(cfg, cache_ttls={"team.info": 0.01}, stale_ttls={"team.info": 60.0})
+    caller.limiter.acquire = lambda *_: 0.0
+    client = RateLimitingClient(fail_count=0)
+    caller.call(client, "team.info")
+    _original_sleep(0.02)  # let the entry go stale
+
+    result = caller.call(client, "team.info")
+    assert result["ok"] is True, f"Expected the stale copy, got {result}"
+    for _ in range(100):  # wait for the background refresh
+        if client.call_count == 2:
+            break
+        _original_sleep(0.01)
+    assert client.call_count == 2, f"Expected one background refresh, got {client.call_count} calls"
+
+
+class BlockingClient:
+    """A fake WebClient whose api_call blocks until released, to hold a request in flight."""
+    def __init__(self):
+        self.call_count = 0
+        self.entered = threading.Event()
+        self.release = threading.Event()
+
+    def api_call(self, method: str, json: Optional[Dict[str, Any]] = None,
+                 params: Optional[Dict[str, Any]] = None) -> FakeSlackResponse:
+        self.call_count += 1
+        self.entered.set()
+        self.release.wait(timeout=5)
+        return FakeSlackResponse({"ok": True, "method": method})
+
+
+def test_single_flight() -> None:
+    caller = _make_caller()
+    client = BlockingClient()
+    results = []
+
+    def read() -> None:
+        results.append(caller.call(client, "users.info", user="U1"))
+
+    leader = threading.Thread(target=read)
+    leader.start()
+    client.entered.wait(timeout=5)
+    follower = threading.Thread(target=read)
+    follower.start()
+    _original_sleep(0.05)  # let the follower find the in-flight request
+    client.release.set()
+    leader.join(timeout=5)
+    follower.join(timeout=5)
+
+    assert client.call_count == 1, f"Expected one shared request, got {client.call_count}"
+    assert len(results) == 2 and all(r["ok"] for r in results), f"Unexpected results: {results}"
+    assert results[0] is not results[1], "Each caller must get its own copy"
+
+
 def main() -> None:
     logging.basicConfig(level=logging.INFO)
 
@@ -153,7 +357,19 @@ def main() -> None:
         CallSpec("retry 3x then succeed", test_retry_then_succeed),
         CallSpec("give up after MAX_RETRIES", test_retry_exceeds_max),
         CallSpec("malformed Retry-After falls back", test_malformed_retry_after_header),
+        CallSpec("HTTP-date Retry-After parsed", test_http_date_retry_after),
+        CallSpec("backoff respects Retry-After", test_backoff_respects_retry_after),
+        CallSpec("backoff falls back to X-RateLimit-Reset", test_backoff_falls_back_to_ratelimit_reset),
         CallSpec("use_json preserved across retries", test_use_json_preserved_across_retries),
+        CallSpec("cached read skips API call", test_cached_read_skips_api_call),
+        CallSpec("cache bypass and invalidate", test_cache_bypass_and_invalidate),
+        CallSpec("writes are not cached", test_writes_are_not_cached),
+        CallSpec("paginate follows cursors", test_paginate_follows_cursors),
+        CallSpec("paginate top-level cursor", test_paginate_top_level_cursor),
+        CallSpec("typed SDK method dispatch", test_typed_method_dispatch),
+        CallSpec("tier lookup memoized", test_tier_lookup_memoized),
+        CallSpec("stale-while-revalidate", test_stale_while_revalidate),
+        CallSpec("single-flight for identical reads", test_single_flight),
     ]
 
     try:
@@ -0,0 +1,127 @@
+from __future__ import annotations
+
+"""
+Smoke tests for AsyncSlackApiCaller.
+
+Validates:
+- Normal awaited calls succeed
+- 429 retries succeed after transient rate-limits, sleeping via asyncio.sleep
+- 429 retries give up after MAX_RETRIES
+- Concurrent calls to different methods do not wait on each other
+"""
+
+import asyncio
+import logging
+from typing import Any, Dict, Optional
+
+import slack_sdk.errors as sdk_errors
+
+from slack_objects.config import SlackObjectsConfig, RateTier
+from slack_objects.async_api_caller import AsyncSlackApiCaller
+
+from tests.Smoke._smoke_harness import CallSpec, run_smoke
+
+
+class FakeSlackResponse:
+    """Mimics slack_sdk.web.async_slack_response.AsyncSlackResponse enough for AsyncSlackApiCaller."""
+    def __init__(self, data: Dict[str, Any]):
+        self.data = data
+        self.status_code = 200
+
+
+class AsyncRateLimitingClient:
+    """A fake AsyncWebClient that returns 429 for the first `fail_count` calls, then succeeds."""
+    def __init__(self, fail_count: int = 0):
+        self.fail_count = fail_count
+        self.call_count = 0
+
+    async def api_call(self, method: str, json: Optional[Dict[str, Any]] = None,
+                       params: Optional[Dict[str, Any]] = None) -> FakeSlackResponse:
+        self.call_count += 1
+        if self.call_count <= self.fail_count:
+            raise sdk_errors.SlackApiError(
+                message="HTTP 429",
+                response=type("Resp", (), {
+                    "status_code": 429,
+                    "headers": {"Retry-After": "1"},
+                    "data": {"ok": False},
+                })(),
+            )
+        return FakeSlackResponse({"ok": True, "method": method})
+
+
+def _make_caller() -> AsyncSlackApiCaller:
+    cfg = SlackObjectsConfig(bot_token="xoxb-fake", default_rate_tier=RateTier.TIER_4)
+    return AsyncSlackApiCaller(cfg)
+
+
+def _run(coro, sleeps: Optional[list] = None):
+    """Run *coro* with asyncio.sleep replaced by a recorder, so specs are instant."""
+    real_sleep = asyncio.sleep
+
+    async def fake_sleep(seconds, *args, **kwargs):
+        if sleeps is not None:
+            sleeps.append(seconds)
+        await real_sleep(0)
+
+    asyncio.sleep = fake_sleep
+    try:
+        return asyncio.run(coro)
+    finally:
+        asyncio.sleep = real_sleep
+
+
+def test_normal_call() -> None:
+    client = AsyncRateLimitingClient()
+    result = _run(_make_caller().call(client, "users.info", user="U1"))
+    assert result == {"ok": True, "method": "users.info"}, f"Unexpected result: {result}"
+
+
+def test_retry_then_succeed() -> None:
+    sleeps: list = []
+    client = AsyncRateLimitingClient(fail_count=2)
+    result = _run(_make_caller().call(client, "users.info", user="U1"), sleeps)
+    assert result["ok"] is True
+    assert client.call_count == 3, f"Expected 3 calls, got {client.call_count}"
+    assert sleeps and all(s >= 0 for s in sleeps), f"Expected asyncio sleeps, got {sleeps}"
+
+
+def test_retry_exceeds_max() -> None:
+    client = AsyncRateLimitingClient(fail_count=99)
+    try:
+        _run(_make_caller().call(client, "users.info", user="U1"))
+        raise AssertionError("Expected RuntimeError after MAX_RETRIES")
+    except RuntimeError as e:
+        assert "Rate-limited" in str(e), f"Unexpected error message: {e}"
+        assert client.call_count == 6, f"Expected 6 calls, got {client.call_count}"
+
+
+def test_concurrent_methods_do_not_wait() -> None:
+    sleeps: list = []
+    caller = _make_caller()
+    client = AsyncRateLimitingClient()
+
+    async def fan_out():
+        return await asyncio.gather(*(
+            caller.call(client, method) for method in ("users.info", "conversations.info", "team.info")
+        ))
+
+    results = _run(fan_out(), sleeps)
+    assert [r["method"] for r in results] == ["users.info", "conversations.info", "team.info"]
+    assert sleeps == [], f"Different methods have separate budgets; got sleeps {sleeps}"
+
+
+def main() -> None:
+    logging.basicConfig(level=logging.INFO)
+
+    specs = [
+        CallSpec("async normal call succeeds", test_normal_call),
+        CallSpec("async retry then succeed", test_retry_then_succeed),
+        CallSpec("async give up after MAX_RETRIES", test_retry_exceeds_max),
+        CallSpec("async concurrent methods do not wait", test_concurrent_methods_do_not_wait),
+    ]
+    run_smoke("AsyncSlackApiCaller smoke (retry & rate-limit)", specs)
+
+
+if __name__ == "__main__":
+    main()
@@ -23,6 +23,7 @@ def main() -> None:
         CallSpec("with_conversation()", lambda: convos.with_conversation("C1")),
         CallSpec("refresh()", lambda: bound.refresh()),
         CallSpec("get_conversation_info()", lambda: bound.get_conversation_info("C1")),
+        CallSpec("prefetch()", lambda: convos.prefetch(["C1", "C2"])),
         CallSpec("is_private()", lambda: (bound.refresh(), bound.is_private())),
         CallSpec("get_conversation_name(bound)", lambda: (bound.refresh(), bound.get_conversation_name())),
         CallSpec("get_conversation_name(by id)", lambda: bound.get_conversation_name(channel_id="C1")),
@@ -33,11 +34,13 @@ def main() -> None:
         CallSpec("archive()", lambda: bound.archive()),
         CallSpec("share_to_workspaces()", lambda: bound.share_to_workspaces("T2", source_ws_id="T1")),
         CallSpec("move_to_workspace()", lambda: bound.move_to_workspace(channel_id="C1", source_ws_id="T1", target_ws_id="T2")),
+        CallSpec("move_many_to_workspace()", lambda: bound.move_many_to_workspace(["C1", "C2"], "T1", "T2")),
         CallSpec(
             "restrict_access_add_group()",
             lambda: bound.restrict_access_add_group(channel_id="C1", group_id="G1", workspace_id="T1"),
         ),
         CallSpec("get_members()", lambda: bound.get_members(workspace_id="T1", include_members_who_left=True)),
+        CallSpec("iter_members()", lambda: list(bound.iter_members(workspace_id="T1"))),
         CallSpec("messages() helper", lambda: bound.messages()),
         CallSpec("get_messages() delegates to Messages", lambda: bound.get_messages(limit=2)),
         CallSpec("get_message_threads() delegates to Messages", lambda: bound.get_message_threads(thread_ts="1700000000.000100", limit=10)),
@@ -54,6 +54,7 @@ def main() -> None:
         CallSpec("is_member(hit)", lambda: idp.is_member(user_id="U1", group_id="G1")),
         CallSpec("is_member(miss)", lambda: idp.is_member(user_id="U_UNKNOWN", group_id="G1")),
         CallSpec("is_member(bound)", lambda: bound.is_member(user_id="U2")),
+        CallSpec("are_members()", lambda: bound.are_members(["U1", "U2", "U_UNKNOWN"])),
     ]
 
     run_smoke("IDP_groups smoke (all public methods)", specs)
@@ -14,6 +14,7 @@ from tests.Smoke.files_smoke_test import main as files_main
 from tests.Smoke.idp_groups_smoke_test import main as idp_main
 from tests.Smoke.workspaces_smoke_test import main as workspaces_main
 from tests.Smoke.api_caller_smoke_test import main as api_caller_main
+from tests.Smoke.async_api_caller_smoke_test import main as async_api_caller_main
 from tests.Smoke.security_smoke_test import main as security_main
 from tests.Smoke.usergroups_smoke_test import main as usergroups_main
 
@@ -26,6 +27,7 @@ def main() -> None:
     idp_main()
     workspaces_main()
     api_caller_main()
+    async_api_caller_main()
     security_main()
     usergroups_main()
     print("\n✅ All smoke tests completed successfully.")
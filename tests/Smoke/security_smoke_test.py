@@ -38,7 +38,7 @@ def test_path_traversal_rejected() -> None:
 
 def test_empty_and_whitespace_rejected() -> None:
     """Empty strings and whitespace must raise ValueError."""
-    for bad in ("", " ", "U1 U2", "G1\nG2"):
+    for bad in ("", " ", "U1 U2", "G1\nG2", "U123\n"):
         try:
             validate_scim_id(bad, "test_id")
             raise AssertionError(f"Expected ValueError for {bad!r}")
@@ -0,0 +1,158 @@
+# tests/UnitTests/cache_unit_test.py
+"""
+Unit tests for TTLCache expiry, stale windows, LRU eviction, and per-entry TTL overrides,
+plus the RedisCache adapter against an in-memory stand-in for redis.Redis.
+"""
+
+import pytest
+
+from slack_objects import cache
+from slack_objects.cache import RedisCache, TTLCache
+
+
+class FakeClock:
+    """Deterministic stand-in for time.monotonic."""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def monotonic(self) -> float:
+        return self.now
+
+
+@pytest.fixture()
+def clock(monkeypatch) -> FakeClock:
+    fake = FakeClock()
+    monkeypatch.setattr(cache.time, "monotonic", fake.monotonic)
+    return fake
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# 1.  Expiry
+# ═══════════════════════════════════════════════════════════════════════════
+
+class TestExpiry:
+    """Entries are served until their TTL elapses, then dropped."""
+
+    def test_hit_before_expiry(self, clock):
+        c = TTLCache(ttl=10.0)
+        c.set("k", "v")
+        clock.now += 9.0
+        assert c.get("k") == "v"
+
+    def test_miss_after_expiry(self, clock):
+        c = TTLCache(ttl=10.0)
+        c.set("k", "v")
+        clock.now += 10.0
+        assert c.get("k", "default") == "default"
+        assert len(c) == 0
+
+    def test_per_entry_ttl_override(self, clock):
+        c = TTLCache(ttl=10.0)
+        c.set("short", 1, ttl=1.0)
+        c.set("long", 2)
+        clock.now += 5.0
+        assert c.get("short") is None
+        assert c.get("long") == 2
+
+
+    def test_stale_window(self, clock):
+        """get_stale() keeps serving an expired entry until its stale window ends."""
+        c = TTLCache(ttl=10.0)
+        c.set("k", "v", stale_ttl=5.0)
+        assert c.get_stale("k") == ("v", True)
+        clock.now += 12.0
+        assert c.get("k") is None  # plain get() never returns stale data
+        assert c.get_stale("k") == ("v", False)
+        clock.now += 3.0
+        assert c.get_stale("k", "default") == ("default", False)
+        assert len(c) == 0
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# 2.  Eviction and removal
+# ═══════════════════════════════════════════════════════════════════════════
+
+class TestEviction:
+    """Least recently used entries go first once maxsize is exceeded."""
+
+    def test_evicts_least_recently_used(self, clock):
+        c = TTLCache(maxsize=2)
+        c.set("a", 1)
+        c.set("b", 2)
+        c.get("a")  # "b" is now the least recently used
+        c.set("c", 3)
+        assert c.get("b") is None
+        assert c.get("a") == 1
+        assert c.get("c") == 3
+
+    def test_pop_and_clear(self, clock):
+        c = TTLCache()
+        c.set("a", 1)
+        c.set("b", 2)
+        assert c.pop("a") == 1
+        assert c.pop("a", "gone") == "gone"
+        c.clear()
+        assert len(c) == 0
+
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# 3.  RedisCache adapter
+# ═══════════════════════════════════════════════════════════════════════════
+
+class FakeRedis:
+    """The handful of redis.Redis methods RedisCache uses, backed by a dict (expiry recorded, not enforced)."""
+
+    def __init__(self):
+        self.data = {}
+        self.px = {}
+
+    def get(self, name):
+        return self.data.get(name)
+
+    def set(self, name, value, px=None):
+        self.data[name] = value.encode() if isinstance(value, str) else value
+        self.px[name] = px
+
+    def delete(self, *names):
+        for name in names:
+            self.data.pop(name, None)
+
+    def scan_iter(self, match):
+        prefix = match.rstrip("*")
+        return iter([k for k in self.data if k.startswith(prefix)])
+
+
+class TestRedisCache:
+    """Same interface as TTLCache; keys are namespaced strings and values must be pre-encoded."""
+
+    def test_round_trip_and_ttl(self):
+        r = FakeRedis()
+        c = RedisCache(r, ttl=300.0)
+        c.set(("conversations.info", "C1"), b"{}", 12.5)
+        assert r.px == {"slack-objects:conversations.info:C1": 12500}
+        assert c.get(("conversations.info", "C1")) == b"{}"
+        assert c.get_stale(("conversations.info", "C1")) == (b"{}", True)
+        assert c.get_stale("missing", "d") == ("d", False)
+
+    def test_none_key_parts_and_pop(self):
+        c = RedisCache(FakeRedis())
+        c.set(("admin.conversations.search", "general", None), b"[]")
+        assert c.pop(("admin.conversations.search", "general", None)) == b"[]"
+        assert c.pop(("admin.conversations.search", "general", None), "gone") == "gone"
+
+    def test_rejects_unencoded_values(self):
+        with pytest.raises(TypeError):
+            RedisCache(FakeRedis()).set("k", {"ok": True})
+
+    def test_clear_only_touches_prefix(self):
+        r = FakeRedis()
+        r.set("other:key", b"keep")
+        c = RedisCache(r)
+        c.set("a", b"1")
+        c.set("b", b"2")
+        assert len(c) == 2
+        c.clear()
+        assert len(c) == 0
+        assert r.get("other:key") == b"keep"
@@ -1,6 +1,9 @@
+import asyncio
 import unittest
 from typing import Any, Dict
 
+from slack_sdk.errors import SlackApiError
+
 from slack_objects.conversations import Conversations
 from slack_objects.config import SlackObjectsConfig, CONVERSATION_ID_RE
 
@@ -38,6 +41,13 @@ class FakeApiCaller:
         return client.api_call(method, json=kwargs)
 
 
+class FakeAsyncApiCaller:
+    """A fake AsyncSlackApiCaller that awaits nothing and calls the (sync) fake client directly."""
+    async def call(self, client, method: str, *, rate_tier=None, **kwargs):
+        await asyncio.sleep(0)
+        return client.api_call(method, json=kwargs)
+
+
 class ConversationsTests(unittest.TestCase):
     def test_refresh_and_is_private(self):
         cfg = SlackObjectsConfig(bot_token="xoxb-test")  # minimal
@@ -46,6 +56,23 @@ class ConversationsTests(unittest.TestCase):
         self.assertEqual(conv.get_conversation_name(), "general")
         self.assertFalse(conv.is_private())
 
+    def test_attributes_unloaded_until_refresh(self):
+        cfg = SlackObjectsConfig(bot_token="xoxb-test")
+        client = FakeClient()
+        conv = Conversations(cfg=cfg, client=client, logger=None, api=FakeApiCaller(), channel_id="C123")
+        self.assertIsNone(conv.attributes)
+        self.assertEqual(client.calls, [])
+        self.assertFalse(conv.is_private())
+        self.assertEqual(conv.attributes["id"], "C123")
+
+    def test_is_private_by_id_prefix_skips_lookup(self):
+        cfg = SlackObjectsConfig(bot_token="xoxb-test")
+        client = FakeClient()
+        for cid in ("G0123ABCD", "D0123ABCD"):
+            conv = Conversations(cfg=cfg, client=client, logger=None, api=FakeApiCaller(), channel_id=cid)
+            self.assertTrue(conv.is_private())
+        self.assertEqual(client.calls, [])
+
     def test_get_messages(self):
         cfg = SlackObjectsConfig(bot_token="xoxb-test")
         conv = Conversations(cfg=cfg, client=FakeClient(), logger=None, api=FakeApiCaller(), channel_id="C123")
@@ -53,6 +80,18 @@ class ConversationsTests(unittest.TestCase):
         self.assertEqual(len(msgs), 1)
         self.assertEqual(msgs[0]["text"], "hello")
 
+    def test_messages_helper_reused_per_channel(self):
+        cfg = SlackObjectsConfig(bot_token="xoxb-test")
+        conv = Conversations(cfg=cfg, client=FakeClient(), logger=None, api=FakeApiCaller(), channel_id="C123")
+        conv.get_messages()
+        helper = conv._messages_helper
+        conv.get_messages()
+        self.assertIs(conv._messages_helper, helper)
+        conv.get_messages(channel_id="C999")
+        self.assertEqual(conv._messages_helper.channel_id, "C999")
+        # The public factory still hands out independent helpers.
+        self.assertIsNot(conv.messages(), conv.messages())
+
     def test_get_conversation_ids_from_name(self):
         cfg = SlackObjectsConfig(bot_token="xoxb-test")
         conv = Conversations(cfg=cfg, client=FakeClient(), logger=None, api=FakeApiCaller())
@@ -111,5 +150,299 @@ class TestLooksLikeChannelId(unittest.TestCase):
         self.assertFalse(Conversations._looks_like_channel_id(""))
 
 
+# ═══════════════════════════════════════════════════════════════════════════
+# Paginated lookups (next page prefetched)
+# ═══════════════════════════════════════════════════════════════════════════
+
+class PagingClient(FakeClient):
+    """Serves three pages for admin.conversations.search (cursor) and discovery members (offset)."""
+
+    def api_call(self, method: str, json: Dict[str, Any]):
+        self.calls.append((method, dict(json)))
+        if method == "admin.conversations.search":
+            page = int(json.get("cursor") or 0)
+            convos = [{"id": f"C{page}A", "name": "general"}, {"id": f"C{page}B", "name": "general-chat"}]
+            return {"ok": True, "conversations": convos, "next_cursor": str(page + 1) if page < 2 else ""}
+        if method == "discovery.conversations.members":
+            page = int(json.get("offset") or 0)
+            return {"ok": True, "members": [f"U{page}"], "offset": str(page + 1) if page < 2 else ""}
+        return super().api_call(method, json)
+
+
+class TestPaginatedLookups(unittest.TestCase):
+    def _conv(self, client):
+        return Conversations(cfg=SlackObjectsConfig(bot_token="xoxb-test"), client=client, logger=None, api=FakeApiCaller())
+
+    def test_search_walks_all_pages(self):
+        client = PagingClient()
+        self.assertEqual(self._conv(client).get_conversation_ids_from_name("general"), ["C0A", "C1A", "C2A"])
+        self.assertEqual([c[1].get("cursor") for c in client.calls], [None, "1", "2"])
+
+    def test_search_first_only_stops_paging(self):
+        client = PagingClient()
+        self.assertEqual(self._conv(client).get_conversation_ids_from_name("general", first_only=True), ["C0A"])
+        # At most the prefetched second page was requested; the third never was.
+        self.assertNotIn("2", [c[1].get("cursor") for c in client.calls])
+
+    def test_members_walks_all_offsets(self):
+        client = PagingClient()
+        self.assertEqual(self._conv(client).get_members(channel_id="C123"), ["U0", "U1", "U2"])
+
+    def test_iter_members_stops_paging_on_early_exit(self):
+        client = PagingClient()
+        self.assertTrue(any(m == "U0" for m in self._conv(client).iter_members(channel_id="C123")))
+        # No read-ahead: a hit on the first page costs exactly one request.
+        self.assertEqual([c[1].get("offset") for c in client.calls], [None])
+
+    def test_failed_page_raises(self):
+        client = FakeClient()
+        client.api_call = lambda method, json: {"ok": False, "error": "not_allowed"}
+        with self.assertRaises(RuntimeError):
+            self._conv(client).get_members(channel_id="C123")
+
+
+
+class TestAsyncPaginatedLookups(unittest.TestCase):
+    def _conv(self, client):
+        return Conversations(
+            cfg=SlackObjectsConfig(bot_token="xoxb-test"), client=client, logger=None, api=FakeApiCaller(),
+            async_api=FakeAsyncApiCaller(), async_client=client,
+        )
+
+    def test_aget_members_walks_all_offsets(self):
+        client = PagingClient()
+        members = asyncio.run(self._conv(client).aget_members(channel_id="C123"))
+        self.assertEqual(members, ["U0", "U1", "U2"])
+
+    def test_aget_conversation_ids_walks_all_pages(self):
+        client = PagingClient()
+        conv = self._conv(client)
+        self.assertEqual(asyncio.run(conv.aget_conversation_ids_from_name("general")), ["C0A", "C1A", "C2A"])
+        # Shares the name cache with the sync method.
+        self.assertEqual(conv.get_conversation_ids_from_name("general"), ["C0A", "C1A", "C2A"])
+        self.assertEqual(len(client.calls), 3)
+
+    def test_aget_conversation_ids_first_only(self):
+        client = PagingClient()
+        ids = asyncio.run(self._conv(client).aget_conversation_ids_from_name("general", first_only=True))
+        self.assertEqual(ids, ["C0A"])
+        self.assertNotIn("2", [c[1].get("cursor") for c in client.calls])
+
+    def test_async_requires_async_client(self):
+        conv = Conversations(cfg=SlackObjectsConfig(bot_token="xoxb-test"), client=FakeClient(), logger=None, api=FakeApiCaller())
+        with self.assertRaises(ValueError):
+            asyncio.run(conv.aget_members(channel_id="C123"))
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# archive() outcome classification
+# ═══════════════════════════════════════════════════════════════════════════
+
+class TestArchive(unittest.TestCase):
+    def _conv(self, resp=None, exc=None):
+        client = FakeClient()
+
+        def api_call(method, json):
+            if exc is not None:
+                raise exc
+            return resp
+
+        client.api_call = api_call
+        return Conversations(cfg=SlackObjectsConfig(bot_token="xoxb-test"), client=client, logger=None, api=FakeApiCaller())
+
+    def test_already_archived_is_success(self):
+        self.assertTrue(self._conv({"ok": False, "error": "already_archived"}).archive("C1"))
+
+    def test_already_archived_raised_by_webclient_is_success(self):
+        err = SlackApiError("already", type("Resp", (), {"data": {"ok": False, "error": "already_archived"}})())
+        self.assertTrue(self._conv(exc=err).archive("C1"))
+
+    def test_permanent_error_returns_false(self):
+        self.assertFalse(self._conv({"ok": False, "error": "channel_not_found"}).archive("C1"))
+
+    def test_transient_error_raises(self):
+        with self.assertRaises(RuntimeError):
+            self._conv({"ok": False, "error": "ratelimited"}).archive("C1")
+
+# ═══════════════════════════════════════════════════════════════════════════
+# Share / move (admin.conversations.setTeams)
+# ═══════════════════════════════════════════════════════════════════════════
+
+class SetTeamsClient(FakeClient):
+    def api_call(self, method: str, json: Dict[str, Any]):
+        if method == "admin.conversations.setTeams":
+            self.calls.append((method, dict(json)))
+            return {"ok": True}
+        return super().api_call(method, json)
+
+
+class TestSetTeams(unittest.TestCase):
+    def _conv(self, client):
+        return Conversations(cfg=SlackObjectsConfig(bot_token="xoxb-test"), client=client, logger=None, api=FakeApiCaller(), channel_id="C1")
+
+    def test_share_single_target_unchanged(self):
+        client = SetTeamsClient()
+        self._conv(client).share_to_workspaces("T2", source_ws_id="T1")
+        self.assertEqual(client.calls[-1][1], {"channel_id": "C1", "target_team_ids": "T1,T2", "team_id": "T1"})
+
+    def test_share_to_several_workspaces(self):
+        client = SetTeamsClient()
+        self._conv(client).share_to_workspaces(["T2", "T3"])
+        self.assertEqual(client.calls[-1][1]["target_team_ids"], "T2,T3")
+
+    def test_move_to_several_workspaces(self):
+        client = SetTeamsClient()
+        self._conv(client).move_to_workspace("C1", "T1", ("T2", "T3"))
+        self.assertEqual([c[1]["target_team_ids"] for c in client.calls], ["T1,T2,T3", "T2,T3"])
+
+    def test_move_many_runs_both_steps_per_channel(self):
+        client = SetTeamsClient()
+        results = self._conv(client).move_many_to_workspace(["C1", "C2", "C3"], "T1", "T2")
+        self.assertEqual(sorted(results), ["C1", "C2", "C3"])
+        self.assertTrue(all(r1["ok"] and r2["ok"] for r1, r2 in results.values()))
+        for cid in ("C1", "C2", "C3"):
+            steps = [c[1]["target_team_ids"] for c in client.calls if c[1]["channel_id"] == cid]
+            self.assertEqual(steps, ["T1,T2", "T2"])
+
+    def test_move_many_skips_step_two_after_failure(self):
+        client = SetTeamsClient()
+        real_api_call = client.api_call
+        client.api_call = lambda method, json: (
+            {"ok": False, "error": "channel_not_found"} if json["channel_id"] == "C2" else real_api_call(method, json)
+        )
+        results = self._conv(client).move_many_to_workspace(["C1", "C2"], "T1", "T2")
+        self.assertEqual(results["C2"], ({"ok": False, "error": "channel_not_found"}, None))
+        self.assertTrue(results["C1"][1]["ok"])
+
+# ═══════════════════════════════════════════════════════════════════════════
+# conversations.info cache
+# ═══════════════════════════════════════════════════════════════════════════
+
+class PrivateChannelClient(FakeClient):
+    """Like FakeClient, but conversations.info only succeeds with the bot (default) token."""
+
+    def api_call(self, method: str, json: Dict[str, Any]):
+        if method == "conversations.info" and json.get("token"):
+            self.calls.append((method, dict(json)))
+            return {"ok": False, "error": "channel_not_found"}
+        return super().api_call(method, json)
+
+
+class TestConversationsInfoCache(unittest.TestCase):
+    """Resolved conversations.info results are cached and dropped on writes."""
+
+    def _info_calls(self, client):
+        return [c for c in client.calls if c[0] == "conversations.info"]
+
+    def test_repeat_lookups_hit_cache(self):
+        client = FakeClient()
+        conv = Conversations(cfg=SlackObjectsConfig(bot_token="xoxb-test"), client=client, logger=None, api=FakeApiCaller())
+        conv.get_conversation_name("C123")
+        conv.with_conversation("C123").refresh()
+        self.assertEqual(len(self._info_calls(client)), 1)
+
+    def test_fallback_result_is_cached(self):
+        client = PrivateChannelClient()
+        cfg = SlackObjectsConfig(bot_token="xoxb-test", user_token="xoxp-test")
+        conv = Conversations(cfg=cfg, client=client, logger=None, api=FakeApiCaller())
+        conv.get_conversation_info("C123")
+        self.assertEqual(len(self._info_calls(client)), 2)  # user token, then bot token
+        self.assertTrue(conv.get_conversation_info("C123")["ok"])
+        self.assertEqual(len(self._info_calls(client)), 2)
+
+    def test_no_bot_retry_for_non_visibility_errors(self):
+        client = FakeClient()
+        client.api_call = lambda method, json: client.calls.append((method, dict(json))) or {"ok": False, "error": "invalid_arguments"}
+        cfg = SlackObjectsConfig(bot_token="xoxb-test", user_token="xoxp-test")
+        conv = Conversations(cfg=cfg, client=client, logger=None, api=FakeApiCaller())
+        self.assertEqual(conv.get_conversation_info("C123")["error"], "invalid_arguments")
+        self.assertEqual(len(self._info_calls(client)), 1)
+
+    def test_bot_retry_when_user_token_call_raises(self):
+        """A real WebClient raises SlackApiError on ok=false; visibility errors still fall back."""
+        client = FakeClient()
+        real_api_call = client.api_call
+
+        def api_call(method, json):
+            if json.get("token"):
+                client.calls.append((method, dict(json)))
+                raise SlackApiError("not found", type("Resp", (), {"data": {"ok": False, "error": "channel_not_found"}})())
+            return real_api_call(method, json)
+
+        client.api_call = api_call
+        cfg = SlackObjectsConfig(bot_token="xoxb-test", user_token="xoxp-test")
+        conv = Conversations(cfg=cfg, client=client, logger=None, api=FakeApiCaller())
+        self.assertTrue(conv.get_conversation_info("C123")["ok"])
+        self.assertEqual(len(self._info_calls(client)), 2)
+
+    def test_prefetch_warms_cache_for_bound_helpers(self):
+        client = FakeClient()
+        conv = Conversations(cfg=SlackObjectsConfig(bot_token="xoxb-test"), client=client, logger=None, api=FakeApiCaller())
+        found = conv.prefetch(["C1", "C2", "C1", "C3"])
+        self.assertEqual(sorted(found), ["C1", "C2", "C3"])
+        self.assertEqual(len(self._info_calls(client)), 3)
+        self.assertEqual(conv.with_conversation("C2").get_conversation_name(), "general")
+        self.assertEqual(len(self._info_calls(client)), 3)
+
+    def test_archive_invalidates(self):
+        client = FakeClient()
+        conv = Conversations(cfg=SlackObjectsConfig(bot_token="xoxb-test"), client=client, logger=None, api=FakeApiCaller())
+        conv.get_conversation_info("C123")
+        conv.archive("C123")
+        conv.get_conversation_info("C123")
+        self.assertEqual(len(self._info_calls(client)), 2)
+
+    def test_cached_result_is_not_shared_mutable_state(self):
+        conv = Conversations(cfg=SlackObjectsConfig(bot_token="xoxb-test"), client=FakeClient(), logger=None, api=FakeApiCaller())
+        conv.get_conversation_info("C123")["channel"]["name"] = "mutated"
+        self.assertEqual(conv.get_conversation_name("C123"), "general")
+
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# Name -> IDs cache
+# ═══════════════════════════════════════════════════════════════════════════
+
+class TestConversationNameCache(unittest.TestCase):
+    """get_conversation_ids_from_name caches hits and misses per (name, workspace)."""
+
+    def _search_calls(self, client):
+        return [c for c in client.calls if c[0] == "admin.conversations.search"]
+
+    def _conv(self, client):
+        return Conversations(cfg=SlackObjectsConfig(bot_token="xoxb-test"), client=client, logger=None, api=FakeApiCaller())
+
+    def test_repeat_lookup_hits_cache(self):
+        client = FakeClient()
+        conv = self._conv(client)
+        self.assertEqual(conv.get_conversation_ids_from_name("general"), ["C123"])
+        self.assertEqual(conv.get_conversation_ids_from_name("general", first_only=True), ["C123"])
+        self.assertEqual(len(self._search_calls(client)), 1)
+        # A different workspace scope is a different key.
+        conv.get_conversation_ids_from_name("general", workspace_id="T1")
+        self.assertEqual(len(self._search_calls(client)), 2)
+
+    def test_negative_result_is_cached(self):
+        client = PagingClient()
+        conv = self._conv(client)
+        self.assertEqual(conv.get_conversation_ids_from_name("missing"), [])
+        self.assertEqual(conv.get_conversation_ids_from_name("missing"), [])
+        self.assertEqual(len(self._search_calls(client)), 3)  # one walk of three pages
+
+    def test_first_only_early_exit_is_not_cached(self):
+        client = PagingClient()
+        conv = self._conv(client)
+        conv.get_conversation_ids_from_name("general", first_only=True)
+        self.assertEqual(conv.get_conversation_ids_from_name("general"), ["C0A", "C1A", "C2A"])
+
+    def test_archive_invalidates_known_name(self):
+        client = FakeClient()
+        conv = self._conv(client)
+        conv.get_conversation_ids_from_name("general")
+        conv.get_conversation_info("C123")  # makes the name known
+        conv.archive("C123")
+        conv.get_conversation_ids_from_name("general")
+        self.assertEqual(len(self._search_calls(client)), 2)
+
 if __name__ == "__main__":
     unittest.main()
@@ -1,6 +1,8 @@
 import logging
 from typing import Any, Dict, Optional
 
+import pytest
+
 from slack_objects.client import SlackObjectsClient
 from slack_objects.config import SlackObjectsConfig, RateTier
 from slack_objects.api_caller import SlackApiCaller
@@ -69,11 +71,25 @@ class FakeResponse:
         self.status_code = status_code
         self.content = content
         self.text = content.decode("utf-8", errors="ignore")
+        self.closed = False
+
+    def iter_content(self, chunk_size: int = 1):
+        for i in range(0, len(self.content), chunk_size):
+            yield self.content[i:i + chunk_size]
+
+    def close(self):
+        self.closed = True
 
 
 class FakeSession:
-    def get(self, url: str, headers: Dict[str, str], timeout: int):
-        return FakeResponse(ok=True, status_code=200, content=b"col1,col2\n1,2\n")
+    def __init__(self, content: bytes = b"col1,col2\n1,2\n"):
+        self.content = content
+        self.responses = []
+
+    def get(self, url: str, headers: Dict[str, str], timeout: int, stream: bool = False):
+        resp = FakeResponse(ok=True, status_code=200, content=self.content)
+        self.responses.append(resp)
+        return resp
 
 
 def test_files_factory_and_refresh_and_content_download():
@@ -102,6 +118,156 @@ def test_files_factory_and_refresh_and_content_download():
     assert "col1,col2" in text
 
 
+
+def test_text_content_streams_and_decodes_across_chunk_boundaries():
+    cfg = SlackObjectsConfig(bot_token="xoxb-fake", default_rate_tier=RateTier.TIER_3)
+
+    slack = SlackObjectsClient(cfg, logger=logging.getLogger("test"))
+    slack.web_client = FakeWebClient()
+    slack.api = FakeApiCaller(cfg)
+
+    f = slack.files("F123")
+    f.http_session = FakeSession(content="héllo ✓\n".encode("utf-8"))
+    f.refresh()
+
+    # One-byte chunks split the multi-byte characters; the incremental decoder must rejoin them.
+    assert "".join(f.iter_text_content(chunk_size=1)) == "héllo ✓\n"
+    assert f.file_content is None  # streaming does not store
+    assert f.get_text_content() == "héllo ✓\n"
+    assert all(resp.closed for resp in f.http_session.responses)
+
+
+def test_file_info_cached_until_delete():
+    cfg = SlackObjectsConfig(bot_token="xoxb-fake", default_rate_tier=RateTier.TIER_3)
+
+    methods = []
+
+    class RecordingWebClient(FakeWebClient):
+        def api_call(self, method: str, json: Optional[Dict[str, Any]] = None):
+            methods.append(method)
+            return super().api_call(method, json)
+
+    slack = SlackObjectsClient(cfg, logger=logging.getLogger("test"))
+    slack.web_client = RecordingWebClient()
+    slack.api = FakeApiCaller(cfg)
+
+    f = slack.files("F123")
+    f.get_file_info("F123")
+    f.with_file("F123").refresh()
+    assert methods.count("files.info") == 1
+
+    f.delete_file()
+    f.get_file_info("F123")
+    assert methods.count("files.info") == 2
+
+def test_require_attributes_reuses_refresh_until_info_ttl():
+    cfg = SlackObjectsConfig(bot_token="xoxb-fake", default_rate_tier=RateTier.TIER_3)
+
+    methods = []
+
+    class EmptyInfoWebClient(FakeWebClient):
+        def api_call(self, method: str, json: Optional[Dict[str, Any]] = None):
+            methods.append(method)
+            return {"ok": True, "file": {}}
+
+    slack = SlackObjectsClient(cfg, logger=logging.getLogger("test"))
+    slack.web_client = EmptyInfoWebClient()
+    slack.api = FakeApiCaller(cfg)
+
+    f = slack.files("F123")
+    f.refresh()
+    assert f._require_attributes() == {}  # empty record still counts as loaded
+    assert not f._is_text_file()
+    assert methods.count("files.info") == 1
+
+    f._attrs_fetched_at -= f.info_ttl  # lease expired
+    f.invalidate()
+    f._require_attributes()
+    assert methods.count("files.info") == 2
+
+    f.refresh(force=True)  # bypasses the shared files.info cache
+    assert methods.count("files.info") == 3
+
+
+def test_text_check_matches_mimetype_prefix_only():
+    cfg = SlackObjectsConfig(bot_token="xoxb-fake", default_rate_tier=RateTier.TIER_3)
+    slack = SlackObjectsClient(cfg, logger=logging.getLogger("test"))
+
+    f = slack.files()
+    f.attributes = {"mimetype": "text/csv"}
+    assert f._is_text_file()
+    f.attributes = {"mimetype": "application/vnd.text/foo", "url_private": "https://files.slack.com/x"}
+    assert not f._is_text_file()
+    with pytest.raises(ValueError):
+        f.get_text_content()
+
+
+def test_upload_sends_large_or_streamed_payloads_as_multipart_file():
+    import io
+    from slack_objects import files as files_mod
+
+    cfg = SlackObjectsConfig(bot_token="xoxb-fake", default_rate_tier=RateTier.TIER_3)
+
+    payloads = []
+
+    class RecordingWebClient(FakeWebClient):
+        def api_call(self, method: str, json: Optional[Dict[str, Any]] = None):
+            payloads.append(json)
+            return super().api_call(method, json)
+
+    slack = SlackObjectsClient(cfg, logger=logging.getLogger("test"))
+    slack.web_client = RecordingWebClient()
+    slack.api = FakeApiCaller(cfg)
+    f = slack.files()
+
+    f.upload_to_slack(title="small", content="hi")
+    assert payloads[-1]["content"] == "hi" and "file" not in payloads[-1]
+
+    big = "x" * (files_mod.INLINE_CONTENT_MAX_CHARS + 1)
+    f.upload_to_slack(title="big", content=big)
+    assert payloads[-1]["file"] == big.encode("utf-8") and "content" not in payloads[-1]
+
+    stream = io.BytesIO(b"raw")
+    resp = f.upload_to_slack(title="stream", filename="raw.bin", file_stream=stream)
+    assert payloads[-1]["file"] is stream
+    assert resp["ok"] and f.file_id == "F_UPLOADED"
+
+
+def test_file_info_appends_paginated_comments():
+    cfg = SlackObjectsConfig(bot_token="xoxb-fake", default_rate_tier=RateTier.TIER_3)
+
+    pages = {
+        None: {"ok": True, "file": {"id": "F123", "name": "a.txt", "comments": [{"id": "Fc1"}]},
+               "response_metadata": {"next_cursor": "c2"}},
+        "c2": {"ok": True, "file": {"id": "F123", "name": "a.txt", "comments": [{"id": "Fc2"}]},
+               "response_metadata": {"next_cursor": ""}},
+    }
+
+    cursors = []
+
+    class PagedWebClient(FakeWebClient):
+        def api_call(self, method: str, json: Optional[Dict[str, Any]] = None):
+            cursors.append((json or {}).get("cursor"))
+            return pages[cursors[-1]]
+
+    slack = SlackObjectsClient(cfg, logger=logging.getLogger("test"))
+    slack.web_client = PagedWebClient()
+    slack.api = FakeApiCaller(cfg)
+
+    f = slack.files()
+    head = f.get_file_info("F123", include_comments=False)
+    assert [c["id"] for c in head["file"]["comments"]] == ["Fc1"]  # first page only
+
+    info = f.get_file_info("F123")
+    assert info["file"]["name"] == "a.txt"
+    assert [c["id"] for c in info["file"]["comments"]] == ["Fc1", "Fc2"]
+    assert cursors == [None, None, "c2"]
+
+    # The complete record now serves first-page lookups as well.
+    assert f.get_file_info("F123", include_comments=False) == info
+    assert len(cursors) == 3
+
+
 def test_files_source_message_lookup():
     cfg = SlackObjectsConfig(
         bot_token="xoxb-fake",
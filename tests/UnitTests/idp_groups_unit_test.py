@@ -39,6 +39,7 @@ class FakeResponse:
         self.ok = 200 <= status_code < 300
         self._payload = payload
         self.text = json.dumps(payload)
+        self.content = self.text.encode("utf-8")
 
     def json(self) -> Dict[str, Any]:
         return self._payload
@@ -63,7 +64,8 @@ class FakeScimSession(requests.Session):
     def request(self, method: str, url: str, **kwargs):
         method_u = method.upper()
         params = kwargs.get("params")
-        payload = kwargs.get("json")
+        body = kwargs.get("data")
+        payload = json.loads(body) if body else None
         self.calls.append((method_u, url, params, payload))
 
         key = (method_u, url)
@@ -353,6 +355,319 @@ def test_get_group_merges_paginated_members():
     assert calls[1]["startIndex"] == 3
 
 
+
+def test_get_group_is_cached_until_invalidated():
+    """
+    Verifies:
+    - repeated get_group() calls for one group share a single SCIM request via the helper cache
+    - returned records are independent copies
+    - invalidate() forces the next lookup back to the network
+    """
+    from slack_objects.idp_groups import IDP_groups
+
+    cfg = DummyConfig()
+    base = _scim_base(cfg, "v1")
+    group_payload = {"id": "S123", "displayName": "Admins", "members": [{"value": "U1", "display": "A"}]}
+    sess = FakeScimSession({("GET", f"{base}Groups/S123"): (200, group_payload)})
+
+    idp = IDP_groups(cfg=cfg, client=DummySlackClient(), logger=logging.getLogger("test"), api=DummyApiCaller(), scim_session=sess)
+    idp.rate_policy = RateLimitPolicy(method_overrides={}, prefix_rules={}, default=0.0)
+
+    idp.get_group("S123")["members"].clear()
+    assert idp.get_group("S123")["members"] == group_payload["members"]
+    assert idp.with_group("S123").is_member("U1") is True
+    assert len(sess.calls) == 1
+
+    idp.invalidate("S123")
+    idp.get_group("S123")
+    assert len(sess.calls) == 2
+
+
+def test_are_members_batch_verdict_from_one_fetch():
+    from slack_objects.idp_groups import IDP_groups
+
+    cfg = DummyConfig()
+    base = _scim_base(cfg, "v1")
+    group_payload = {"id": "S123", "displayName": "Admins", "members": [{"value": "U1"}, {"value": "U2"}]}
+    sess = FakeScimSession({("GET", f"{base}Groups/S123"): (200, group_payload)})
+
+    group = IDP_groups(cfg=cfg, client=DummySlackClient(), logger=logging.getLogger("test"), api=DummyApiCaller(), scim_session=sess, group_id="S123")
+    group.rate_policy = RateLimitPolicy(method_overrides={}, prefix_rules={}, default=0.0)
+
+    assert group.are_members(["U1", "U3", "U2"]) == {"U1": True, "U3": False, "U2": True}
+    assert group.get_member_ids() == frozenset({"U1", "U2"})
+    assert group.is_member("U2") is True
+    assert group.is_member("U9") is False
+    assert len(sess.calls) == 1
+
+def test_get_user_group_ids_reads_the_user_record_once():
+    from slack_objects.idp_groups import IDP_groups
+
+    cfg = DummyConfig()
+    base = _scim_base(cfg, "v1")
+    user_payload = {"id": "U1", "groups": [{"value": "S1", "display": "Admins"}, {"value": "S2", "display": "Ops"}]}
+    sess = FakeScimSession({("GET", f"{base}Users/U1"): (200, user_payload)})
+
+    idp = IDP_groups(cfg=cfg, client=DummySlackClient(), logger=logging.getLogger("test"), api=DummyApiCaller(), scim_session=sess)
+    idp.rate_policy = RateLimitPolicy(method_overrides={}, prefix_rules={}, default=0.0)
+
+    assert idp.get_user_group_ids("U1") == frozenset({"S1", "S2"})
+    # A second helper on the same cache is served without another request.
+    assert idp.with_group("S1").get_user_group_ids("U1") == frozenset({"S1", "S2"})
+    assert len(sess.calls) == 1
+
+
+def test_get_groups_fetches_remaining_pages_concurrently_in_order():
+    from slack_objects.idp_groups import IDP_groups
+    from slack_objects.rate_limits import RateLimiter
+
+    cfg = DummyConfig()
+
+    def page(start_index: int) -> Dict[str, Any]:
+        ids = range(start_index, min(start_index + 2, 8))
+        return {"Resources": [{"id": f"S{i}", "displayName": f"G{i}"} for i in ids], "totalResults": 7}
+
+    starts = []
+    def request_side_effect(method: str, url: str, **kwargs):
+        start_index = (kwargs.get("params") or {}).get("startIndex", 1)
+        starts.append(start_index)
+        return FakeResponse(200, page(start_index))
+
+    sess = FakeScimSession({})
+    sess.request = request_side_effect  # type: ignore[method-assign]
+
+    api = DummyApiCaller()
+    api.limiter = RateLimiter()  # shared limiter replaces the post-call sleep
+    idp = IDP_groups(cfg=cfg, client=DummySlackClient(), logger=logging.getLogger("test"), api=api, scim_session=sess)
+    idp.rate_policy = RateLimitPolicy(method_overrides={}, prefix_rules={}, default=0.0)
+
+    groups = idp.get_groups(fetch_count=2, max_workers=3)
+
+    assert [g["group id"] for g in groups] == [f"S{i}" for i in range(1, 8)]
+    assert starts[0] == 1
+    assert sorted(starts[1:]) == [3, 5, 7]
+
+
+def test_get_groups_steps_by_the_server_page_size():
+    from slack_objects.idp_groups import IDP_groups
+
+    cfg = DummyConfig()
+    starts = []
+    def request_side_effect(method: str, url: str, **kwargs):
+        start_index = (kwargs.get("params") or {}).get("startIndex", 1)
+        starts.append(start_index)
+        # Server caps pages at 2 groups whatever count asks for.
+        ids = range(start_index, min(start_index + 2, 6))
+        return FakeResponse(200, {"Resources": [{"id": f"S{i}", "displayName": f"G{i}"} for i in ids], "totalResults": 5})
+
+    sess = FakeScimSession({})
+    sess.request = request_side_effect  # type: ignore[method-assign]
+    idp = IDP_groups(cfg=cfg, client=DummySlackClient(), logger=logging.getLogger("test"), api=DummyApiCaller(), scim_session=sess)
+    idp.rate_policy = RateLimitPolicy(method_overrides={}, prefix_rules={}, default=0.0)
+
+    assert [g["group id"] for g in idp.get_groups(fetch_count=1000)] == [f"S{i}" for i in range(1, 6)]
+    assert sorted(starts) == [1, 3, 5]
+
+
+def test_get_groups_stops_on_short_later_page_despite_total():
+    from slack_objects.idp_groups import IDP_groups
+
+    cfg = DummyConfig()
+    def request_side_effect(method: str, url: str, **kwargs):
+        start_index = (kwargs.get("params") or {}).get("startIndex", 1)
+        # Server claims 10 groups but only ever has three.
+        ids = range(start_index, min(start_index + 2, 4))
+        return FakeResponse(200, {"Resources": [{"id": f"S{i}", "displayName": f"G{i}"} for i in ids], "totalResults": 10})
+
+    sess = FakeScimSession({})
+    sess.request = request_side_effect  # type: ignore[method-assign]
+    idp = IDP_groups(cfg=cfg, client=DummySlackClient(), logger=logging.getLogger("test"), api=DummyApiCaller(), scim_session=sess)
+    idp.rate_policy = RateLimitPolicy(method_overrides={}, prefix_rules={}, default=0.0)
+
+    assert [g["group id"] for g in idp.get_groups(fetch_count=2)] == ["S1", "S2", "S3"]
+
+
+def test_scim_429_waits_retry_after_then_retries(monkeypatch):
+    from slack_objects import rate_limits
+    from slack_objects.idp_groups import IDP_groups
+
+    cfg = DummyConfig()
+    slept = []
+    monkeypatch.setattr(rate_limits.time, "sleep", slept.append)
+
+    responses = [FakeResponse(429, {}), FakeResponse(200, {"id": "S123", "displayName": "Admins", "members": []})]
+    responses[0].headers = {"Retry-After": "7"}
+    sess = FakeScimSession({})
+    sess.request = lambda method, url, **kwargs: responses.pop(0)  # type: ignore[method-assign]
+
+    idp = IDP_groups(cfg=cfg, client=DummySlackClient(), logger=logging.getLogger("test"), api=DummyApiCaller(), scim_session=sess)
+    idp.rate_policy = RateLimitPolicy(method_overrides={}, prefix_rules={}, default=0.0)
+
+    assert idp.get_group("S123")["displayName"] == "Admins"
+    assert len(slept) == 1 and slept[0] >= 7.0
+
+
+def test_scim_gateway_error_is_retried_only_for_idempotent_methods(monkeypatch):
+    from slack_objects import rate_limits
+    from slack_objects.idp_groups import IDP_groups
+
+    monkeypatch.setattr(rate_limits.time, "sleep", lambda seconds: None)
+    responses = [FakeResponse(503, {}), FakeResponse(200, {"id": "S123", "displayName": "Admins", "members": []})]
+    sess = FakeScimSession({})
+    sess.request = lambda method, url, **kwargs: responses.pop(0)  # type: ignore[method-assign]
+
+    idp = IDP_groups(cfg=DummyConfig(), client=DummySlackClient(), logger=logging.getLogger("test"), api=DummyApiCaller(), scim_session=sess)
+    idp.rate_policy = RateLimitPolicy(method_overrides={}, prefix_rules={}, default=0.0)
+
+    assert idp.get_group("S123")["displayName"] == "Admins"
+
+    # A POST may already have taken effect behind the gateway, so it is not repeated.
+    responses[:] = [FakeResponse(502, {}), FakeResponse(201, {"id": "S9"})]
+    try:
+        idp._scim_request(path="Groups", method="POST", payload={"displayName": "New"})
+        raise AssertionError("expected HTTPError")
+    except requests.HTTPError:
+        pass
+    assert len(responses) == 1
+
+
+def test_low_remaining_header_slows_the_next_call(monkeypatch):
+    from slack_objects import rate_limits
+    from slack_objects.config import RateTier
+    from slack_objects.idp_groups import IDP_groups
+
+    cfg = DummyConfig()
+    slept = []
+    monkeypatch.setattr(rate_limits.time, "sleep", slept.append)
+
+    remaining = ["50", "1", "50"]
+    def request_side_effect(method: str, url: str, **kwargs):
+        resp = FakeResponse(200, {"id": "S1", "members": []})
+        resp.headers = {"X-Rate-Limit-Remaining": remaining.pop(0)}
+        return resp
+
+    sess = FakeScimSession({})
+    sess.request = request_side_effect  # type: ignore[method-assign]
+    api = DummyApiCaller()
+    api.limiter = rate_limits.RateLimiter(burst=10)  # plenty of local budget
+    idp = IDP_groups(cfg=cfg, client=DummySlackClient(), logger=logging.getLogger("test"), api=api, scim_session=sess)
+
+    idp._scim_request(path="Groups/S1", rate_tier=RateTier.TIER_2)
+    idp._scim_request(path="Groups/S1", rate_tier=RateTier.TIER_2)
+    assert slept == []  # healthy responses never wait
+    idp._scim_request(path="Groups/S1", rate_tier=RateTier.TIER_2)
+    assert len(slept) == 1 and slept[0] > 0
+
+
+def test_scim_headers_built_once_per_token():
+    from slack_objects.idp_groups import IDP_groups
+
+    cfg = DummyConfig()
+    seen = []
+    def request_side_effect(method: str, url: str, **kwargs):
+        seen.append((url, kwargs["headers"]))
+        return FakeResponse(200, {"id": "S1", "members": []})
+
+    sess = FakeScimSession({})
+    sess.request = request_side_effect  # type: ignore[method-assign]
+    idp = IDP_groups(cfg=cfg, client=DummySlackClient(), logger=logging.getLogger("test"), api=DummyApiCaller(), scim_session=sess)
+    idp.rate_policy = RateLimitPolicy(method_overrides={}, prefix_rules={}, default=0.0)
+
+    idp._scim_request(path="Groups/S1")
+    idp._scim_request(path="Groups/S2")
+    idp._scim_request(path="Groups/S1", token="xoxp-other")
+
+    assert seen[0][1] is seen[1][1]
+    assert seen[0][1] == {"Authorization": f"Bearer {cfg.scim_token}"}
+    assert seen[2][1] == {"Authorization": "Bearer xoxp-other"}
+    assert seen[1][0] == _scim_base(cfg, "v1") + "Groups/S2"
+
+
+def test_scim_body_is_pre_encoded_json_and_bytes_are_decoded():
+    from slack_objects.idp_groups import IDP_groups
+
+    sent = []
+    def request_side_effect(method: str, url: str, **kwargs):
+        sent.append(kwargs)
+        return FakeResponse(201, {"id": "S9", "displayName": "Né"})
+
+    sess = FakeScimSession({})
+    sess.request = request_side_effect  # type: ignore[method-assign]
+    idp = IDP_groups(cfg=DummyConfig(), client=DummySlackClient(), logger=logging.getLogger("test"), api=DummyApiCaller(), scim_session=sess)
+    idp.rate_policy = RateLimitPolicy(method_overrides={}, prefix_rules={}, default=0.0)
+
+    resp = idp._scim_request(path="Groups", method="POST", payload={"displayName": "Né"})
+    assert isinstance(sent[0]["data"], bytes) and "json" not in sent[0]
+    assert json.loads(sent[0]["data"]) == {"displayName": "Né"}
+    assert sent[0]["headers"]["Content-Type"].startswith("application/json")
+    assert resp.data == {"id": "S9", "displayName": "Né"}
+
+    # Non-JSON bodies (e.g. a proxy error page) are kept as text instead of raising.
+    assert idp._scim_response(502, False, b"<html>Bad Gateway</html>").data == {"_raw_text": "<html>Bad Gateway</html>"}
+    # Only failures keep a decoded copy of the body.
+    assert resp.text == ""
+    assert idp._scim_response(404, False, b'{"detail": "nope"}').text == '{"detail": "nope"}'
+
+
+class FakeAsyncResponse:
+    """Minimal aiohttp.ClientResponse-like object (async context manager)."""
+    def __init__(self, status: int, payload: Dict[str, Any]):
+        self.status = status
+        self.headers: Dict[str, str] = {}
+        self._body = json.dumps(payload).encode("utf-8")
+
+    async def read(self) -> bytes:
+        return self._body
+
+    def raise_for_status(self) -> None:
+        if self.status >= 400:
+            raise RuntimeError(f"HTTP {self.status}")
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+
+class FakeAsyncScimSession:
+    """Stands in for aiohttp.ClientSession; routes on (path tail, startIndex)."""
+    def __init__(self, handler):
+        self.handler = handler
+        self.calls = []
+
+    def request(self, method: str, url: str, **kwargs):
+        self.calls.append((method, url, kwargs.get("params")))
+        return FakeAsyncResponse(200, self.handler(url, kwargs.get("params") or {}))
+
+
+def test_async_get_groups_and_is_member():
+    import asyncio
+    from slack_objects.idp_groups import IDP_groups
+
+    cfg = DummyConfig()
+
+    def handler(url: str, params: Dict[str, Any]) -> Dict[str, Any]:
+        if url.endswith("Groups/S1"):
+            return {"id": "S1", "displayName": "G1", "members": [{"value": "U1"}]}
+        start = params.get("startIndex", 1)
+        ids = range(start, min(start + 2, 6))
+        return {"Resources": [{"id": f"S{i}", "displayName": f"G{i}"} for i in ids], "totalResults": 5}
+
+    sess = FakeAsyncScimSession(handler)
+    idp = IDP_groups(cfg=cfg, client=DummySlackClient(), logger=logging.getLogger("test"), api=DummyApiCaller(), ascim_session=sess)
+    idp.rate_policy = RateLimitPolicy(method_overrides={}, prefix_rules={}, default=0.0)
+
+    groups = asyncio.run(idp.aget_groups(fetch_count=2))
+    assert [g["group id"] for g in groups] == ["S1", "S2", "S3", "S4", "S5"]
+
+    bound = idp.with_group("S1")
+    assert asyncio.run(bound.ais_member("U1")) is True
+    assert asyncio.run(bound.ais_member("U2")) is False
+    assert [c for c in sess.calls if c[1].endswith("Groups/S1")] == [("GET", _scim_base(cfg, "v1") + "Groups/S1", None)]
+    assert bound.get_group()["displayName"] == "G1"  # sync path reads the same cache entry
+
+
 # -----------------------------
 # Optional "factory-style" demo
 # -----------------------------
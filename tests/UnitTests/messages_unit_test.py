@@ -1,9 +1,11 @@
 # tests/UnitTests/messages_unit_test.py
 
+import asyncio
+import logging
 import unittest
 from typing import Any, Dict, Optional, List
 
-from slack_objects.messages import Messages
+from slack_objects.messages import Messages, SlackMessage
 from slack_objects.config import SlackObjectsConfig
 
 
@@ -59,6 +61,25 @@ class FakeApiCaller:
         return client.api_call(method, json=kwargs)
 
 
+class FakeAsyncApiCaller:
+    """Fake AsyncSlackApiCaller that yields once and calls the (sync) fake client directly."""
+    async def call(self, client, method: str, *, rate_tier=None, **kwargs):
+        await asyncio.sleep(0)
+        return client.api_call(method, json=kwargs)
+
+
+class PagedHistoryClient(FakeClient):
+    """conversations.history split over two cursor pages."""
+    def api_call(self, method: str, json: Optional[Dict[str, Any]] = None):
+        payload = json or {}
+        if method != "conversations.history":
+            return super().api_call(method, json)
+        self.calls.append((method, dict(payload)))
+        if payload.get("cursor") == "p2":
+            return {"ok": True, "messages": [{"ts": "1.0"}], "response_metadata": {"next_cursor": ""}}
+        return {"ok": True, "messages": [{"ts": "3.0"}, {"ts": "2.0"}], "response_metadata": {"next_cursor": "p2"}}
+
+
 class MessagesUnitTests(unittest.TestCase):
     def setUp(self):
         self.cfg = SlackObjectsConfig(bot_token="xoxb-test")
@@ -110,6 +131,112 @@ class MessagesUnitTests(unittest.TestCase):
         called_methods = [m for (m, _) in self.client.calls]
         self.assertIn("chat.update", called_methods)
 
+    def test_iter_messages_is_lazy_and_stops_early(self):
+        client = PagedHistoryClient()
+        msgs = Messages(cfg=self.cfg, client=client, logger=None, api=self.api, channel_id="C123")
+
+        it = msgs.iter_messages()
+        self.assertEqual(client.calls, [])
+        self.assertEqual(next(it)["ts"], "3.0")
+        self.assertEqual(len(client.calls), 1)
+
+        # The stop predicate ends iteration inside page 1, so page 2 is never requested.
+        client.calls.clear()
+        self.assertEqual([m["ts"] for m in msgs.iter_messages(stop=lambda m: m["ts"] == "2.0")], ["3.0"])
+        self.assertEqual(len(client.calls), 1)
+
+        self.assertEqual([m["ts"] for m in msgs.iter_messages()], ["3.0", "2.0", "1.0"])
+        self.assertEqual([m["ts"] for m in msgs.get_messages(limit=2)], ["3.0", "2.0"])
+
+    def test_replace_message_block_matches_first_block_and_reports_misses(self):
+        blocks = [
+            {"type": "divider", "block_id": "A"},
+            {"type": "section", "block_id": "B"},
+            {"type": "section", "block_id": "C"},
+        ]
+        self.assertEqual(Messages._find_block_index(blocks, "type", "section"), 1)
+        self.assertEqual(Messages._find_block_index(blocks, "block_id", "C"), 2)
+        self.assertEqual(Messages._find_block_index(blocks, "block_id", "Z"), -1)
+
+        msg = Messages(cfg=self.cfg, client=self.client, logger=logging.getLogger("test"), api=self.api, channel_id="C123", ts="2.0", message={"blocks": blocks})
+        miss = msg.replace_message_block(block_id="Z", text="new")
+        self.assertEqual(miss["error"], "block_not_found")
+        self.assertNotIn("chat.update", [m for (m, _) in self.client.calls])
+
+        msg.replace_message_block(block_type="section", text="new")
+        sent = self.client.calls[-1][1]["blocks"]
+        self.assertEqual([b.get("block_id") for b in sent], ["A", None, "C"])
+
+    def test_replace_message_blocks_sends_one_update(self):
+        blocks = [
+            {"type": "divider", "block_id": "A"},
+            {"type": "section", "block_id": "B"},
+            {"type": "section", "block_id": "C"},
+        ]
+        msg = Messages(cfg=self.cfg, client=self.client, logger=logging.getLogger("test"), api=self.api, channel_id="C123", ts="2.0", message={"blocks": blocks})
+        resp = msg.replace_message_blocks([
+            ("block_id", "C", {"type": "context", "block_id": "C2"}),
+            ("type", "section", {"type": "header", "block_id": "H"}),
+            ("block_id", "A", {"type": "divider", "block_id": "A1"}),
+        ])
+        self.assertTrue(resp["ok"])
+        updates = [p for (m, p) in self.client.calls if m == "chat.update"]
+        self.assertEqual(len(updates), 1)
+        self.assertEqual([b["block_id"] for b in updates[0]["blocks"]], ["A1", "H", "C2"])
+
+        # One unmatched replacement aborts the whole batch.
+        miss = msg.replace_message_blocks([("block_id", "A", {"type": "divider"}), ("block_id", "Z", {"type": "divider"})])
+        self.assertEqual(miss["missing"], [("block_id", "Z")])
+        self.assertEqual(len([m for (m, _) in self.client.calls if m == "chat.update"]), 1)
+
+    def test_replace_message_blocks_never_edits_the_callers_list(self):
+        blocks = [{"type": "divider", "block_id": "A"}, {"type": "section", "block_id": "B"}]
+        original = [dict(b) for b in blocks]
+        msg = Messages(cfg=self.cfg, client=self.client, logger=logging.getLogger("test"), api=self.api, channel_id="C123", ts="2.0")
+
+        miss = msg.replace_message_blocks([("block_id", "A", {"type": "header"}), ("block_id", "Z", {"type": "header"})], blocks=blocks)
+        self.assertEqual(miss["error"], "block_not_found")
+        self.assertEqual(blocks, original)
+
+        self.assertTrue(msg.replace_message_blocks([("block_id", "B", {"type": "header"})], blocks=blocks)["ok"])
+        self.assertEqual(blocks, original)
+
+    def test_limit_shrinks_later_pages_and_skips_unneeded_ones(self):
+        client = PagedHistoryClient()
+        msgs = Messages(cfg=self.cfg, client=client, logger=None, api=self.api, async_api=FakeAsyncApiCaller(), async_client=client, channel_id="C123")
+
+        self.assertEqual(len(msgs.get_messages(limit=3)), 3)
+        self.assertEqual([(p["limit"], p.get("cursor")) for _, p in client.calls], [(3, None), (1, "p2")])
+
+        client.calls.clear()
+        msgs.get_messages(limit=2)
+        asyncio.run(msgs.aget_messages(limit=2))
+        self.assertEqual(len(client.calls), 2)  # one page each; the full first page needs no follow-up
+
+        client.calls.clear()
+        msgs.get_messages(limit=5000)
+        self.assertEqual(client.calls[0][1]["limit"], 1000)
+
+    def test_slim_iteration_yields_compact_messages(self):
+        slim = list(self.msgs.iter_messages(slim=True))
+        self.assertTrue(all(isinstance(m, SlackMessage) for m in slim))
+        self.assertEqual([m.text for m in slim], ["hello", "world"])
+        self.assertEqual([m.as_dict() for m in slim], self.msgs.get_messages())
+        self.assertFalse(hasattr(slim[0], "__dict__"))
+
+    def test_async_variants_match_sync_results(self):
+        client = PagedHistoryClient()
+        msgs = Messages(cfg=self.cfg, client=client, logger=None, api=self.api, async_api=FakeAsyncApiCaller(), async_client=client, channel_id="C123")
+
+        self.assertEqual(asyncio.run(msgs.aget_messages()), msgs.get_messages())
+        self.assertEqual([m["ts"] for m in asyncio.run(msgs.aget_messages(limit=2))], ["3.0", "2.0"])
+        thread = asyncio.run(msgs.with_channel("C123").aget_message_threads(thread_ts="2.0"))
+        self.assertEqual([m["text"] for m in thread], ["parent", "reply 1"])
+
+    def test_async_requires_async_api(self):
+        with self.assertRaises(ValueError):
+            asyncio.run(self.msgs.aget_messages())
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,12 +1,13 @@
 # tests/UnitTests/rate_limits_unit_test.py
 """
-Unit tests for RateLimitPolicy resolution logic and DEFAULT_RATE_POLICY.
+Unit tests for RateLimitPolicy resolution logic, DEFAULT_RATE_POLICY, and the token-bucket limiter.
 """
 
 import pytest
 
 from slack_objects.config import RateTier
-from slack_objects.rate_limits import RateLimitPolicy, DEFAULT_RATE_POLICY
+from slack_objects import rate_limits
+from slack_objects.rate_limits import RateLimitPolicy, DEFAULT_RATE_POLICY, RateLimiter, TokenBucket
 
 
 # ═══════════════════════════════════════════════════════════════════════════
@@ -44,6 +45,14 @@ class TestTierFor:
         # "admin.conversations.search" matches both "admin." and "admin.conversations."
         assert policy.tier_for("admin.conversations.search") is RateTier.TIER_2
 
+    def test_longest_prefix_wins_regardless_of_rule_order(self):
+        policy = RateLimitPolicy(
+            method_overrides={},
+            prefix_rules={"admin.conversations.": RateTier.TIER_2, "admin.": RateTier.TIER_1},
+        )
+        assert policy.tier_for("admin.conversations.search") is RateTier.TIER_2
+        assert policy.tier_for("admin.users.list") is RateTier.TIER_1
+
     def test_shorter_prefix(self, policy):
         """A method matching only the shorter prefix gets that tier."""
         assert policy.tier_for("admin.teams.list") is RateTier.TIER_1
@@ -110,4 +119,130 @@ class TestDefaultRatePolicy:
     def test_frozen(self):
         """DEFAULT_RATE_POLICY is a frozen dataclass — no mutation."""
         with pytest.raises(AttributeError):
-            DEFAULT_RATE_POLICY.default = RateTier.TIER_D
\ No newline at end of file
+            DEFAULT_RATE_POLICY.default = RateTier.TIER_D
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# 4.  TokenBucket / RateLimiter
+# ═══════════════════════════════════════════════════════════════════════════
+
+class FakeClock:
+    """Deterministic stand-in for time.monotonic/time.sleep (sleeping advances the clock)."""
+
+    def __init__(self):
+        self.now = 1000.0
+        self.sleeps = []
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture()
+def clock(monkeypatch) -> FakeClock:
+    fake = FakeClock()
+    monkeypatch.setattr(rate_limits.time, "monotonic", fake.monotonic)
+    monkeypatch.setattr(rate_limits.time, "sleep", fake.sleep)
+    monkeypatch.setattr(rate_limits.time, "time", lambda: 1_700_000_000.0)
+    return fake
+
+
+class TestTokenBucket:
+    """acquire() only sleeps when the bucket is empty."""
+
+    def test_first_call_does_not_wait(self, clock):
+        bucket = TokenBucket(rate=1 / 3.0)
+        assert bucket.acquire() == 0.0
+        assert clock.sleeps == []
+
+    def test_back_to_back_calls_wait_for_refill(self, clock):
+        bucket = TokenBucket(rate=1 / 3.0)
+        bucket.acquire()
+        assert bucket.acquire() == pytest.approx(3.0)
+        assert clock.sleeps == [pytest.approx(3.0)]
+
+    def test_idle_time_refills_bucket(self, clock):
+        bucket = TokenBucket(rate=1 / 3.0)
+        bucket.acquire()
+        clock.now += 10.0  # idle longer than one refill interval
+        assert bucket.acquire() == 0.0
+
+    def test_partial_refill_waits_for_remainder(self, clock):
+        bucket = TokenBucket(rate=1 / 3.0)
+        bucket.acquire()
+        clock.now += 1.0
+        assert bucket.acquire() == pytest.approx(2.0)
+
+    def test_capacity_allows_burst(self, clock):
+        bucket = TokenBucket(rate=1 / 3.0, capacity=3)
+        assert [bucket.acquire() for _ in range(3)] == [0.0, 0.0, 0.0]
+        assert bucket.acquire() == pytest.approx(3.0)
+
+    def test_drain_pushes_next_token_out(self, clock):
+        """After a 429, drain(Retry-After) makes the next caller wait that long even if budget was left."""
+        bucket = TokenBucket(rate=1 / 3.0, capacity=3)
+        bucket.drain(30.0)
+        assert bucket.acquire() == pytest.approx(30.0)
+
+
+class TestRateLimiter:
+    """RateLimiter keeps one bucket per key."""
+
+    def test_keys_are_independent(self, clock):
+        limiter = RateLimiter()
+        limiter.acquire("users.info", RateTier.TIER_2)
+        assert limiter.acquire("chat.update", RateTier.TIER_2) == 0.0
+
+    def test_same_key_is_paced_by_tier(self, clock):
+        limiter = RateLimiter()
+        limiter.acquire("users.info", RateTier.TIER_2)
+        assert limiter.acquire("users.info", RateTier.TIER_2) == pytest.approx(float(RateTier.TIER_2))
+
+    def test_zero_tier_never_waits(self, clock):
+        limiter = RateLimiter()
+        for _ in range(5):
+            assert limiter.acquire("scim.Groups", 0.0) == 0.0
+        assert clock.sleeps == []
+
+    def test_reserve_reports_wait_without_sleeping(self, clock):
+        """reserve() books the token and returns the wait; the caller does the sleeping."""
+        limiter = RateLimiter()
+        assert limiter.reserve("users.info", RateTier.TIER_2) == 0.0
+        assert limiter.reserve("users.info", RateTier.TIER_2) == pytest.approx(3.0)
+        assert limiter.reserve("users.info", RateTier.TIER_2) == pytest.approx(6.0)
+        assert clock.sleeps == []
+
+    def test_drain_is_shared_by_the_key(self, clock):
+        limiter = RateLimiter()
+        limiter.drain("scim.Users", RateTier.TIER_2, 20.0)
+        assert limiter.acquire("scim.Users", RateTier.TIER_2) == pytest.approx(20.0)
+        assert limiter.acquire("scim.Groups", RateTier.TIER_2) == 0.0
+
+    def test_drain_on_unpaced_tier_sleeps_inline(self, clock):
+        RateLimiter().drain("scim.Users", 0.0, 5.0)
+        assert clock.sleeps == [5.0]
+
+    def test_observe_low_remaining_slows_next_call(self, clock):
+        limiter = RateLimiter()
+        limiter.observe("conversations.history", RateTier.TIER_2, {"X-RateLimit-Remaining": "2"})
+        assert limiter.acquire("conversations.history", RateTier.TIER_2) == pytest.approx(float(RateTier.TIER_2))
+
+    def test_observe_healthy_or_missing_headers_cost_nothing(self, clock):
+        limiter = RateLimiter()
+        limiter.observe("conversations.history", RateTier.TIER_2, {"X-RateLimit-Remaining": "40"})
+        limiter.observe("conversations.history", RateTier.TIER_2, None)
+        assert limiter.acquire("conversations.history", RateTier.TIER_2) == 0.0
+
+    def test_observe_spreads_the_wait_until_reset_over_remaining_calls(self, clock):
+        limiter = RateLimiter()
+        headers = {"X-RateLimit-Remaining": "2", "X-RateLimit-Reset": str(1_700_000_000 + 30)}
+        limiter.observe("conversations.history", RateTier.TIER_2, headers)
+        assert limiter.acquire("conversations.history", RateTier.TIER_2) == pytest.approx(15.0)
+
+    def test_observe_accepts_relative_reset_and_exhausted_window(self, clock):
+        limiter = RateLimiter()
+        limiter.observe("users.list", RateTier.TIER_2, {"X-Rate-Limit-Remaining": "0", "X-Rate-Limit-Reset": "12"})
+        assert limiter.acquire("users.list", RateTier.TIER_2) == pytest.approx(12.0)
@@ -9,6 +9,7 @@ Run:  python -m pytest tests/UnitTests/usergroups_test.py -v --tb=short
 
 from __future__ import annotations
 
+import asyncio
 import logging
 from unittest.mock import MagicMock
 
@@ -189,4 +190,92 @@ class TestIsMember:
     def test_raises_without_usergroup_id(self):
         ug, _ = _make_usergroups()
         with pytest.raises(ValueError, match="usergroup_id is required"):
-            ug.is_member("U1")
\ No newline at end of file
+            ug.is_member("U1")
+    def test_member_list_is_fetched_once_per_ttl(self):
+        ug, mock_call = _make_usergroups(usergroup_id="S123")
+        mock_call.return_value = {"ok": True, "users": ["U1", "U2"]}
+        assert [ug.is_member(uid) for uid in ("U1", "U2", "U3")] == [True, True, False]
+        assert ug.get_members() == [{"value": "U1", "display": ""}, {"value": "U2", "display": ""}]
+        assert mock_call.call_count == 1
+
+    def test_are_members_checks_many_users_with_one_fetch(self):
+        ug, mock_call = _make_usergroups(usergroup_id="S123")
+        mock_call.return_value = {"ok": True, "users": ["U1", "U2"]}
+        assert ug.are_members(["U1", "U3"]) == {"U1": True, "U3": False}
+        assert ug.get_member_ids() == frozenset({"U1", "U2"})
+        assert mock_call.call_count == 1
+
+
+
+# ---------- caching ----------
+
+class TestUsergroupsCache:
+    def test_get_usergroups_is_cached(self):
+        ug, mock_call = _make_usergroups()
+        mock_call.return_value = {"ok": True, "usergroups": [{"id": "S1"}]}
+        assert ug.get_usergroups() == ug.get_usergroups() == [{"id": "S1"}]
+        assert mock_call.call_count == 1
+
+    def test_cache_is_shared_with_bound_instances(self):
+        ug, mock_call = _make_usergroups()
+        mock_call.return_value = {"ok": True, "users": ["U1"]}
+        ug.get_members("S123")
+        assert ug.with_usergroup("S123").is_member("U1") is True
+        assert mock_call.call_count == 1
+
+    def test_invalidate_forces_refetch(self):
+        ug, mock_call = _make_usergroups(usergroup_id="S123")
+        mock_call.return_value = {"ok": True, "users": ["U1"]}
+        assert ug.is_member("U2") is False
+
+        mock_call.return_value = {"ok": True, "users": ["U1", "U2"]}
+        ug.invalidate()
+        assert ug.is_member("U2") is True
+        assert mock_call.call_count == 2
+
+    def test_failed_response_is_not_cached(self):
+        ug, mock_call = _make_usergroups(usergroup_id="S123")
+        mock_call.return_value = {"ok": False, "error": "missing_scope"}
+        assert ug.get_members() == []
+        mock_call.return_value = {"ok": True, "users": ["U1"]}
+        assert ug.get_members() == [{"value": "U1", "display": ""}]
+
+
+# ---------- many usergroups ----------
+
+class TestMemberIdsMany:
+    def test_fetches_each_usergroup_once(self):
+        ug, mock_call = _make_usergroups()
+        mock_call.side_effect = lambda client, method, **kw: {"ok": True, "users": [f"U-{kw['usergroup']}"]}
+        result = ug.get_member_ids_many(["S1", "S2", "S1", ""])
+        assert result == {"S1": frozenset({"U-S1"}), "S2": frozenset({"U-S2"})}
+        assert mock_call.call_count == 2
+        assert ug.is_member("U-S2", usergroup_id="S2") is True
+        assert mock_call.call_count == 2
+
+    def test_async_variant_bounds_concurrency_and_shares_cache(self):
+        ug, mock_call = _make_usergroups()
+        mock_call.return_value = {"ok": True, "users": ["U1"]}
+        ug.get_members("S1")
+
+        in_flight, peak = 0, 0
+
+        class FakeAsyncApi:
+            async def call(self, client, method, *, rate_tier=None, **kwargs):
+                nonlocal in_flight, peak
+                in_flight += 1
+                peak = max(peak, in_flight)
+                await asyncio.sleep(0)
+                in_flight -= 1
+                return {"ok": True, "users": [f"U-{kwargs['usergroup']}"]}
+
+        ug.async_api, ug.async_client = FakeAsyncApi(), object()
+        result = asyncio.run(ug.aget_member_ids_many(["S1", "S2", "S3", "S4"], concurrency=2))
+        assert result["S1"] == frozenset({"U1"})  # served from the cache the sync call filled
+        assert result["S4"] == frozenset({"U-S4"})
+        assert peak == 2
+
+    def test_async_requires_async_api(self):
+        ug, _ = _make_usergroups()
+        with pytest.raises(ValueError, match="async_api"):
+            asyncio.run(ug.aget_member_ids_many(["S1"]))
@@ -1,3 +1,4 @@
+import json
 import logging
 from typing import Any, Dict, Optional
 from unittest.mock import MagicMock
@@ -8,6 +9,8 @@ from slack_sdk.errors import SlackApiError
 from slack_objects.client import SlackObjectsClient
 from slack_objects.config import SlackObjectsConfig, RateTier, USER_ID_RE
 from slack_objects.api_caller import SlackApiCaller
+from slack_objects.base import HTTP_POOL_MAXSIZE
+from slack_objects.users import Users
 from slack_objects.scim_base import ScimResponse
 
 
@@ -26,6 +29,16 @@ class FakeWebClient:
                 "deleted": user_id == "UDELETED",
             }}
 
+        if method == "users.list":
+            # 25 users over two pages
+            ids = [f"U{i:03d}" for i in range(25)]
+            page = ids[15:] if payload.get("cursor") == "page2" else ids[:15]
+            return {
+                "ok": True,
+                "members": [{"id": uid} for uid in page],
+                "response_metadata": {"next_cursor": "" if payload.get("cursor") else "page2"},
+            }
+
         if method == "users.lookupByEmail":
             if payload.get("email") == "found@example.com":
                 return {"ok": True, "user": {"id": "UFOUND"}}
@@ -36,7 +49,7 @@ class FakeWebClient:
 
 class FakeApiCaller(SlackApiCaller):
     def __init__(self, cfg):
-        self.cfg = cfg
+        super().__init__(cfg)
         self.policy = None
 
     def call(self, client, method: str, *, rate_tier=None, **kwargs):
@@ -88,12 +101,205 @@ def test_factory_users_unbound_and_bound():
     assert uid == "UFOUND"
 
 
+def test_factories_share_http_session():
+    """Helpers built by one client reuse its pooled HTTP session and SSL context."""
+    cfg = SlackObjectsConfig(bot_token="xoxb-fake", scim_token="xoxp-fake")
+    slack = SlackObjectsClient(cfg, logger=logging.getLogger("test"))
+
+    assert slack.users()._scim_http() is slack.http_session
+    assert slack.users("U123")._scim_http() is slack.http_session
+    assert slack.idp_groups().with_group("S2")._scim_http() is slack.http_session
+    assert slack.files().with_file("F2")._download_session() is slack.http_session
+    assert slack.idp_groups().ascim_session is None
+    slack.ascim_session = object()  # stands in for an aiohttp.ClientSession
+    assert slack.idp_groups("S1").ascim_session is slack.ascim_session
+    assert slack.idp_groups("S1").with_group("S2").ascim_session is slack.ascim_session
+    assert slack.usergroups("S1").with_usergroup("S2").cache is slack.cache
+    assert slack.web_client.ssl is slack.ssl_context
+    assert slack.http_session.get_adapter("https://api.slack.com")._pool_maxsize == HTTP_POOL_MAXSIZE
+
+    # Helpers built directly (no client) build nothing up front, then share the process-wide session.
+    direct = Users(cfg=cfg, client=slack.web_client, api=slack.api)
+    assert direct.scim_session is None
+    assert direct._scim_http() is Users(cfg=cfg, client=slack.web_client, api=slack.api)._scim_http()
+
+
+def test_factories_defer_http_session():
+    """Building helpers creates no session; the first HTTP call does."""
+    cfg = SlackObjectsConfig(bot_token="xoxb-fake", scim_token="xoxp-fake")
+    slack = SlackObjectsClient(cfg, logger=logging.getLogger("test"))
+
+    users = slack.users("U1")
+    files = slack.files("F1").with_file("F2")
+    slack.idp_groups("S1").with_group("S2")
+    assert slack._http_session is None
+
+    assert users._scim_http() is slack.http_session
+    assert files._download_session() is slack._http_session
+
+
+def test_factories_pass_resolved_rate_policy():
+    """Factory-built and re-bound helpers carry the client's policy instead of rebuilding one."""
+    cfg = SlackObjectsConfig(bot_token="xoxb-fake", default_rate_tier=RateTier.TIER_4)
+    slack = SlackObjectsClient(cfg, logger=logging.getLogger("test"))
+
+    users = slack.users()
+    assert users.rate_policy is slack.rate_policy
+    assert users.rate_policy.default is RateTier.TIER_4
+    assert users.with_user("U123").rate_policy is slack.rate_policy
+
+
 def test_get_user_id_from_email_miss_returns_empty():
     """get_user_id_from_email returns '' when the email is not found."""
     users = _make_users()
     assert users.get_user_id_from_email("nobody@example.com") == ""
 
 
+# ═══════════════════════════════════════════════════════════════════════════
+# get_users_info (bulk)
+# ═══════════════════════════════════════════════════════════════════════════
+
+class TestGetUsersInfo:
+    """Small batches use users.info; large ones page users.list once."""
+
+    def test_small_batch_uses_users_info(self):
+        users = _make_users()
+        users._users_list_members = MagicMock()
+        result = users.get_users_info(["U001", "U002", "U001"])
+        assert set(result) == {"U001", "U002"}
+        assert result["U001"]["profile"]["display_name"] == "Testy"
+        users._users_list_members.assert_not_called()
+
+    def test_large_batch_uses_users_list(self):
+        users = _make_users()
+        users._users_info = MagicMock(side_effect=AssertionError("users.info should not be called"))
+        ids = [f"U{i:03d}" for i in range(5, 25)]
+        result = users.get_users_info(ids)
+        assert set(result) == set(ids)
+        assert result["U020"] == {"id": "U020"}
+
+    def test_large_batch_falls_back_for_unlisted_ids(self):
+        users = _make_users()
+        ids = [f"U{i:03d}" for i in range(20)] + ["UOTHER"]
+        result = users.get_users_info(ids)
+        assert set(result) == set(ids)
+        assert result["UOTHER"]["id"] == "UOTHER"  # came from users.info
+
+
+class TestUsersInfoCache:
+    """users.info results are shared through the helper cache until a write drops them."""
+
+    def test_repeat_lookups_make_one_call(self):
+        users = _make_users()
+        users._users_info = MagicMock(wraps=users._users_info)
+        first = users.get_user_info("U001")
+        second = users.with_user("U001").refresh()
+        assert second == first["user"]
+        assert users.get_users_info(["U001"])["U001"]["id"] == "U001"
+        assert users._users_info.call_count == 1
+
+    def test_invalidate_forces_refetch(self):
+        users = _make_users()
+        users._users_info = MagicMock(wraps=users._users_info)
+        users.get_user_info("U001")
+        users.set_user_profile_field("Xf01", "new", user_id="U001")
+        users.get_user_info("U001")
+        users.invalidate("U001")
+        users.get_user_info("U001")
+        assert users._users_info.call_count == 3
+
+    def test_refresh_force_makes_a_new_call(self):
+        users = _make_users()
+        users._users_info = MagicMock(wraps=users._users_info)
+        bound = users.with_user("U001")
+        bound._users_info = users._users_info
+        bound.refresh()
+        bound.refresh()
+        assert users._users_info.call_count == 1
+        bound.refresh(force=True)
+        assert users._users_info.call_count == 2
+        users.get_user_info("U001")  # the forced result re-seeded the cache
+        assert users._users_info.call_count == 2
+
+    def test_users_info_skips_the_api_caller_cache(self):
+        """The helper cache is the only users.info copy; the API caller is told not to keep one."""
+        users = _make_users()
+        users.api.call = MagicMock(return_value={"ok": True, "user": {"id": "U001"}})
+        users.get_user_info("U001")
+        assert users.api.call.call_args.kwargs["cache"] is False
+
+    def test_failed_lookup_is_not_cached(self):
+        users = _make_users()
+        users._users_info = MagicMock(return_value={"ok": False, "error": "user_not_found"})
+        users.get_user_info("UMISSING")
+        users.get_user_info("UMISSING")
+        assert users._users_info.call_count == 2
+
+
+class TestEmailLookupCache:
+    """get_user_id_from_email caches hits (not misses) and seeds the users.info entry."""
+
+    def test_hit_is_cached_case_insensitively_and_seeds_user_info(self):
+        users = _make_users()
+        users._users_lookup_by_email = MagicMock(return_value={"ok": True, "user": {"id": "UFOUND", "profile": {"email": "found@example.com"}}})
+        users._users_info = MagicMock(side_effect=AssertionError("served from the seeded entry"))
+        assert users.get_user_id_from_email("found@example.com") == "UFOUND"
+        assert users.get_user_id_from_email(" Found@Example.com") == "UFOUND"
+        assert users.get_user_info("UFOUND")["user"]["id"] == "UFOUND"
+        assert users._users_lookup_by_email.call_count == 1
+
+        users.invalidate("UFOUND")
+        users.get_user_id_from_email("found@example.com")
+        assert users._users_lookup_by_email.call_count == 2
+
+    def test_invalidate_drops_email_entry_after_info_entry_is_gone(self):
+        users = _make_users()
+        users._users_lookup_by_email = MagicMock(return_value={"ok": True, "user": {"id": "UFOUND", "profile": {"email": "found@example.com"}}})
+        users.get_user_id_from_email("found@example.com")
+        users.cache.pop(("users.info", "UFOUND"))  # e.g. expired or evicted first
+        users.invalidate("UFOUND")
+        users.get_user_id_from_email("found@example.com")
+        assert users._users_lookup_by_email.call_count == 2
+
+    def test_miss_is_not_cached(self):
+        users = _make_users()
+        users._users_lookup_by_email = MagicMock(return_value={"ok": False, "error": "users_not_found"})
+        assert users.get_user_id_from_email("nobody@example.com") == ""
+        assert users.get_user_id_from_email("nobody@example.com") == ""
+        assert users._users_lookup_by_email.call_count == 2
+
+
+class TestBulkRemovals:
+    """remove_from_workspaces / remove_from_conversations fan out and report per ID."""
+
+    def test_remove_from_workspaces_reports_each_workspace(self):
+        users = _make_users()
+        users._admin_users_remove = MagicMock(side_effect=lambda user_id, team_id: {"ok": True, "team": team_id})
+        users.invalidate = MagicMock()
+        result = users.remove_from_workspaces("U001", ["T1", "T2", "T1", "T3"])
+        assert result == {t: {"ok": True, "team": t} for t in ("T1", "T2", "T3")}
+        assert users._admin_users_remove.call_count == 3
+        users.invalidate.assert_called_once_with("U001")
+
+    def test_remove_from_conversations_records_errors(self):
+        users = _make_users()
+
+        def kick(user_id, channel_id):
+            if channel_id == "CBAD":
+                raise SlackApiError("kick failed", MagicMock(data={"ok": False, "error": "not_in_channel"}))
+            return {"ok": True}
+
+        users._conversations_kick = MagicMock(side_effect=kick)
+        result = users.remove_from_conversations("U001", ["C1", "CBAD", "C2"], max_workers=2)
+        assert result["C1"] == result["C2"] == {"ok": True}
+        assert result["CBAD"] == {"ok": False, "error": "not_in_channel"}
+
+    def test_single_id_runs_inline(self):
+        users = _make_users()
+        users._conversations_kick = MagicMock(return_value={"ok": True})
+        assert users.remove_from_conversations("U001", ["C1"]) == {"C1": {"ok": True}}
+
+
 # ═══════════════════════════════════════════════════════════════════════════
 # USER_ID_RE
 # ═══════════════════════════════════════════════════════════════════════════
@@ -334,9 +540,9 @@ class TestIsUserAuthorized:
             {"my_service": ["G1"]},
         )
 
-        # Patch IDP_groups.is_member to return True
+        # Patch the user's group lookup (one SCIM call) to include G1
         from unittest.mock import patch
-        with patch("slack_objects.idp_groups.IDP_groups.is_member", return_value=True):
+        with patch("slack_objects.idp_groups.IDP_groups.get_user_group_ids", return_value=frozenset({"G0", "G1"})):
             assert bound.is_user_authorized("my_service", "read") is True
 
     def test_active_user_without_membership_returns_false(self):
@@ -352,9 +558,22 @@ class TestIsUserAuthorized:
         )
 
         from unittest.mock import patch
-        with patch("slack_objects.idp_groups.IDP_groups.is_member", return_value=False):
+        with patch("slack_objects.idp_groups.IDP_groups.get_user_group_ids", return_value=frozenset({"G2"})):
             assert bound.is_user_authorized("my_service", "read") is False
 
+    def test_many_groups_cost_one_lookup(self):
+        """The user's groups are read once and intersected with every group in the policy."""
+        users = _make_users()
+        bound = users.with_user("U1")
+        bound.attributes = {"id": "U1", "deleted": False}
+        object.__setattr__(bound.cfg, "auth_idp_groups_read_access", {"my_service": ["G1", "G2", "G3"]})
+
+        from unittest.mock import patch
+        with patch("slack_objects.idp_groups.IDP_groups.get_user_group_ids", return_value=frozenset({"G3"})) as lookup, \
+                patch("slack_objects.idp_groups.IDP_groups.is_member", side_effect=AssertionError("no per-group fetch")):
+            assert bound.is_user_authorized("my_service", "read") is True
+        lookup.assert_called_once_with("U1")
+
     def test_no_policy_returns_false(self):
         """No group_ids configured for the service → not authorized."""
         users = _make_users()
@@ -481,6 +700,49 @@ class TestIsActiveWithUserId:
         bound.get_user_info.assert_not_called()
 
 
+# ═══════════════════════════════════════════════════════════════════════════
+# Static SCIM PATCH bodies (reactivate / multi-channel guest)
+# ═══════════════════════════════════════════════════════════════════════════
+
+class TestStaticScimBodies:
+    """Fixed bodies are sent as JSON bytes encoded once at import."""
+
+    @pytest.mark.parametrize("version", ["v1", "v2"])
+    def test_bodies_are_shared_json_bytes(self, version):
+        users = _make_users()
+        object.__setattr__(users.cfg, "scim_version", version)
+        users._scim_request = MagicMock(return_value=ScimResponse(ok=True, status_code=200, data={}, text=""))
+
+        users.make_multi_channel_guest(user_id="U1")
+        users.make_multi_channel_guest(user_id="U2")
+        first, second = (c.kwargs["payload"] for c in users._scim_request.call_args_list)
+        assert isinstance(first, bytes) and first is second
+        assert "multi" in json.dumps(json.loads(first))
+
+        users.scim_reactivate_user(user_id="U1")
+        body = json.loads(users._scim_request.call_args.kwargs["payload"])
+        assert body.get("active") is True or body["Operations"][0]["value"] is True
+
+    def test_unknown_version_raises(self):
+        users = _make_users()
+        object.__setattr__(users.cfg, "scim_version", "v3")
+        with pytest.raises(NotImplementedError):
+            users.make_multi_channel_guest(user_id="U1")
+
+    def test_make_multi_channel_guest_always_patches(self):
+        users = _make_users()
+        users._scim_request = MagicMock(return_value=ScimResponse(ok=True, status_code=200, data={}, text=""))
+        users._remember_user("UMCG", {"id": "UMCG", "is_restricted": True, "is_ultra_restricted": False})
+        users.make_multi_channel_guest(user_id="UMCG")  # a cached record never short-circuits the write
+        users._scim_request.assert_called_once()
+
+    @pytest.mark.parametrize("restricted, ultra, expected", [(True, False, True), (True, True, False), (False, False, False)])
+    def test_is_multi_channel_guest(self, restricted, ultra, expected):
+        bound = _make_users().with_user("U1")
+        bound.attributes = {"id": "U1", "is_restricted": restricted, "is_ultra_restricted": ultra}
+        assert bound.is_multi_channel_guest() is expected
+
+
 # ═══════════════════════════════════════════════════════════════════════════
 # scim_update_email
 # ═══════════════════════════════════════════════════════════════════════════